@@ -0,0 +1,113 @@
+"""
+Manual smoke test for AzureOpenAIEmbeddingClient.
+
+Exercises certificate and API key authentication, async and single-text
+embedding against a real Azure OpenAI deployment. Set AZURE_OPENAI_API_KEY,
+AZURE_OPENAI_ENDPOINT and optionally AZURE_OPENAI_EMBEDDING_MODEL to include
+the API key variant.
+"""
+
+import asyncio
+import os
+
+from contramate.llm.azure_openai_embedding_client import AzureOpenAIEmbeddingClient
+from contramate.utils.settings.factory import SettingsFactory
+
+
+async def main():
+    """
+    Test Azure OpenAI embedding client with different authentication methods.
+    Set environment variables to test each method.
+    """
+    test_texts = [
+        "This is a test sentence for Azure OpenAI embedding.",
+        "Another test sentence to embed with Azure."
+    ]
+
+    print("=" * 60)
+    print("Testing Azure OpenAI Embedding Client")
+    print("=" * 60)
+
+    # Method 1: Using AOAICertSettings (highest priority)
+    try:
+        print("\n1. Testing with AOAICertSettings (certificate-based)...")
+        settings = SettingsFactory.create_azure_openai_settings()
+        client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
+
+        response = client.create_embeddings(test_texts)
+        print(f"✓ Certificate auth: {len(response.data)} embeddings created")
+        print(f"  Model: {response.model}")
+        print(f"  Dimensions: {len(response.data[0].embedding)}")
+        print(f"  Usage: {response.usage.total_tokens} tokens")
+    except Exception as e:
+        print(f"✗ Certificate auth failed: {e}")
+
+    # Method 2: Using API key
+    try:
+        print("\n2. Testing with API key authentication...")
+        api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+        embedding_model = os.getenv("AZURE_OPENAI_EMBEDDING_MODEL", "text-embedding-ada-002")
+
+        if api_key and endpoint:
+            client = AzureOpenAIEmbeddingClient(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                embedding_model=embedding_model
+            )
+
+            response = client.create_embeddings(test_texts)
+            print(f"✓ API key auth: {len(response.data)} embeddings created")
+            print(f"  Model: {response.model}")
+            print(f"  Dimensions: {len(response.data[0].embedding)}")
+        else:
+            print("✗ API key auth skipped: Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT")
+    except Exception as e:
+        print(f"✗ API key auth failed: {e}")
+
+    # Test async completion
+    try:
+        print("\n3. Testing async embedding creation...")
+        settings = SettingsFactory.create_azure_openai_settings()
+        client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
+
+        async_response = await client.async_create_embeddings(test_texts)
+        print(f"✓ Async embeddings: {len(async_response.data)} embeddings created")
+    except Exception as e:
+        print(f"✗ Async embeddings failed: {e}")
+
+    # Test single string
+    try:
+        print("\n4. Testing single string embedding...")
+        settings = SettingsFactory.create_azure_openai_settings()
+        client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
+
+        single_response = client.create_embeddings("Single test sentence for Azure.")
+        print(f"✓ Single string: {len(single_response.data)} embedding created")
+    except Exception as e:
+        print(f"✗ Single string failed: {e}")
+
+    # Test batch embeddings
+    try:
+        print("\n5. Testing batch embeddings...")
+        settings = SettingsFactory.create_azure_openai_settings()
+        client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
+
+        batches = [
+            ["First batch sentence 1", "First batch sentence 2"],
+            ["Second batch sentence 1", "Second batch sentence 2"]
+        ]
+        batch_responses = client.create_batch_embeddings(batches)
+        print(f"✓ Batch embeddings: {len(batch_responses)} batches processed")
+        for i, batch_resp in enumerate(batch_responses):
+            print(f"  Batch {i + 1}: {len(batch_resp.data)} embeddings")
+    except Exception as e:
+        print(f"✗ Batch embeddings failed: {e}")
+
+    print("\n" + "=" * 60)
+    print("Testing complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
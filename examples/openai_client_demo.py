@@ -0,0 +1,48 @@
+"""
+Manual smoke test for OpenAIChatClient.
+
+Runs sync, async and chat() completions against the OpenAI API configured
+in the environment (OPENAI_API_KEY, OPENAI_MODEL).
+"""
+
+import asyncio
+
+from contramate.llm.openai_client import OpenAIChatClient
+
+
+async def test_client():
+    """Test OpenAI chat client with native response objects"""
+    client = OpenAIChatClient()
+
+    test_messages = [
+        {"role": "user", "content": "Hello, this is a test message."}
+    ]
+
+    print("=" * 60)
+    print("Testing OpenAI Chat Client")
+    print("=" * 60)
+
+    # Test sync
+    print("\n1. Testing sync completion...")
+    response = client.chat_completion(test_messages)
+    print(f"✓ Sync response: {response.choices[0].message.content[:100]}...")
+    print(f"  Model: {response.model}")
+    print(f"  Usage: {response.usage.total_tokens} tokens")
+
+    # Test async
+    print("\n2. Testing async completion...")
+    async_response = await client.async_chat_completion(test_messages)
+    print(f"✓ Async response: {async_response.choices[0].message.content[:100]}...")
+
+    # Test backward compatible chat method
+    print("\n3. Testing backward compatible chat() method...")
+    chat_response = client.chat(test_messages)
+    print(f"✓ Chat response: {chat_response[:100]}...")
+
+    print("\n" + "=" * 60)
+    print("Testing complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(test_client())
@@ -0,0 +1,52 @@
+"""
+Manual smoke test for OpenAIEmbeddingClient.
+
+Creates sync, async and single-string embeddings against the OpenAI API
+configured in the environment (OPENAI_API_KEY, OPENAI_EMBEDDING_MODEL).
+"""
+
+import asyncio
+
+from contramate.llm.openai_embedding_client import OpenAIEmbeddingClient
+
+
+async def test_embedding_client():
+    """Test OpenAI embedding client with native response objects"""
+    client = OpenAIEmbeddingClient()
+
+    test_texts = [
+        "This is a test sentence for embedding.",
+        "Another test sentence to embed."
+    ]
+
+    print("=" * 60)
+    print("Testing OpenAI Embedding Client")
+    print("=" * 60)
+
+    # Test sync
+    print("\n1. Testing sync embedding creation...")
+    response = client.create_embeddings(test_texts)
+    print(f"✓ Sync embeddings: {len(response.data)} embeddings created")
+    print(f"  Model: {response.model}")
+    print(f"  Dimensions: {len(response.data[0].embedding)}")
+    print(f"  Usage: {response.usage.total_tokens} tokens")
+
+    # Test async
+    print("\n2. Testing async embedding creation...")
+    async_response = await client.async_create_embeddings(test_texts)
+    print(f"✓ Async embeddings: {len(async_response.data)} embeddings created")
+    print(f"  Dimensions: {len(async_response.data[0].embedding)}")
+
+    # Test single string
+    print("\n3. Testing single string embedding...")
+    single_response = client.create_embeddings("Single test sentence.")
+    print(f"✓ Single embedding: {len(single_response.data)} embedding created")
+    print(f"  Dimensions: {len(single_response.data[0].embedding)}")
+
+    print("\n" + "=" * 60)
+    print("Testing complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(test_embedding_client())
@@ -61,7 +61,7 @@ async def chat(
         ```
     """
     try:
-        logger.info(f"Received chat query: {request.query[:100]}...")
+        logger.info("Received chat query: {}...", request.query[:100])
 
         result = await service.query(
             user_query=request.query,
@@ -74,7 +74,7 @@ async def chat(
             return result.unwrap()
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error processing query"),
@@ -83,7 +83,7 @@ async def chat(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing chat query: {e}", exc_info=True)
+        logger.exception("Error processing chat query: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing query: {str(e)}",
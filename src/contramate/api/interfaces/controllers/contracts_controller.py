@@ -75,7 +75,7 @@ async def get_documents(
         GET /api/contracts/documents?limit=10&contract_type=Affiliate_Agreements
     """
     try:
-        logger.info(f"Fetching documents (limit={limit}, contract_type={contract_type}, project_id={project_id})")
+        logger.info("Fetching documents (limit={}, contract_type={}, project_id={})", limit, contract_type, project_id)
 
         result = service.get_all_documents(
             limit=limit,
@@ -91,7 +91,7 @@ async def get_documents(
             )
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error fetching documents")
@@ -100,7 +100,7 @@ async def get_documents(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching documents: {e}", exc_info=True)
+        logger.exception("Error fetching documents: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching documents: {str(e)}"
@@ -128,7 +128,7 @@ async def get_document_by_id(
         GET /api/contracts/documents/00149794-2432-4c18-b491-73d0fafd3efd/577ff0a3-a032-5e23-bde3-0b6179e97949
     """
     try:
-        logger.info(f"Fetching document: project_id={project_id}, reference_doc_id={reference_doc_id}")
+        logger.info("Fetching document: project_id={}, reference_doc_id={}", project_id, reference_doc_id)
 
         result = service.get_document_by_id(
             project_id=project_id,
@@ -147,7 +147,7 @@ async def get_document_by_id(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching document: {e}", exc_info=True)
+        logger.exception("Error fetching document: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching document: {str(e)}"
@@ -180,7 +180,7 @@ async def get_contract_types(
             )
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error fetching contract types")
@@ -189,7 +189,7 @@ async def get_contract_types(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching contract types: {e}", exc_info=True)
+        logger.exception("Error fetching contract types: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching contract types: {str(e)}"
@@ -222,7 +222,7 @@ async def get_project_ids(
             )
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error fetching project IDs")
@@ -231,7 +231,7 @@ async def get_project_ids(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching project IDs: {e}", exc_info=True)
+        logger.exception("Error fetching project IDs: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching project IDs: {str(e)}"
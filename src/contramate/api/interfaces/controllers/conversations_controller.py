@@ -1,10 +1,15 @@
 """Conversations controller for conversation management endpoints."""
 
-from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Body
+import json
+import time
+import anyio
+from typing import AsyncIterator, Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Body, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from contramate.llm import OpenAIChatClient
 from contramate.services.postgres_conversation_service import PostgresConversationService
 
 
@@ -65,6 +70,13 @@ def get_conversation_service() -> PostgresConversationService:
     return PostgresConversationService.create_default()
 
 
+def get_chat_client(request: Request) -> OpenAIChatClient:
+    """Get OpenAIChatClient instance for streamed responses"""
+    return OpenAIChatClient(
+        async_http_client=getattr(request.app.state, "openai_http_client", None)
+    )
+
+
 # Endpoints
 @router.post("/", response_model=ConversationResponse)
 async def create_conversation(
@@ -99,7 +111,7 @@ async def create_conversation(
         ```
     """
     try:
-        logger.info(f"Creating conversation for user: {request.user_id}")
+        logger.info("Creating conversation for user: {}", request.user_id)
 
         result = await service.create_conversation(
             user_id=request.user_id,
@@ -111,7 +123,7 @@ async def create_conversation(
             return result.unwrap()
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error creating conversation")
@@ -120,7 +132,7 @@ async def create_conversation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating conversation: {e}", exc_info=True)
+        logger.exception("Error creating conversation: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error creating conversation: {str(e)}"
@@ -148,7 +160,7 @@ async def get_conversations(
         GET /api/conversations/user123?limit=20
     """
     try:
-        logger.info(f"Fetching conversations for user: {user_id}")
+        logger.info("Fetching conversations for user: {}", user_id)
 
         result = await service.get_conversations(
             user_id=user_id,
@@ -156,14 +168,16 @@ async def get_conversations(
         )
 
         if result.is_ok():
+            # Service output already matches ConversationListResponse; returning a
+            # Response directly skips FastAPI's re-validation and re-encoding pass.
             conversations = result.unwrap()
-            return ConversationListResponse(
-                conversations=conversations,
-                count=len(conversations)
-            )
+            return JSONResponse({
+                "conversations": conversations,
+                "count": len(conversations)
+            })
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error fetching conversations")
@@ -172,7 +186,7 @@ async def get_conversations(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching conversations: {e}", exc_info=True)
+        logger.exception("Error fetching conversations: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching conversations: {str(e)}"
@@ -200,7 +214,7 @@ async def get_conversation(
         GET /api/conversations/user123/conv456
     """
     try:
-        logger.info(f"Fetching conversation: {conversation_id} for user: {user_id}")
+        logger.info("Fetching conversation: {} for user: {}", conversation_id, user_id)
 
         result = await service.get_conversation_by_id(
             user_id=user_id,
@@ -208,7 +222,7 @@ async def get_conversation(
         )
 
         if result.is_ok():
-            return result.unwrap()
+            return JSONResponse(result.unwrap())
         else:
             error_details = result.unwrap_err()
             if "not found" in error_details.get("error", "").lower():
@@ -219,7 +233,7 @@ async def get_conversation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching conversation: {e}", exc_info=True)
+        logger.exception("Error fetching conversation: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching conversation: {str(e)}"
@@ -264,7 +278,7 @@ async def update_conversation_filters(
         ```
     """
     try:
-        logger.info(f"Updating filters for conversation: {conversation_id}")
+        logger.info("Updating filters for conversation: {}", conversation_id)
 
         result = await service.update_conversation_filters(
             user_id=user_id,
@@ -276,7 +290,7 @@ async def update_conversation_filters(
             return {"success": True, "message": "Filters updated successfully"}
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error updating filters")
@@ -285,7 +299,7 @@ async def update_conversation_filters(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating filters: {e}", exc_info=True)
+        logger.exception("Error updating filters: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error updating filters: {str(e)}"
@@ -315,7 +329,7 @@ async def get_messages(
         GET /api/conversations/user123/conv456/messages?limit=100
     """
     try:
-        logger.info(f"Fetching messages for conversation: {conversation_id}")
+        logger.info("Fetching messages for conversation: {}", conversation_id)
 
         result = await service.get_messages(
             user_id=user_id,
@@ -324,14 +338,15 @@ async def get_messages(
         )
 
         if result.is_ok():
+            # Service output already matches MessageListResponse (see get_conversations)
             messages = result.unwrap()
-            return MessageListResponse(
-                messages=messages,
-                count=len(messages)
-            )
+            return JSONResponse({
+                "messages": messages,
+                "count": len(messages)
+            })
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error fetching messages")
@@ -340,7 +355,7 @@ async def get_messages(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching messages: {e}", exc_info=True)
+        logger.exception("Error fetching messages: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching messages: {str(e)}"
@@ -368,7 +383,7 @@ async def delete_conversation(
         DELETE /api/conversations/user123/conv456
     """
     try:
-        logger.info(f"Deleting conversation: {conversation_id}")
+        logger.info("Deleting conversation: {}", conversation_id)
 
         result = await service.delete_conversation(
             user_id=user_id,
@@ -379,7 +394,7 @@ async def delete_conversation(
             return {"success": True, "message": "Conversation deleted successfully"}
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error deleting conversation")
@@ -388,7 +403,7 @@ async def delete_conversation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting conversation: {e}", exc_info=True)
+        logger.exception("Error deleting conversation: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error deleting conversation: {str(e)}"
@@ -432,7 +447,7 @@ async def add_message(
         ```
     """
     try:
-        logger.info(f"Adding {request.role} message to conversation {conversation_id}")
+        logger.info("Adding {} message to conversation {}", request.role, conversation_id)
 
         if request.role == "user":
             result = await service.add_user_message(
@@ -460,7 +475,7 @@ async def add_message(
             return result.unwrap()
         else:
             error_details = result.unwrap_err()
-            logger.error(f"Service returned error: {error_details}")
+            logger.error("Service returned error: {}", error_details)
             raise HTTPException(
                 status_code=500,
                 detail=error_details.get("message", "Error adding message")
@@ -469,8 +484,125 @@ async def add_message(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error adding message: {e}", exc_info=True)
+        logger.exception("Error adding message: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error adding message: {str(e)}"
         )
+
+
+class StreamMessageRequest(BaseModel):
+    """Request model for sending a user message and streaming the reply"""
+    content: str = Field(..., min_length=1, description="User message content")
+    history_limit: int = Field(50, ge=1, description="Maximum number of prior messages sent as context")
+
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Encode a payload as a server-sent event frame"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+@router.post("/{user_id}/{conversation_id}/messages/stream")
+async def stream_message(
+    user_id: str,
+    conversation_id: str,
+    request: StreamMessageRequest,
+    service: PostgresConversationService = Depends(get_conversation_service),
+    chat_client: OpenAIChatClient = Depends(get_chat_client)
+):
+    """
+    Add a user message and stream the assistant reply as server-sent events.
+
+    This is plain chat over the conversation history: the reply comes straight
+    from the chat model, without the talk-to-contract system prompt or document
+    retrieval. Use the talk-to-contract endpoints for grounded answers.
+
+    Each generated chunk is sent as a ``data: {"delta": ...}`` event. Once the
+    stream ends, the accumulated reply is persisted as an assistant message and
+    announced with a final ``done`` event carrying the stored message.
+
+    Args:
+        user_id: User identifier
+        conversation_id: Conversation identifier
+        request: User message and history window
+        service: ConversationService instance
+        chat_client: Chat client used to generate the reply
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+
+    Example:
+        ```json
+        {
+            "content": "Summarise the termination clause",
+            "history_limit": 20
+        }
+        ```
+    """
+    logger.info("Streaming reply for conversation {}", conversation_id)
+
+    history_result = await service.get_messages(
+        user_id=user_id,
+        conversation_id=conversation_id,
+        limit=request.history_limit,
+        newest_first=True
+    )
+    if history_result.is_err():
+        error_details = history_result.unwrap_err()
+        logger.error("Service returned error: {}", error_details)
+        raise HTTPException(
+            status_code=500,
+            detail=error_details.get("message", "Error fetching messages")
+        )
+
+    user_result = await service.add_user_message(
+        user_id=user_id,
+        conversation_id=conversation_id,
+        content=request.content
+    )
+    if user_result.is_err():
+        error_details = user_result.unwrap_err()
+        logger.error("Service returned error: {}", error_details)
+        raise HTTPException(
+            status_code=500,
+            detail=error_details.get("message", "Error adding message")
+        )
+
+    messages = [
+        {"role": msg["role"], "content": msg["content"]}
+        for msg in history_result.unwrap()
+        if msg["role"] in ("user", "assistant")
+    ]
+    messages.append({"role": "user", "content": request.content})
+
+    async def event_stream() -> AsyncIterator[str]:
+        chunks: List[str] = []
+        started = time.perf_counter()
+        saved = None
+        try:
+            async for delta in chat_client.async_stream_chat_completion(messages):
+                chunks.append(delta)
+                yield _sse_event({"delta": delta})
+        except Exception as e:
+            logger.exception("Error streaming reply: {}", e)
+            yield _sse_event({"message": str(e)}, event="error")
+        finally:
+            # Persist whatever was generated, even if the client disconnected;
+            # the shield keeps Starlette's cancellation from aborting the save
+            if chunks:
+                with anyio.CancelScope(shield=True):
+                    saved = await service.add_assistant_response(
+                        user_id=user_id,
+                        conversation_id=conversation_id,
+                        content="".join(chunks),
+                        metadata={"response_time": f"{time.perf_counter() - started:.2f}"}
+                    )
+
+        if saved is not None:
+            if saved.is_ok():
+                yield _sse_event(saved.unwrap(), event="done")
+            else:
+                logger.error("Service returned error: {}", saved.unwrap_err())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
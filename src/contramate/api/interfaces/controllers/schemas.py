@@ -1,6 +1,6 @@
 """Request and response schemas for chat API"""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -29,7 +29,7 @@ class SendMessageRequest(BaseModel):
 class UpdateMessageFeedbackRequest(BaseModel):
     """Request model for updating message feedback"""
 
-    feedback: str = Field(..., description="Feedback type (LIKE or DISLIKE)")
+    feedback: Literal["LIKE", "DISLIKE"] = Field(..., description="Feedback type (LIKE or DISLIKE)")
 
 
 class UpdateConversationTitleRequest(BaseModel):
@@ -92,7 +92,7 @@ class ChatResponse(BaseModel):
 
     conversation_id: str
     user_message: MessageResponse
-    assistant_message: MessageResponse
+    assistant_message: Optional[MessageResponse] = None
     timestamp: str
 
 
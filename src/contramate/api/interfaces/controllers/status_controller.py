@@ -1,6 +1,6 @@
 """Status controller for service health checks."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 
 from contramate.services.postgres_status_service import PostgresService
@@ -23,9 +23,11 @@ def get_opensearch_service() -> OpenSearchStatusService:
     return OpenSearchStatusService()
 
 
-def get_openai_service() -> OpenAIStatusService:
+def get_openai_service(request: Request) -> OpenAIStatusService:
     """Get OpenAI status service instance."""
-    openai_client = OpenAIChatClient()
+    openai_client = OpenAIChatClient(
+        async_http_client=getattr(request.app.state, "openai_http_client", None)
+    )
     return OpenAIStatusService(client=openai_client)
 
 
@@ -1,6 +1,6 @@
 """Chat presenter for formatting chat responses"""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from contramate.domain.entities.conversation import Conversation
@@ -30,8 +30,8 @@ class ChatPresenter:
             "conversation_id": message.conversation_id,
             "role": message.role.value,
             "content": message.content,
-            "created_at": message.created_at.isoformat(),
-            "updated_at": message.updated_at.isoformat(),
+            "created_at": message.created_at_iso,
+            "updated_at": message.updated_at_iso,
             "feedback": message.feedback,
             "tool_calls": message.tool_calls,
             "tool_call_id": message.tool_call_id,
@@ -106,14 +106,18 @@ class ChatPresenter:
 
     @staticmethod
     def format_chat_response(
-        user_message: Message, assistant_message: Message
+        user_message: Message,
+        assistant_message: Optional[Message] = None,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
         Format a complete chat interaction (user message + AI response).
 
         Args:
             user_message: User's message entity
-            assistant_message: Assistant's response entity
+            assistant_message: Assistant's response entity, or None when no
+                AI response was requested
+            now: Response timestamp (defaults to the current UTC time)
 
         Returns:
             Dict with both messages and metadata
@@ -121,18 +125,25 @@ class ChatPresenter:
         return {
             "conversation_id": user_message.conversation_id,
             "user_message": ChatPresenter.format_message(user_message),
-            "assistant_message": ChatPresenter.format_message(assistant_message),
-            "timestamp": datetime.utcnow().isoformat(),
+            "assistant_message": (
+                ChatPresenter.format_message(assistant_message)
+                if assistant_message is not None
+                else None
+            ),
+            "timestamp": (now or datetime.utcnow()).isoformat(),
         }
 
     @staticmethod
-    def format_error(error_message: str, status_code: int = 400) -> Dict[str, Any]:
+    def format_error(
+        error_message: str, status_code: int = 400, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Format an error response.
 
         Args:
             error_message: Error message to return
             status_code: HTTP status code
+            now: Response timestamp (defaults to the current UTC time)
 
         Returns:
             Dict with error details
@@ -140,12 +151,15 @@ class ChatPresenter:
         return {
             "error": error_message,
             "status_code": status_code,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": (now or datetime.utcnow()).isoformat(),
         }
 
     @staticmethod
     def format_success(
-        message: str, data: Any = None, status_code: int = 200
+        message: str,
+        data: Any = None,
+        status_code: int = 200,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
         Format a success response.
@@ -154,6 +168,7 @@ class ChatPresenter:
             message: Success message
             data: Optional data payload
             status_code: HTTP status code
+            now: Response timestamp (defaults to the current UTC time)
 
         Returns:
             Dict with success details
@@ -161,7 +176,7 @@ class ChatPresenter:
         response = {
             "message": message,
             "status_code": status_code,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": (now or datetime.utcnow()).isoformat(),
         }
 
         if data is not None:
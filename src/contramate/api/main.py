@@ -1,19 +1,50 @@
 """Main FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
+from openai import DefaultAsyncHttpxClient
 
 from contramate.api.interfaces.controllers.root_controller import router as root_router
 from contramate.api.interfaces.controllers.chat_controller import router as chat_router
 from contramate.api.interfaces.controllers.status_controller import router as status_router
 from contramate.api.interfaces.controllers.contracts_controller import router as contracts_router
 from contramate.api.interfaces.controllers.conversations_controller import router as conversations_router
+from contramate.llm.factory import ashutdown_llm_factory, aprewarm_client
+from contramate.llm.openai_client import OpenAIChatClient
+from contramate.utils.settings.factory import settings_factory
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create process-wide resources on startup and release them on shutdown."""
+    # One pooled connection set to the OpenAI API shared by every request,
+    # instead of a fresh TCP + TLS handshake per OpenAIChatClient instance.
+    app.state.openai_http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    # Opt-in (APP_LLM_PREWARM): open the first pooled connection before serving traffic
+    if settings_factory.create_app_settings().llm_prewarm:
+        try:
+            await aprewarm_client(OpenAIChatClient(async_http_client=app.state.openai_http_client))
+        except ValueError as e:
+            logger.warning("Skipping OpenAI pre-warm: {}", e)
+    try:
+        yield
+    finally:
+        await app.state.openai_http_client.aclose()
+        # Pools of clients created through the LLM factories
+        await ashutdown_llm_factory()
 
 
 app = FastAPI(
     title="Contramate API",
     description="A Conversational AI Agent Application for Contract Understanding using CUAD Dataset",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -25,6 +56,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 # Register routers
 app.include_router(root_router)
 app.include_router(chat_router)
@@ -179,6 +179,7 @@ def chat(
 
     Use the --client option to choose between litellm (default), openai, or azure_openai.
     """
+    factory: Optional[LLMClientFactory] = None
     try:
         # Validate client type
         if client_type not in ["litellm", "openai", "azure_openai"]:
@@ -257,6 +258,9 @@ def chat(
         logger.error(f"Failed to initialize chat: {e}")
         console.print(f"[red]Failed to initialize chat: {str(e)}[/red]")
         raise typer.Exit(1)
+    finally:
+        if factory is not None:
+            factory.close()
 
 
 @app.command()
@@ -244,7 +244,11 @@ class PostgreSQLConversationAdapter(AbstractConversationRepository):
             }
 
     def get_messages(
-        self, user_id: str, conversation_id: str, limit: int = 50
+        self,
+        user_id: str,
+        conversation_id: str,
+        limit: int = 50,
+        newest_first: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Get all messages for a conversation, ordered by created_at ascending.
@@ -253,6 +257,8 @@ class PostgreSQLConversationAdapter(AbstractConversationRepository):
             user_id: User identifier
             conversation_id: Conversation UUID string
             limit: Maximum number of messages to return
+            newest_first: Apply the limit to the most recent messages instead
+                of the oldest ones (the result is still ascending)
 
         Returns:
             List of message dictionaries
@@ -264,11 +270,15 @@ class PostgreSQLConversationAdapter(AbstractConversationRepository):
                     Message.conversation_id == UUID(conversation_id),
                     Message.user_id == user_id
                 )
-                .order_by(Message.created_at.asc())
+                .order_by(
+                    Message.created_at.desc() if newest_first else Message.created_at.asc()
+                )
                 .limit(limit)
             )
             result = session.execute(statement)
             messages = result.scalars().all()
+            if newest_first:
+                messages = list(reversed(messages))
 
             logger.info(f"Retrieved {len(messages)} messages for conversation {conversation_id}")
 
@@ -565,11 +575,15 @@ class PostgreSQLConversationAdapter(AbstractConversationRepository):
             statement = (
                 select(Message)
                 .where(Message.conversation_id == UUID(conversation_id))
-                .order_by(Message.created_at.asc())
+                .order_by(
+                    Message.created_at.desc() if newest_first else Message.created_at.asc()
+                )
                 .limit(limit)
             )
             result = session.execute(statement)
             messages = result.scalars().all()
+            if newest_first:
+                messages = list(reversed(messages))
 
             return [
                 {
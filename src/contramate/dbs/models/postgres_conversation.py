@@ -8,6 +8,7 @@ Uses SQLModel (SQLAlchemy + Pydantic) for type-safe database operations.
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Column, JSON, Text
 from contramate.dbs.models.conversation import FeedbackType
 
@@ -30,6 +31,10 @@ class Conversation(ConversationBase, table=True):
     One conversation can have many messages.
     """
     __tablename__ = "conversations"
+    # Serves "latest conversations for a user" as a single index range scan
+    __table_args__ = (
+        Index("ix_conversations_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -23,6 +23,9 @@ class Conversation(BaseModel):
     status: ConversationStatus = ConversationStatus.ACTIVE
     filter_values: Optional[Dict[str, Any]] = None
     messages: List[Message] = []
+    # Count stored with the conversation item, when it carries one, so listings
+    # don't need the messages loaded; otherwise the loaded messages are counted
+    message_count: Optional[int] = None
 
     class Config:
         use_enum_values = True
@@ -41,10 +44,14 @@ class Conversation(BaseModel):
             raise ValueError("Message conversation_id does not match")
 
         self.messages.append(message)
+        if self.message_count is not None:
+            self.message_count += 1
 
     def get_message_count(self) -> int:
         """Get total number of messages"""
-        return len(self.messages)
+        if self.message_count is None:
+            return len(self.messages)
+        return max(self.message_count, len(self.messages))
 
     def get_messages_for_llm(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -114,6 +121,8 @@ class Conversation(BaseModel):
         # Extract conversation_id from sort key (CONV#conversation_id)
         conversation_id = item["sk"].split("#")[1]
 
+        message_count = item.get("message_count")
+
         # Determine status from is_active field if present
         is_active = item.get("is_active", True)
         status = ConversationStatus.ACTIVE if is_active else ConversationStatus.ARCHIVED
@@ -127,6 +136,7 @@ class Conversation(BaseModel):
             status=status,
             filter_values=item.get("filter_value"),
             messages=messages or [],
+            message_count=int(message_count) if message_count is not None else None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,6 +1,7 @@
 """Message domain entity"""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
@@ -32,6 +33,16 @@ class Message(BaseModel):
     class Config:
         use_enum_values = True
 
+    @cached_property
+    def created_at_iso(self) -> str:
+        """ISO-8601 form of created_at, formatted once per instance"""
+        return self.created_at.isoformat()
+
+    @cached_property
+    def updated_at_iso(self) -> str:
+        """ISO-8601 form of updated_at, formatted once per instance"""
+        return self.updated_at.isoformat()
+
     def to_openai_format(self) -> Dict[str, Any]:
         """
         Convert to OpenAI chat completion message format.
@@ -1,38 +1,111 @@
-"""AI Clients for chat completions and embeddings with sync and async support"""
-
-from contramate.llm.base import BaseClient, BaseChatClient, BaseEmbeddingClient, ChatMessage
-from contramate.llm.openai_client import OpenAIChatClient
-from contramate.llm.openai_embedding_client import OpenAIEmbeddingClient
-from contramate.llm.azure_openai_client import AzureOpenAIChatClient
-from contramate.llm.azure_openai_embedding_client import AzureOpenAIEmbeddingClient
-from contramate.llm.factory import (
-    LLMClientFactory,
-    LLMVanillaClientFactory,
-    create_default_chat_client,
-    create_default_embedding_client,
-    create_vanilla_chat_client,
-    create_vanilla_embedding_client,
-    get_vanilla_openai_client,
-    get_vanilla_azure_openai_client,
-    get_vanilla_native_clients,
+"""AI Clients for chat completions and embeddings with sync and async support
+
+Provider clients and factories are imported lazily (PEP 562) so that importing
+``contramate.llm`` only loads the modules that are actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from contramate.llm.base import (
+    BaseClient,
+    BaseChatClient,
+    BaseEmbeddingClient,
+    ChatMessage,
+    MessageDict,
+    MessageInput,
 )
 
+if TYPE_CHECKING:
+    from contramate.llm.openai_client import OpenAIChatClient
+    from contramate.llm.openai_embedding_client import OpenAIEmbeddingClient
+    from contramate.llm.azure_openai_client import AzureOpenAIChatClient
+    from contramate.llm.azure_openai_embedding_client import AzureOpenAIEmbeddingClient
+    from contramate.llm.embedding_batcher import EmbeddingBatcher
+    from contramate.llm.batch_api import BatchJob
+    from contramate.llm.caching_client import CachingChatClient
+    from contramate.llm.http_clients import configure_http_pool
+    from contramate.llm.factory import (
+        LLMClientFactory,
+        LLMVanillaClientFactory,
+        create_default_chat_client,
+        create_default_embedding_client,
+        create_vanilla_chat_client,
+        create_vanilla_embedding_client,
+        create_batched_embedding_client,
+        get_vanilla_openai_client,
+        get_vanilla_azure_openai_client,
+        get_vanilla_native_clients,
+        get_vanilla_native_clients_async,
+        shutdown_llm_factory,
+        ashutdown_llm_factory,
+    )
+
+_LAZY = {
+    "OpenAIChatClient": "contramate.llm.openai_client",
+    "OpenAIEmbeddingClient": "contramate.llm.openai_embedding_client",
+    "AzureOpenAIChatClient": "contramate.llm.azure_openai_client",
+    "AzureOpenAIEmbeddingClient": "contramate.llm.azure_openai_embedding_client",
+    "EmbeddingBatcher": "contramate.llm.embedding_batcher",
+    "BatchJob": "contramate.llm.batch_api",
+    "CachingChatClient": "contramate.llm.caching_client",
+    "configure_http_pool": "contramate.llm.http_clients",
+    "LLMClientFactory": "contramate.llm.factory",
+    "LLMVanillaClientFactory": "contramate.llm.factory",
+    "create_default_chat_client": "contramate.llm.factory",
+    "create_default_embedding_client": "contramate.llm.factory",
+    "create_vanilla_chat_client": "contramate.llm.factory",
+    "create_vanilla_embedding_client": "contramate.llm.factory",
+    "create_batched_embedding_client": "contramate.llm.factory",
+    "get_vanilla_openai_client": "contramate.llm.factory",
+    "get_vanilla_azure_openai_client": "contramate.llm.factory",
+    "get_vanilla_native_clients": "contramate.llm.factory",
+    "get_vanilla_native_clients_async": "contramate.llm.factory",
+    "shutdown_llm_factory": "contramate.llm.factory",
+    "ashutdown_llm_factory": "contramate.llm.factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module providing ``name`` on first access and cache the attribute"""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "BaseClient",
     "BaseChatClient",
     "BaseEmbeddingClient",
     "ChatMessage",
+    "MessageDict",
+    "MessageInput",
     "OpenAIChatClient",
     "OpenAIEmbeddingClient",
     "AzureOpenAIChatClient",
     "AzureOpenAIEmbeddingClient",
+    "EmbeddingBatcher",
+    "BatchJob",
+    "CachingChatClient",
+    "configure_http_pool",
     "LLMClientFactory",
     "LLMVanillaClientFactory",
     "create_default_chat_client",
     "create_default_embedding_client",
     "create_vanilla_chat_client",
     "create_vanilla_embedding_client",
+    "create_batched_embedding_client",
     "get_vanilla_openai_client",
     "get_vanilla_azure_openai_client",
     "get_vanilla_native_clients",
+    "get_vanilla_native_clients_async",
+    "shutdown_llm_factory",
+    "ashutdown_llm_factory",
 ]
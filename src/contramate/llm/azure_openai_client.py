@@ -1,11 +1,15 @@
-from typing import List, Dict, Any, Optional, Union, Callable
+import threading
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Callable
+import httpx
 from loguru import logger
+from tenacity import AsyncRetrying
 from openai import AzureOpenAI, AsyncAzureOpenAI
-from openai import OpenAIError
 
-from contramate.utils.auth.certificate_provider import get_cert_token_provider
+from contramate.utils.auth.certificate_provider import cache_token_provider, get_cert_token_provider
 from contramate.utils.settings.core import AOAICertSettings
-from contramate.llm.base import BaseChatClient, ChatMessage
+from contramate.llm.base import BaseChatClient, MessageInput
+from contramate.llm.http_clients import TimeoutPolicy, loop_local_client, shared_http_client
+from contramate.llm.retry import log_api_errors
 
 
 class AzureOpenAIChatClient(BaseChatClient):
@@ -27,7 +31,16 @@ class AzureOpenAIChatClient(BaseChatClient):
         max_tokens: Optional[int] = None,
         api_key: Optional[str] = None,
         azure_ad_token_provider: Optional[Callable] = None,
-        azure_ad_cert_settings: Optional[AOAICertSettings] = None
+        azure_ad_cert_settings: Optional[AOAICertSettings] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_read_timeout: float = 300.0,
+        max_retries: int = 3,
+        max_retry_delay: float = 30.0,
+        sync_client: Optional[AzureOpenAI] = None,
+        async_client: Optional[AsyncAzureOpenAI] = None
     ):
         """
         Initialize Azure OpenAI chat client with flexible authentication.
@@ -41,16 +54,43 @@ class AzureOpenAIChatClient(BaseChatClient):
             api_key: API key for authentication (3rd priority)
             azure_ad_token_provider: Azure AD token provider callable (2nd priority)
             azure_ad_cert_settings: AOAICertSettings object (highest priority)
+            http_client: Shared httpx client for sync calls (uses the process-wide
+                pool if not provided)
+            async_http_client: Shared httpx async client for async calls (uses the
+                running event loop's shared pool if not provided)
+            connect_timeout: Seconds allowed to establish a connection (default: 5)
+            read_timeout: Base read timeout in seconds, extended for long prompts (default: 60)
+            max_read_timeout: Upper bound for the extended read timeout (default: 300)
+            max_retries: Retries for rate limits, connection errors and 5xx responses (default: 3)
+            max_retry_delay: Maximum seconds to wait between retries, also capping
+                server-provided Retry-After values (default: 30)
+            sync_client: Pre-built AzureOpenAI client; with either pre-built client
+                no authentication is set up (see from_clients)
+            async_client: Pre-built AsyncAzureOpenAI client
 
         Raises:
             ValueError: If required configuration is missing or no valid authentication method provided
         """
         # Initialize base client
         super().__init__()
+        self._timeouts = TimeoutPolicy(
+            connect=connect_timeout,
+            read=read_timeout,
+            max_read=max_read_timeout
+        )
+
+        # Pre-built SDK clients: nothing to authenticate or build
+        if sync_client is not None or async_client is not None:
+            self.azure_endpoint = str((sync_client or async_client).base_url)
+            self.api_version = None
+            self.default_model = model or "gpt-4"
+            self.default_temperature = temperature if temperature is not None else 0.7
+            self.default_max_tokens = max_tokens if max_tokens is not None else 1000
+            client_config = None
 
         # Priority 1: Use AOAICertSettings if provided
-        if azure_ad_cert_settings:
-            logger.info("Initializing with AOAICertSettings (certificate-based auth)")
+        elif azure_ad_cert_settings:
+            logger.debug("Initializing with AOAICertSettings (certificate-based auth)")
             self.azure_endpoint = azure_ad_cert_settings.azure_endpoint
             self.api_version = azure_ad_cert_settings.api_version
             self.default_model = model or azure_ad_cert_settings.model
@@ -66,12 +106,12 @@ class AzureOpenAIChatClient(BaseChatClient):
                     "azure_ad_token_provider": token_provider
                 }
             except Exception as e:
-                logger.error(f"Failed to initialize certificate token provider: {e}")
+                logger.error("Failed to initialize certificate token provider: {}", e)
                 raise
 
         # Priority 2: Use provided azure_ad_token_provider
         elif azure_ad_token_provider:
-            logger.info("Initializing with provided Azure AD token provider")
+            logger.debug("Initializing with provided Azure AD token provider")
             if not azure_endpoint:
                 raise ValueError("azure_endpoint is required when using azure_ad_token_provider")
 
@@ -84,12 +124,13 @@ class AzureOpenAIChatClient(BaseChatClient):
             client_config = {
                 "azure_endpoint": azure_endpoint,
                 "api_version": api_version,
-                "azure_ad_token_provider": azure_ad_token_provider
+                # The SDK calls the provider per request; reuse the token until near expiry
+                "azure_ad_token_provider": cache_token_provider(azure_ad_token_provider)
             }
 
         # Priority 3: Use API key
         elif api_key:
-            logger.info("Initializing with API key authentication")
+            logger.debug("Initializing with API key authentication")
             if not azure_endpoint:
                 raise ValueError("azure_endpoint is required when using api_key")
 
@@ -111,19 +152,145 @@ class AzureOpenAIChatClient(BaseChatClient):
                 "Please provide one of: azure_ad_cert_settings, azure_ad_token_provider, or api_key"
             )
 
-        # Initialize Azure OpenAI clients
+        # SDK clients are built on first use, so a sync-only or async-only
+        # caller never pays for (or holds sockets of) the other one
+        self._client_config = None if client_config is None else {
+            **client_config,
+            "timeout": self._timeouts.default,
+            # Retries are handled by _call_with_retry so Retry-After can be capped
+            "max_retries": 0,
+        }
+        self._configure_retries(max_retries, max_retry_delay)
+        self._sync_http_client = http_client
+        self._sync_client_instance: Optional[AzureOpenAI] = sync_client
+        self._async_client_instance: Optional[AsyncAzureOpenAI] = async_client
+        self._client_lock = threading.Lock()
+        # Async pools are bound to an event loop; see loop_local_client
+        self._async_clients = loop_local_client(self._build_async_client, async_http_client)
+
+        # Defaults resolved once; per-call overrides are layered on top
+        self._default_kwargs = {
+            "model": self.default_model,
+            "temperature": self.default_temperature,
+            "max_tokens": self.default_max_tokens,
+        }
+
+    @classmethod
+    def from_clients(
+        cls,
+        sync_client: Optional[AzureOpenAI] = None,
+        async_client: Optional[AsyncAzureOpenAI] = None,
+        default_model: str = "gpt-4",
+        default_temperature: float = 0.7,
+        default_max_tokens: int = 1000,
+        max_retries: int = 3,
+        max_retry_delay: float = 30.0
+    ) -> "AzureOpenAIChatClient":
+        """
+        Wrap already constructed SDK clients without running authentication again
+
+        Useful when the application holds long-lived AzureOpenAI / AsyncAzureOpenAI
+        instances (and their connection pools and token providers) and wants a
+        chat client around them, e.g. once per request or per test.
+
+        Args:
+            sync_client: AzureOpenAI client used by the sync methods (optional)
+            async_client: AsyncAzureOpenAI client used by the async methods (optional)
+            default_model: Default model / deployment for completions (default: "gpt-4")
+            default_temperature: Default temperature (default: 0.7)
+            default_max_tokens: Default max tokens (default: 1000)
+            max_retries: Retries for rate limits, connection errors and 5xx responses (default: 3)
+            max_retry_delay: Maximum seconds to wait between retries (default: 30)
+
+        Returns:
+            AzureOpenAIChatClient using the given SDK clients
+
+        Raises:
+            ValueError: If neither client is provided
+        """
+        if sync_client is None and async_client is None:
+            raise ValueError("At least one of sync_client or async_client is required")
+
+        return cls(
+            model=default_model,
+            temperature=default_temperature,
+            max_tokens=default_max_tokens,
+            max_retries=max_retries,
+            max_retry_delay=max_retry_delay,
+            sync_client=sync_client,
+            async_client=async_client
+        )
+
+    @property
+    def _sync_client(self) -> AzureOpenAI:
+        """Sync SDK client, created on first access"""
+        if self._sync_client_instance is None:
+            with self._client_lock:
+                if self._sync_client_instance is None:
+                    if self._client_config is None:
+                        raise RuntimeError("Client was created from_clients without a sync client")
+                    try:
+                        self._sync_client_instance = AzureOpenAI(
+                            **self._client_config,
+                            http_client=self._sync_http_client or shared_http_client()
+                        )
+                    except Exception as e:
+                        logger.error("Failed to initialize Azure OpenAI sync client: {}", e)
+                        raise
+        return self._sync_client_instance
+
+    def _build_async_client(self, http_client: httpx.AsyncClient) -> AsyncAzureOpenAI:
+        """Async SDK client on an httpx async pool"""
         try:
-            self._sync_client = AzureOpenAI(**client_config)
-            self._async_client = AsyncAzureOpenAI(**client_config)
-            logger.info("Azure OpenAI clients initialized successfully")
+            return AsyncAzureOpenAI(**self._client_config, http_client=http_client)
         except Exception as e:
-            logger.error(f"Failed to initialize Azure OpenAI clients: {e}")
+            logger.error("Failed to initialize Azure OpenAI async client: {}", e)
             raise
 
+    @property
+    def _async_client(self) -> AsyncAzureOpenAI:
+        """Async SDK client for the running event loop, created on first use"""
+        if self._async_client_instance is not None:
+            return self._async_client_instance
+        if self._client_config is None:
+            raise RuntimeError("Client was created from_clients without an async client")
+        return self._async_clients()
+
+    def _request_kwargs(
+        self,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Merge per-call overrides into the precomputed default request parameters"""
+        params = self._default_kwargs.copy()
+        if model:
+            params["model"] = model
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+        return params
+
+    def _sized(self, client, messages: List[Dict[str, Any]]):
+        """Return client, with a longer read timeout if the prompt is large"""
+        input_chars = sum(
+            len(msg["content"]) for msg in messages if isinstance(msg.get("content"), str)
+        )
+        timeout = self._timeouts.for_input(input_chars)
+        return client if timeout is None else client.with_options(timeout=timeout)
+
     def _get_model(self, model: Optional[str] = None) -> str:
         """Get model name, using default if not specified"""
         return model or self.default_model
 
+    # Azure OpenAI Batch API paths carry no /v1 prefix
+    _batch_endpoint = "/chat/completions"
+
+    def _batch_client(self) -> AsyncAzureOpenAI:
+        """Async SDK client used for Batch API jobs (needs a Global-Batch deployment)"""
+        return self._async_client
+
     def _get_temperature(self, temperature: Optional[float] = None) -> float:
         """Get temperature, using default if not specified"""
         return temperature if temperature is not None else self.default_temperature
@@ -132,12 +299,53 @@ class AzureOpenAIChatClient(BaseChatClient):
         """Get max tokens, using default if not specified"""
         return max_tokens if max_tokens is not None else self.default_max_tokens
 
+    def _call_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        operation: str = "Azure OpenAI chat completion",
+        **create_kwargs
+    ):
+        """Send one chat.completions.create request with the sync client"""
+        with log_api_errors(operation):
+            normalized_messages = self._normalize_messages(messages)
+            return self._call_with_retry(
+                self._sized(self._sync_client, normalized_messages).chat.completions.create,
+                messages=normalized_messages,
+                **self._request_kwargs(model, temperature, max_tokens),
+                **create_kwargs
+            )
+
+    async def _acall_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        operation: str = "Azure OpenAI async chat completion",
+        retrying: Optional[AsyncRetrying] = None,
+        **create_kwargs
+    ):
+        """Send one chat.completions.create request with the async client (under ``retrying`` if given)"""
+        with log_api_errors(operation):
+            normalized_messages = self._normalize_messages(messages)
+            return await self._acall_with_retry(
+                self._sized(self._async_client, normalized_messages).chat.completions.create,
+                retrying=retrying,
+                messages=normalized_messages,
+                **self._request_kwargs(model, temperature, max_tokens),
+                **create_kwargs
+            )
+
     def chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        n: int = 1,
         **kwargs
     ):
         """
@@ -148,37 +356,22 @@ class AzureOpenAIChatClient(BaseChatClient):
             model: Model to use (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            n: Number of choices to generate in the same request; the prompt is
+                processed and billed once for all of them (default: 1)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
             Native OpenAI ChatCompletion object
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = self._sync_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_tokens=self._get_max_tokens(max_tokens),
-                **kwargs
-            )
-
-            return response
-
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI chat completion: {e}")
-            raise
+        return self._call_chat(messages, model, temperature, max_tokens, n=n, **kwargs)
 
     async def async_chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        n: int = 1,
         **kwargs
     ):
         """
@@ -189,37 +382,22 @@ class AzureOpenAIChatClient(BaseChatClient):
             model: Model to use (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            n: Number of choices to generate in the same request; the prompt is
+                processed and billed once for all of them (default: 1)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
             Native OpenAI ChatCompletion object
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = await self._async_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_tokens=self._get_max_tokens(max_tokens),
-                **kwargs
-            )
-
-            return response
-
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error in async chat completion: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI async chat completion: {e}")
-            raise
+        return await self._acall_chat(messages, model, temperature, max_tokens, n=n, **kwargs)
 
     def stream_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        n: int = 1,
         **kwargs
     ):
         """
@@ -230,39 +408,101 @@ class AzureOpenAIChatClient(BaseChatClient):
             model: Model to use (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            n: Number of choices to generate in the same request; the prompt is
+                processed and billed once for all of them (default: 1)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
-            Generator yielding stream chunks
+            Generator yielding raw stream chunks (see async_stream_chat_completion for decoded text)
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
+        return self._call_chat(
+            messages, model, temperature, max_tokens,
+            operation="Azure OpenAI streaming completion", n=n, stream=True, **kwargs
+        )
 
-            response = self._sync_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_tokens=self._get_max_tokens(max_tokens),
-                stream=True,
-                **kwargs
-            )
+    def stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion as text deltas using the sync client
 
-            return response
+        Closing the generator early closes the HTTP response.
 
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error in streaming completion: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI streaming completion: {e}")
-            raise
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for Azure OpenAI API
+
+        Yields:
+            str: Content deltas in generation order
+        """
+        stream = self._call_chat(
+            messages, model, temperature, max_tokens,
+            operation="Azure OpenAI streaming text", stream=True, **kwargs
+        )
+
+        with stream, log_api_errors("Azure OpenAI streaming text"):
+            for chunk in stream:
+                choices = chunk.choices
+                if choices:
+                    delta = choices[0].delta.content
+                    if delta:
+                        yield delta
+
+    async def async_stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text deltas using the async client
+
+        Preferred over stream_completion for long outputs: chunks are awaited
+        without blocking the event loop and only non-empty content is yielded.
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for Azure OpenAI API
+
+        Yields:
+            str: Content deltas in generation order
+        """
+        stream = await self._acall_chat(
+            messages, model, temperature, max_tokens,
+            operation="Azure OpenAI streaming text", stream=True, **kwargs
+        )
+
+        # Closing the stream releases the connection if the consumer stops early
+        async with stream:
+            with log_api_errors("Azure OpenAI streaming text"):
+                async for chunk in stream:
+                    choices = chunk.choices
+                    if choices:
+                        delta = choices[0].delta.content
+                        if delta:
+                            yield delta
 
     def select_tool(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         tools: List[Dict[str, Any]],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        n: int = 1,
         **kwargs
     ) -> List[Any]:
         """
@@ -274,119 +514,20 @@ class AzureOpenAIChatClient(BaseChatClient):
             model: Model to use (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            n: Number of choices to generate in the same request; the prompt is
+                processed and billed once for all of them (default: 1)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
-            List[Any]: Tool calls from the response
+            List[Any]: Tool calls from all returned choices, in choice order
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = self._sync_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_tokens=self._get_max_tokens(max_tokens),
-                tools=tools,
-                tool_choice="auto",
-                **kwargs
-            )
-
-            return response.choices[0].message.tool_calls or []
-
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error in tool selection: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI tool selection: {e}")
-            raise
-
-
-if __name__ == "__main__":
-    import asyncio
-    import os
-
-    async def test_azure_client():
-        """
-        Test Azure OpenAI client with different authentication methods.
-        Set environment variables to test each method.
-        """
-        test_messages = [
-            {"role": "user", "content": "Hello, this is a test message for Azure OpenAI."}
+        response = self._call_chat(
+            messages, model, temperature, max_tokens,
+            operation="Azure OpenAI tool selection", n=n, tools=tools, tool_choice="auto", **kwargs
+        )
+
+        return [
+            tool_call
+            for choice in response.choices
+            for tool_call in (choice.message.tool_calls or [])
         ]
-
-        print("=" * 60)
-        print("Testing Azure OpenAI Client with Multiple Auth Methods")
-        print("=" * 60)
-
-        # Method 1: Using AOAICertSettings (highest priority)
-        try:
-            print("\n1. Testing with AOAICertSettings (certificate-based)...")
-            from contramate.utils.settings.factory import SettingsFactory
-
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIChatClient(azure_ad_cert_settings=settings)
-
-            response = client.chat_completion(test_messages)
-            print(f"✓ Certificate auth response: {response.choices[0].message.content[:100]}...")
-        except Exception as e:
-            print(f"✗ Certificate auth failed: {e}")
-
-        # Method 2: Using API key
-        try:
-            print("\n2. Testing with API key authentication...")
-            api_key = os.getenv("AZURE_OPENAI_API_KEY")
-            endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-
-            if api_key and endpoint:
-                client = AzureOpenAIChatClient(
-                    azure_endpoint=endpoint,
-                    api_key=api_key,
-                    model="gpt-4"
-                )
-
-                response = client.chat_completion(test_messages)
-                print(f"✓ API key auth response: {response.choices[0].message.content[:100]}...")
-            else:
-                print("✗ API key auth skipped: Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT")
-        except Exception as e:
-            print(f"✗ API key auth failed: {e}")
-
-        # Method 3: Using custom Azure AD token provider
-        try:
-            print("\n3. Testing with custom Azure AD token provider...")
-            print("✗ Token provider auth skipped: Requires custom implementation")
-        except Exception as e:
-            print(f"✗ Token provider auth failed: {e}")
-
-        # Test async completion
-        try:
-            print("\n4. Testing async completion...")
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIChatClient(azure_ad_cert_settings=settings)
-
-            async_response = await client.async_chat_completion(test_messages)
-            print(f"✓ Async response: {async_response.choices[0].message.content[:100]}...")
-        except Exception as e:
-            print(f"✗ Async completion failed: {e}")
-
-        # Test streaming
-        try:
-            print("\n5. Testing streaming completion...")
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIChatClient(azure_ad_cert_settings=settings)
-
-            stream = client.stream_completion(test_messages)
-            print("✓ Stream response: ", end="")
-            for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    print(chunk.choices[0].delta.content, end="", flush=True)
-            print()
-        except Exception as e:
-            print(f"✗ Streaming failed: {e}")
-
-        print("\n" + "=" * 60)
-        print("Testing complete!")
-        print("=" * 60)
-
-    asyncio.run(test_azure_client())
\ No newline at end of file
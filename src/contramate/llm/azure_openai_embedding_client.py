@@ -1,11 +1,67 @@
-from typing import List, Any, Optional, Union, Callable
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+import httpx
+import tiktoken
 from loguru import logger
 from openai import AzureOpenAI, AsyncAzureOpenAI
-from openai import OpenAIError
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 
-from contramate.utils.auth.certificate_provider import get_cert_token_provider
+from contramate.utils.auth.certificate_provider import cache_token_provider, get_cert_token_provider
 from contramate.utils.settings.core import AOAICertSettings
 from contramate.llm.base import BaseEmbeddingClient
+from contramate.llm.embedding_batcher import EmbeddingBatcher
+from contramate.llm.http_clients import TimeoutPolicy, loop_local_client, shared_http_client
+from contramate.llm.retry import log_api_errors
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> tiktoken.Encoding:
+    """Tokenizer shared by the ada-002 / text-embedding-3 model family"""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _pack_by_length(
+    texts: List[str],
+    max_tokens: int = 8000,
+    max_items: int = 16,
+    lengths: Optional[List[int]] = None
+) -> List[List[int]]:
+    """
+    Group texts into requests of bounded size using first-fit-decreasing
+
+    Texts are placed longest first into the first request that still has room
+    for both their tokens and one more item, so requests end up evenly filled
+    instead of mirroring however the caller happened to split its batches.
+    A single text longer than ``max_tokens`` gets a request of its own.
+
+    Args:
+        texts: Texts to pack
+        max_tokens: Maximum total tokens per request (default: 8000)
+        max_items: Maximum number of texts per request (default: 16)
+        lengths: Precomputed token counts for ``texts`` (optional)
+
+    Returns:
+        List of requests, each a list of indices into ``texts``
+    """
+    if lengths is None:
+        lengths = [len(tokens) for tokens in _token_encoding().encode_batch(texts)]
+
+    packs: List[List[int]] = []
+    loads: List[int] = []
+    for i in sorted(range(len(texts)), key=lengths.__getitem__, reverse=True):
+        for b, pack in enumerate(packs):
+            if len(pack) < max_items and loads[b] + lengths[i] <= max_tokens:
+                pack.append(i)
+                loads[b] += lengths[i]
+                break
+        else:
+            packs.append([i])
+            loads.append(lengths[i])
+    return packs
 
 
 class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
@@ -25,7 +81,19 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
         embedding_model: Optional[str] = None,
         api_key: Optional[str] = None,
         azure_ad_token_provider: Optional[Callable] = None,
-        azure_ad_cert_settings: Optional[AOAICertSettings] = None
+        azure_ad_cert_settings: Optional[AOAICertSettings] = None,
+        max_concurrency: int = 16,
+        batch_max_size: int = 64,
+        batch_flush_ms: float = 20.0,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_read_timeout: float = 300.0,
+        max_retries: int = 3,
+        max_retry_delay: float = 30.0,
+        cache: Optional[Any] = None,
+        cache_size: int = 1024
     ):
         """
         Initialize Azure OpenAI embedding client with flexible authentication.
@@ -37,16 +105,53 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
             api_key: API key for authentication (3rd priority)
             azure_ad_token_provider: Azure AD token provider callable (2nd priority)
             azure_ad_cert_settings: AOAICertSettings object (highest priority)
+            max_concurrency: Maximum number of embedding requests in flight for async
+                batch calls, to stay below the deployment's rate limits (default: 16)
+            batch_max_size: Maximum texts coalesced into one request by
+                async_create_embedding (default: 64)
+            batch_flush_ms: Maximum wait in milliseconds for more texts to coalesce (default: 20)
+            http_client: Shared httpx client for sync calls (uses the process-wide
+                pool if not provided)
+            async_http_client: Shared httpx async client for async calls (uses the
+                running event loop's shared pool if not provided)
+            connect_timeout: Seconds allowed to establish a connection (default: 5)
+            read_timeout: Base read timeout in seconds, extended for large inputs (default: 60)
+            max_read_timeout: Upper bound for the extended read timeout (default: 300)
+            max_retries: Retries for rate limits, connection errors and 5xx responses (default: 3)
+            max_retry_delay: Maximum seconds to wait between retries, also capping
+                server-provided Retry-After values (default: 30)
+            cache: Object with ``get(key)`` / ``set(key, value)`` used to cache
+                vectors, stored as ``array("f")`` (default: in-process LRUCache)
+            cache_size: Entries of the default cache; 0 disables caching (default: 1024)
 
         Raises:
             ValueError: If required configuration is missing or no valid authentication method provided
         """
-        # Initialize base client
-        super().__init__()
+        # Initialize base client (and the vector cache)
+        super().__init__(cache=cache, cache_size=cache_size)
+
+        self._timeouts = TimeoutPolicy(
+            connect=connect_timeout,
+            read=read_timeout,
+            max_read=max_read_timeout
+        )
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Cache key -> (request task, position in its input) for texts being embedded
+        self._inflight: Dict[Tuple[str, str], Tuple[asyncio.Task, int]] = {}
+        self._batcher = EmbeddingBatcher(
+            self.async_create_embeddings_batch,
+            max_batch=batch_max_size,
+            flush_ms=batch_flush_ms
+        )
 
         # Priority 1: Use AOAICertSettings if provided
         if azure_ad_cert_settings:
-            logger.info("Initializing embedding client with AOAICertSettings (certificate-based auth)")
+            logger.debug("Initializing embedding client with AOAICertSettings (certificate-based auth)")
             self.azure_endpoint = azure_ad_cert_settings.azure_endpoint
             self.api_version = azure_ad_cert_settings.api_version
             self.default_embedding_model = embedding_model or azure_ad_cert_settings.embedding_model
@@ -60,12 +165,12 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
                     "azure_ad_token_provider": token_provider
                 }
             except Exception as e:
-                logger.error(f"Failed to initialize certificate token provider: {e}")
+                logger.error("Failed to initialize certificate token provider: {}", e)
                 raise
 
         # Priority 2: Use provided azure_ad_token_provider
         elif azure_ad_token_provider:
-            logger.info("Initializing embedding client with provided Azure AD token provider")
+            logger.debug("Initializing embedding client with provided Azure AD token provider")
             if not azure_endpoint:
                 raise ValueError("azure_endpoint is required when using azure_ad_token_provider")
             if not embedding_model:
@@ -78,12 +183,13 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
             client_config = {
                 "azure_endpoint": azure_endpoint,
                 "api_version": api_version,
-                "azure_ad_token_provider": azure_ad_token_provider
+                # The SDK calls the provider per request; reuse the token until near expiry
+                "azure_ad_token_provider": cache_token_provider(azure_ad_token_provider)
             }
 
         # Priority 3: Use API key
         elif api_key:
-            logger.info("Initializing embedding client with API key authentication")
+            logger.debug("Initializing embedding client with API key authentication")
             if not azure_endpoint:
                 raise ValueError("azure_endpoint is required when using api_key")
             if not embedding_model:
@@ -105,19 +211,160 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
                 "Please provide one of: azure_ad_cert_settings, azure_ad_token_provider, or api_key"
             )
 
-        # Initialize Azure OpenAI clients
+        # SDK clients are built on first use, so a sync-only or async-only
+        # caller never pays for (or holds sockets of) the other one
+        self._client_config = {
+            **client_config,
+            "timeout": self._timeouts.default,
+            # Retries are handled by _call_with_retry so Retry-After can be capped
+            "max_retries": 0,
+        }
+        self._configure_retries(max_retries, max_retry_delay)
+        self._sync_http_client = http_client
+        self._sync_client_instance: Optional[AzureOpenAI] = None
+        self._client_lock = threading.Lock()
+        # Async pools are bound to an event loop; see loop_local_client
+        self._async_clients = loop_local_client(self._build_async_client, async_http_client)
+
+    @property
+    def _sync_client(self) -> AzureOpenAI:
+        """Sync SDK client, created on first access"""
+        if self._sync_client_instance is None:
+            with self._client_lock:
+                if self._sync_client_instance is None:
+                    try:
+                        self._sync_client_instance = AzureOpenAI(
+                            **self._client_config,
+                            http_client=self._sync_http_client or shared_http_client()
+                        )
+                    except Exception as e:
+                        logger.error("Failed to initialize Azure OpenAI sync embedding client: {}", e)
+                        raise
+        return self._sync_client_instance
+
+    def _build_async_client(self, http_client: httpx.AsyncClient) -> AsyncAzureOpenAI:
+        """Async SDK client on an httpx async pool"""
         try:
-            self._sync_client = AzureOpenAI(**client_config)
-            self._async_client = AsyncAzureOpenAI(**client_config)
-            logger.info("Azure OpenAI embedding clients initialized successfully")
+            return AsyncAzureOpenAI(**self._client_config, http_client=http_client)
         except Exception as e:
-            logger.error(f"Failed to initialize Azure OpenAI embedding clients: {e}")
+            logger.error("Failed to initialize Azure OpenAI async embedding client: {}", e)
             raise
 
+    @property
+    def _async_client(self) -> AsyncAzureOpenAI:
+        """Async SDK client for the running event loop, created on first use"""
+        return self._async_clients()
+
     def _get_embedding_model(self, model: Optional[str] = None) -> str:
         """Get embedding model name, using default if not specified"""
         return model or self.default_embedding_model
 
+    def _sized(self, client, input_texts: List[str]):
+        """Return client, with a longer read timeout if the input is large"""
+        timeout = self._timeouts.for_input(sum(len(text) for text in input_texts))
+        return client if timeout is None else client.with_options(timeout=timeout)
+
+    def _embed(self, model_name: str, texts: List[str], **kwargs) -> CreateEmbeddingResponse:
+        """Send one embeddings.create request with the sync client"""
+        chunks = self._split_inputs(texts)
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), self.max_concurrency)) as executor:
+                return self._concat_responses(list(executor.map(
+                    lambda chunk: self._embed(model_name, chunk, **kwargs), chunks
+                )))
+
+        with log_api_errors("Azure OpenAI embedding creation"):
+            return self._call_with_retry(
+                self._sized(self._sync_client, texts).embeddings.create,
+                model=model_name,
+                input=texts,
+                **kwargs
+            )
+
+    async def _aembed(self, model_name: str, texts: List[str], **kwargs) -> CreateEmbeddingResponse:
+        """Send one embeddings.create request with the async client"""
+        chunks = self._split_inputs(texts)
+        if len(chunks) > 1:
+            return self._concat_responses(await asyncio.gather(
+                *(self._aembed(model_name, chunk, **kwargs) for chunk in chunks)
+            ))
+
+        with log_api_errors("Azure OpenAI async embedding creation"):
+            return await self._acall_with_retry(
+                self._sized(self._async_client, texts).embeddings.create,
+                model=model_name,
+                input=texts,
+                **kwargs
+            )
+
+    def _claim_inflight(
+        self,
+        model_name: str,
+        texts: List[str],
+        keys: List[Tuple[str, str]],
+        misses: List[int]
+    ) -> Tuple[Optional[asyncio.Task], List[Tuple[int, asyncio.Task, int]]]:
+        """
+        Start one request for cache misses nobody is fetching yet
+
+        Misses already being embedded by a concurrent call join that call's
+        request instead of sending the text again (singleflight). Must run
+        without awaiting so the in-flight map cannot change underneath it.
+
+        Returns:
+            The new request task (None if every miss was already in flight) and,
+            for each miss, its input index, the task providing it and its position
+            in that task's input
+        """
+        fresh: Dict[Tuple[str, str], int] = {}
+        for i in misses:
+            if keys[i] not in self._inflight and keys[i] not in fresh:
+                fresh[keys[i]] = i
+
+        task = None
+        if fresh:
+            task = asyncio.ensure_future(
+                self._aembed(model_name, [texts[i] for i in fresh.values()])
+            )
+            for position, key in enumerate(fresh):
+                self._inflight[key] = (task, position)
+            task.add_done_callback(lambda done: self._settle_inflight(done, list(fresh)))
+
+        return task, [(i, *self._inflight[keys[i]]) for i in misses]
+
+    def _settle_inflight(self, task: asyncio.Task, keys: List[Tuple[str, str]]) -> None:
+        """Release in-flight entries of a finished request and cache its vectors"""
+        for key in keys:
+            if self._inflight.get(key, (None,))[0] is task:
+                del self._inflight[key]
+        # Calling exception() also marks a failure as retrieved if every caller was cancelled
+        if task.cancelled() or task.exception() is not None:
+            return
+        for key, item in zip(keys, sorted(task.result().data, key=lambda item: item.index)):
+            self._cache.set(key, self._pack_vector(item.embedding))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the request limiter for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def create_embedding(self, text: str, model: Optional[str] = None, **kwargs):
+        """
+        Create an embedding for a single text
+
+        Args:
+            text: Text string to embed
+            model: Embedding model to use (optional)
+            **kwargs: Additional parameters for Azure OpenAI API
+
+        Returns:
+            Native OpenAI Embedding object
+        """
+        return self.create_embeddings_batch([text], model, **kwargs).data[0]
+
     def create_embeddings(
         self,
         texts: Union[str, List[str]],
@@ -127,6 +374,9 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
         """
         Create embeddings for text input(s)
 
+        Thin dispatcher kept for compatibility; prefer create_embedding for a
+        single text and create_embeddings_batch for a list.
+
         Args:
             texts: Text string or list of text strings to embed
             model: Embedding model to use (optional)
@@ -135,24 +385,40 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
         Returns:
             Native OpenAI CreateEmbeddingResponse object
         """
-        try:
-            # Ensure texts is a list
-            input_texts = [texts] if isinstance(texts, str) else texts
+        input_texts = [texts] if isinstance(texts, str) else texts
+        return self.create_embeddings_batch(input_texts, model, **kwargs)
 
-            response = self._sync_client.embeddings.create(
-                model=self._get_embedding_model(model),
-                input=input_texts,
-                **kwargs
-            )
+    def create_embeddings_batch(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Create embeddings for a list of texts
 
-            return response
+        Texts already embedded with the same model are served from the cache;
+        only the remaining texts are sent to the API.
 
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error in embedding creation: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI embedding creation: {e}")
-            raise
+        Args:
+            texts: List of text strings to embed
+            model: Embedding model to use (optional)
+            **kwargs: Additional parameters for Azure OpenAI API
+
+        Returns:
+            Native OpenAI CreateEmbeddingResponse object
+        """
+        model_name = self._get_embedding_model(model)
+
+        # Extra parameters (e.g. dimensions) change the vectors, so skip the cache
+        if self._cache is None or kwargs:
+            return self._embed(model_name, texts, **kwargs)
+
+        keys, vectors, misses = self._find_uncached_texts(model_name, texts)
+        response = None
+        if misses:
+            response = self._embed(model_name, [texts[i] for i in self._unique_misses(keys, misses)])
+        return self._merge_cached(model_name, keys, vectors, misses, response)
 
     async def async_create_embeddings(
         self,
@@ -163,6 +429,9 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
         """
         Create embeddings for text input(s) asynchronously
 
+        Thin dispatcher kept for compatibility; prefer async_create_embedding for a
+        single text and async_create_embeddings_batch for a list.
+
         Args:
             texts: Text string or list of text strings to embed
             model: Embedding model to use (optional)
@@ -171,173 +440,218 @@ class AzureOpenAIEmbeddingClient(BaseEmbeddingClient):
         Returns:
             Native OpenAI CreateEmbeddingResponse object
         """
-        try:
-            # Ensure texts is a list
-            input_texts = [texts] if isinstance(texts, str) else texts
+        input_texts = [texts] if isinstance(texts, str) else texts
+        return await self.async_create_embeddings_batch(input_texts, model, **kwargs)
 
-            response = await self._async_client.embeddings.create(
-                model=self._get_embedding_model(model),
-                input=input_texts,
-                **kwargs
-            )
+    async def async_create_embeddings_batch(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Create embeddings for a list of texts asynchronously
+
+        Texts already embedded with the same model are served from the cache,
+        texts another concurrent call is already embedding are awaited from its
+        request, and only the remaining texts are sent to the API.
+
+        Args:
+            texts: List of text strings to embed
+            model: Embedding model to use (optional)
+            **kwargs: Additional parameters for Azure OpenAI API
 
+        Returns:
+            Native OpenAI CreateEmbeddingResponse object
+        """
+        model_name = self._get_embedding_model(model)
+
+        # Extra parameters (e.g. dimensions) change the vectors, so skip the cache
+        if self._cache is None or kwargs:
+            return await self._aembed(model_name, texts, **kwargs)
+
+        keys, vectors, misses = self._find_uncached_texts(model_name, texts)
+        if not misses:
+            return self._merge_cached(model_name, keys, vectors, misses, None)
+
+        own_task, sources = self._claim_inflight(model_name, texts, keys, misses)
+        results: Dict[asyncio.Task, List[Embedding]] = {}
+        for i, task, position in sources:
+            if task not in results:
+                # Shielded so cancelling this call does not abort a request others wait on
+                response = await asyncio.shield(task)
+                results[task] = sorted(response.data, key=lambda item: item.index)
+            vectors[i] = results[task][position].embedding
+
+        response = own_task.result() if own_task is not None else None
+        if response is not None and len(response.data) == len(texts):
             return response
+        return CreateEmbeddingResponse(
+            data=[
+                Embedding(embedding=vector, index=i, object="embedding")
+                for i, vector in enumerate(vectors)
+            ],
+            model=response.model if response is not None else model_name,
+            object="list",
+            # Only texts this call sent itself are billed to it
+            usage=response.usage if response is not None else Usage(prompt_tokens=0, total_tokens=0)
+        )
+
+    async def async_create_embedding(self, text: str, model: Optional[str] = None):
+        """
+        Create an embedding for a single text asynchronously
 
-        except OpenAIError as e:
-            logger.error(f"Azure OpenAI API error in async embedding creation: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in Azure OpenAI async embedding creation: {e}")
-            raise
+        Calls made close together with the default model are coalesced into one
+        batched request (see EmbeddingBatcher).
+
+        Args:
+            text: Text string to embed
+            model: Embedding model to use (optional, bypasses batching when it
+                differs from the default model)
+
+        Returns:
+            Native OpenAI Embedding object
+        """
+        if model and model != self.default_embedding_model:
+            response = await self.async_create_embeddings_batch([text], model)
+            return response.data[0]
+        return await self._batcher.submit(text)
+
+    @staticmethod
+    def _repack(
+        texts_batches: List[List[str]],
+        max_tokens: int,
+        max_items: int
+    ) -> Tuple[List[str], List[int], List[List[int]]]:
+        """Flatten caller batches and regroup them into evenly filled requests"""
+        flat = [text for batch in texts_batches for text in batch]
+        lengths = [len(tokens) for tokens in _token_encoding().encode_batch(flat)]
+        return flat, lengths, _pack_by_length(flat, max_tokens, max_items, lengths)
+
+    @staticmethod
+    def _unpack(
+        texts_batches: List[List[str]],
+        lengths: List[int],
+        packs: List[List[int]],
+        responses: List[CreateEmbeddingResponse]
+    ) -> List[CreateEmbeddingResponse]:
+        """Rebuild one response per caller batch from the packed responses"""
+        vectors: List[Optional[List[float]]] = [None] * len(lengths)
+        for pack, response in zip(packs, responses):
+            for i, item in zip(pack, sorted(response.data, key=lambda item: item.index)):
+                vectors[i] = item.embedding
+
+        model = responses[0].model if responses else ""
+        results = []
+        offset = 0
+        for batch in texts_batches:
+            end = offset + len(batch)
+            # Billing is per request; attribute it to batches by token count
+            tokens = sum(lengths[offset:end])
+            results.append(CreateEmbeddingResponse(
+                data=[
+                    Embedding(embedding=vectors[i], index=i - offset, object="embedding")
+                    for i in range(offset, end)
+                ],
+                model=model,
+                object="list",
+                usage=Usage(prompt_tokens=tokens, total_tokens=tokens)
+            ))
+            offset = end
+        return results
 
     def create_batch_embeddings(
         self,
         texts_batches: List[List[str]],
         model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        pack_by_length: bool = False,
+        max_tokens_per_request: int = 8000,
+        max_items_per_request: int = 16,
         **kwargs
     ) -> List[Any]:
         """
         Create embeddings for multiple batches of texts
 
+        Batches are sent concurrently from a thread pool so that network and
+        server time overlap instead of adding up per batch.
+
         Args:
             texts_batches: List of text batches to embed
             model: Embedding model to use (optional)
+            max_concurrency: Maximum number of requests in flight
+                (default: min(32, number of requests))
+            pack_by_length: Regroup all texts into requests of similar token size
+                instead of sending the caller's batches as-is (default: False)
+            max_tokens_per_request: Token budget per request when packing (default: 8000)
+            max_items_per_request: Texts per request when packing (default: 16)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
-            List of native OpenAI CreateEmbeddingResponse objects
+            List of native OpenAI CreateEmbeddingResponse objects, in batch order
         """
-        responses = []
-        for batch in texts_batches:
-            response = self.create_embeddings(batch, model, **kwargs)
-            responses.append(response)
-        return responses
+        if not texts_batches:
+            return []
+
+        if pack_by_length:
+            flat, lengths, packs = self._repack(
+                texts_batches, max_tokens_per_request, max_items_per_request
+            )
+            responses = self.create_batch_embeddings(
+                [[flat[i] for i in pack] for pack in packs], model, max_concurrency, **kwargs
+            )
+            return self._unpack(texts_batches, lengths, packs, responses)
+
+        max_workers = max(1, min(max_concurrency or 32, len(texts_batches)))
+        if max_workers == 1:
+            return [self.create_embeddings_batch(batch, model, **kwargs) for batch in texts_batches]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda batch: self.create_embeddings_batch(batch, model, **kwargs),
+                texts_batches
+            ))
 
     async def async_create_batch_embeddings(
         self,
         texts_batches: List[List[str]],
         model: Optional[str] = None,
+        pack_by_length: bool = False,
+        max_tokens_per_request: int = 8000,
+        max_items_per_request: int = 16,
         **kwargs
     ) -> List[Any]:
         """
         Create embeddings for multiple batches of texts asynchronously
 
+        At most ``max_concurrency`` requests are in flight at once, shared across
+        concurrent calls on the same client.
+
         Args:
             texts_batches: List of text batches to embed
             model: Embedding model to use (optional)
+            pack_by_length: Regroup all texts into requests of similar token size
+                instead of sending the caller's batches as-is (default: False)
+            max_tokens_per_request: Token budget per request when packing (default: 8000)
+            max_items_per_request: Texts per request when packing (default: 16)
             **kwargs: Additional parameters for Azure OpenAI API
 
         Returns:
-            List of native OpenAI CreateEmbeddingResponse objects
-        """
-        import asyncio
-
-        tasks = [
-            self.async_create_embeddings(batch, model, **kwargs)
-            for batch in texts_batches
-        ]
-
-        return await asyncio.gather(*tasks)
-
-
-if __name__ == "__main__":
-    import asyncio
-    import os
-
-    async def test_azure_embedding_client():
+            List of native OpenAI CreateEmbeddingResponse objects, in batch order
         """
-        Test Azure OpenAI embedding client with different authentication methods.
-        Set environment variables to test each method.
-        """
-        test_texts = [
-            "This is a test sentence for Azure OpenAI embedding.",
-            "Another test sentence to embed with Azure."
-        ]
-
-        print("=" * 60)
-        print("Testing Azure OpenAI Embedding Client")
-        print("=" * 60)
-
-        # Method 1: Using AOAICertSettings (highest priority)
-        try:
-            print("\n1. Testing with AOAICertSettings (certificate-based)...")
-            from contramate.utils.settings.factory import SettingsFactory
-
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
-
-            response = client.create_embeddings(test_texts)
-            print(f"✓ Certificate auth: {len(response.data)} embeddings created")
-            print(f"  Model: {response.model}")
-            print(f"  Dimensions: {len(response.data[0].embedding)}")
-            print(f"  Usage: {response.usage.total_tokens} tokens")
-        except Exception as e:
-            print(f"✗ Certificate auth failed: {e}")
-
-        # Method 2: Using API key
-        try:
-            print("\n2. Testing with API key authentication...")
-            api_key = os.getenv("AZURE_OPENAI_API_KEY")
-            endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-            embedding_model = os.getenv("AZURE_OPENAI_EMBEDDING_MODEL", "text-embedding-ada-002")
-
-            if api_key and endpoint:
-                client = AzureOpenAIEmbeddingClient(
-                    azure_endpoint=endpoint,
-                    api_key=api_key,
-                    embedding_model=embedding_model
-                )
-
-                response = client.create_embeddings(test_texts)
-                print(f"✓ API key auth: {len(response.data)} embeddings created")
-                print(f"  Model: {response.model}")
-                print(f"  Dimensions: {len(response.data[0].embedding)}")
-            else:
-                print("✗ API key auth skipped: Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT")
-        except Exception as e:
-            print(f"✗ API key auth failed: {e}")
-
-        # Test async completion
-        try:
-            print("\n3. Testing async embedding creation...")
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
-
-            async_response = await client.async_create_embeddings(test_texts)
-            print(f"✓ Async embeddings: {len(async_response.data)} embeddings created")
-        except Exception as e:
-            print(f"✗ Async embeddings failed: {e}")
-
-        # Test single string
-        try:
-            print("\n4. Testing single string embedding...")
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
-
-            single_response = client.create_embeddings("Single test sentence for Azure.")
-            print(f"✓ Single string: {len(single_response.data)} embedding created")
-        except Exception as e:
-            print(f"✗ Single string failed: {e}")
+        if pack_by_length and texts_batches:
+            flat, lengths, packs = self._repack(
+                texts_batches, max_tokens_per_request, max_items_per_request
+            )
+            responses = await self.async_create_batch_embeddings(
+                [[flat[i] for i in pack] for pack in packs], model, **kwargs
+            )
+            return self._unpack(texts_batches, lengths, packs, responses)
 
-        # Test batch embeddings
-        try:
-            print("\n5. Testing batch embeddings...")
-            settings = SettingsFactory.create_azure_openai_settings()
-            client = AzureOpenAIEmbeddingClient(azure_ad_cert_settings=settings)
-
-            batches = [
-                ["First batch sentence 1", "First batch sentence 2"],
-                ["Second batch sentence 1", "Second batch sentence 2"]
-            ]
-            batch_responses = client.create_batch_embeddings(batches)
-            print(f"✓ Batch embeddings: {len(batch_responses)} batches processed")
-            for i, batch_resp in enumerate(batch_responses):
-                print(f"  Batch {i + 1}: {len(batch_resp.data)} embeddings")
-        except Exception as e:
-            print(f"✗ Batch embeddings failed: {e}")
+        semaphore = self._get_semaphore()
 
-        print("\n" + "=" * 60)
-        print("Testing complete!")
-        print("=" * 60)
+        async def _bounded(batch: List[str]):
+            async with semaphore:
+                return await self.async_create_embeddings_batch(batch, model, **kwargs)
 
-    asyncio.run(test_azure_embedding_client())
\ No newline at end of file
+        return await asyncio.gather(*(_bounded(batch) for batch in texts_batches))
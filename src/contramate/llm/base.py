@@ -1,14 +1,53 @@
+import asyncio
+import hashlib
+import random
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, TypeAlias, Union
 
+from openai import RateLimitError
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 
-class ChatMessage(BaseModel):
+from contramate.llm import batch_api
+from contramate.llm.batch_api import BatchJob
+from contramate.llm.rate_limit import AdaptiveConcurrencyLimiter, TokenBucket
+from contramate.llm.retry import TRANSIENT_ERRORS, build_retrying, retry_after_seconds
+from contramate.utils.cache import LRUCache
+
+
+@dataclass(frozen=True, slots=True)
+class ChatMessage:
     """Standardized chat message format for convenience"""
     role: str  # "user", "assistant", "system"
     content: str
     name: Optional[str] = None
 
+    def to_dict(self) -> "MessageDict":
+        """API message dict, omitting ``name`` when it is not set"""
+        if self.name:
+            return {"role": self.role, "content": self.content, "name": self.name}
+        return {"role": self.role, "content": self.content}
+
+
+# Canonical message form sent to the API; everything past _normalize_messages uses it
+MessageDict: TypeAlias = Dict[str, str]
+# What public chat methods accept
+MessageInput: TypeAlias = Union[ChatMessage, MessageDict]
+
+
+@lru_cache(maxsize=1024)
+def _normalize_chat_message(msg: ChatMessage) -> MessageDict:
+    """Convert a ChatMessage to its API dict, memoized for repeated prefix messages
+
+    ChatMessage is frozen (hashable), so system prompts and other messages that
+    recur across agent turns are converted once. The returned dict is shared
+    between calls and must be treated as read-only.
+    """
+    return msg.to_dict()
+
 
 class BaseClient(ABC):
     """Base client class with common functionality"""
@@ -16,23 +55,59 @@ class BaseClient(ABC):
     def __init__(self, api_key: Optional[str] = None):
         """Initialize base client with API key"""
         self.api_key = api_key
+        self._retrying = None
+        self._async_retrying = None
+        self._async_retrying_except_rate_limits = None
+
+    def _configure_retries(self, max_retries: int = 3, max_retry_delay: float = 30.0) -> None:
+        """
+        Set the retry policy used by _call_with_retry / _acall_with_retry
+
+        Rate limits, connection errors and 5xx responses are retried with
+        jittered exponential backoff honoring Retry-After (see llm/retry.py).
+        SDK clients should be built with ``max_retries=0`` so attempts are
+        not multiplied by the SDK's own retry loop.
+
+        Args:
+            max_retries: Retries after the first attempt (default: 3)
+            max_retry_delay: Maximum seconds to wait between attempts (default: 30)
+        """
+        self._retrying = build_retrying(max_retries, max_retry_delay)
+        self._async_retrying = build_retrying(max_retries, max_retry_delay, async_mode=True)
+        # For callers that back off on 429s themselves (parallel_chat_completion)
+        self._async_retrying_except_rate_limits = build_retrying(
+            max_retries, max_retry_delay, async_mode=True, retry_on=TRANSIENT_ERRORS
+        )
+
+    def _call_with_retry(self, fn, **params):
+        """Call a sync SDK method, retrying transient failures"""
+        if self._retrying is None:
+            self._configure_retries()
+        return self._retrying.copy()(fn, **params)
+
+    async def _acall_with_retry(self, fn, retrying=None, **params):
+        """Await an async SDK method, retrying transient failures (or as ``retrying`` says)"""
+        if self._async_retrying is None:
+            self._configure_retries()
+        return await (retrying or self._async_retrying).copy()(fn, **params)
     
-    def _normalize_messages(
-        self, messages: List[Union[ChatMessage, Dict[str, str]]]
-    ) -> List[Dict[str, str]]:
+    @staticmethod
+    def _normalize_one(msg: MessageInput) -> MessageDict:
+        """Convert a single message to its API dict"""
+        if type(msg) is dict:
+            return msg
+        if isinstance(msg, ChatMessage):
+            return _normalize_chat_message(msg)
+        if isinstance(msg, dict):
+            return msg
+        raise ValueError(f"Invalid message type: {type(msg)}")
+
+    def _normalize_messages(self, messages: List[MessageInput]) -> List[MessageDict]:
         """Convert messages to standard dict format"""
-        normalized = []
-        for msg in messages:
-            if isinstance(msg, ChatMessage):
-                msg_dict = {"role": msg.role, "content": msg.content}
-                if msg.name:
-                    msg_dict["name"] = msg.name
-                normalized.append(msg_dict)
-            elif isinstance(msg, dict):
-                normalized.append(msg)
-            else:
-                raise ValueError(f"Invalid message type: {type(msg)}")
-        return normalized
+        # Common case: the caller already passes API dicts, so reuse the list as-is
+        if type(messages) is list and all(type(msg) is dict for msg in messages):
+            return messages
+        return [self._normalize_one(msg) for msg in messages]
 
     def _get_temperature(self, temperature: Optional[float] = None) -> float:
         """Get temperature, using default if not specified"""
@@ -49,7 +124,7 @@ class BaseChatClient(BaseClient):
     @abstractmethod
     def chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -61,7 +136,7 @@ class BaseChatClient(BaseClient):
     @abstractmethod
     async def async_chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -70,14 +145,454 @@ class BaseChatClient(BaseClient):
         """Asynchronous chat completion - Returns native OpenAI SDK response"""
         pass
 
+    @abstractmethod
+    def async_stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Asynchronous streaming chat completion - Yields content deltas as they arrive"""
+        pass
+
+    @abstractmethod
+    def stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Synchronous streaming chat completion - Yields content deltas as they arrive"""
+        pass
+
     @abstractmethod
     def _get_model(self, model: Optional[str] = None) -> str:
         """Get model name, using default if not specified"""
         pass
 
+    async def _acall_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        retrying: Optional[Any] = None,
+        **create_kwargs
+    ) -> Any:
+        """
+        Send one async chat completion request under a given retry policy
+
+        Clients that call the SDK themselves override this and pass
+        ``retrying`` to _acall_with_retry; this default ignores it and
+        returns async_chat_completion.
+        """
+        return await self.async_chat_completion(messages, model, temperature, max_tokens, **create_kwargs)
+
+    async def async_select_tool(
+        self,
+        messages: List[MessageInput],
+        tools: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Tool selection for function calling without blocking the event loop
+
+        Args:
+            messages: List of chat messages
+            tools: List of tool descriptions
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for the chat completion API
+
+        Returns:
+            List[Any]: Tool calls from all returned choices, in choice order
+        """
+        response = await self.async_chat_completion(
+            messages, model, temperature, max_tokens, tools=tools, tool_choice="auto", **kwargs
+        )
+        return [
+            tool_call
+            for choice in response.choices
+            for tool_call in (choice.message.tool_calls or [])
+        ]
+
+    async def select_tool_multi(
+        self,
+        messages: List[MessageInput],
+        tools: List[Dict[str, Any]],
+        models: List[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Ask several models for a tool selection concurrently
+
+        All requests are started before any result is awaited, so the total
+        time is that of the slowest model rather than the sum.
+
+        Args:
+            messages: List of chat messages
+            tools: List of tool descriptions
+            models: Models (deployments for Azure OpenAI) to ask
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for the chat completion API
+
+        Returns:
+            Mapping of model to its tool calls, or to the exception its request raised
+        """
+        results = await asyncio.gather(
+            *(
+                self.async_select_tool(messages, tools, model, temperature, max_tokens, **kwargs)
+                for model in models
+            ),
+            return_exceptions=True
+        )
+        return dict(zip(models, results))
+
+    def _request_kwargs(
+        self,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Request parameters with defaults filled in; clients override it with their API's names"""
+        return {
+            "model": self._get_model(model),
+            "temperature": self._get_temperature(temperature),
+            "max_tokens": self._get_max_tokens(max_tokens),
+        }
+
+    # Endpoint used in Batch API input files; Azure OpenAI overrides it
+    _batch_endpoint = "/v1/chat/completions"
+
+    def _batch_client(self) -> Any:
+        """Async SDK client used for Batch API jobs"""
+        raise NotImplementedError(f"{type(self).__name__} does not support the Batch API")
+
+    async def submit_batch(
+        self,
+        conversations: List[List[MessageInput]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> BatchJob:
+        """
+        Submit conversations as a Batch API job without waiting for it
+
+        Suits non-interactive workloads (evaluation, bulk extraction): the job
+        is billed at a discount and completes within 24 hours. Keep the
+        returned job (e.g. its ``batch_id``) and collect results with poll_batch.
+
+        Args:
+            conversations: One message list per completion
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for the chat completion API
+
+        Returns:
+            BatchJob identifying the submitted job
+        """
+        request_kwargs = {**self._request_kwargs(model, temperature, max_tokens), **kwargs}
+        bodies = [
+            {"messages": self._normalize_messages(messages), **request_kwargs}
+            for messages in conversations
+        ]
+        return await batch_api.submit_batch(self._batch_client(), bodies, endpoint=self._batch_endpoint)
+
+    async def poll_batch(
+        self,
+        job: BatchJob,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0
+    ) -> List[Any]:
+        """
+        Wait for a job from submit_batch and download its results
+
+        Args:
+            job: Job returned by submit_batch
+            poll_interval: Initial seconds between status checks, doubled up to
+                ``max_poll_interval`` (default: 10)
+            max_poll_interval: Maximum seconds between status checks (default: 300)
+
+        Returns:
+            Native OpenAI ChatCompletion objects, in conversation order (None for
+            requests that failed inside the job)
+        """
+        return await batch_api.wait_for_batch(self._batch_client(), job, poll_interval, max_poll_interval)
+
+    async def batch_chat_completion(
+        self,
+        conversations: List[List[MessageInput]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+        use_batch_api: bool = False,
+        return_exceptions: bool = False,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Complete several independent conversations
+
+        By default the conversations are sent concurrently through
+        async_chat_completion, at most ``max_concurrency`` at a time. With
+        ``use_batch_api`` they are submitted as one Batch API job instead, which
+        is billed at a discount but may take up to 24 hours.
+
+        Args:
+            conversations: One message list per completion
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            max_concurrency: Maximum requests in flight (default: 8)
+            use_batch_api: Submit a Batch API job and wait for it (default: False)
+            return_exceptions: Return the exception of a failed request in its
+                slot instead of raising it, so the other completions are kept
+                (default: False)
+            **kwargs: Additional parameters for the chat completion API
+
+        Returns:
+            Native OpenAI ChatCompletion objects, in conversation order (None for
+            requests that failed inside a Batch API job)
+        """
+        if use_batch_api:
+            job = await self.submit_batch(conversations, model, temperature, max_tokens, **kwargs)
+            return await self.poll_batch(job)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(messages):
+            async with semaphore:
+                return await self.async_chat_completion(
+                    messages, model=model, temperature=temperature, max_tokens=max_tokens, **kwargs
+                )
+
+        return await asyncio.gather(
+            *(_bounded(messages) for messages in conversations),
+            return_exceptions=return_exceptions
+        )
+
+    async def parallel_chat_completion(
+        self,
+        conversations: List[List[MessageInput]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_concurrent: int = 50,
+        requests_per_minute: float = 3000,
+        tokens_per_minute: float = 90_000,
+        max_attempts: int = 5,
+        max_pause: float = 60.0,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Complete many conversations as fast as the rate limits allow
+
+        Requests run concurrently and are admitted by a token bucket sized to the deployment's request and token
+        limits, with prompt tokens estimated at four characters per token plus
+        ``max_tokens`` for the completion. A rate-limited request pauses the
+        bucket for the server's Retry-After delay (jittered exponential backoff
+        when absent), so all pending requests back off together, and is then
+        retried; other failures are returned in place of the result so one bad
+        conversation does not abort the rest. The number of requests in flight
+        adapts as well: it grows with each success up to ``max_concurrent`` and
+        halves on a 429.
+
+        Args:
+            conversations: One message list per completion
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            max_concurrent: Upper bound of requests in flight (default: 50)
+            requests_per_minute: Request rate limit (default: 3000)
+            tokens_per_minute: Token rate limit (default: 90,000)
+            max_attempts: Attempts per request when rate limited (default: 5)
+            max_pause: Maximum seconds a single 429 pauses the bucket (default: 60)
+            **kwargs: Additional parameters for the chat completion API
+
+        Returns:
+            ChatCompletion objects or exceptions, in conversation order
+        """
+        if self._async_retrying_except_rate_limits is None:
+            self._configure_retries()
+        limiter = AdaptiveConcurrencyLimiter(max_concurrent)
+        bucket = TokenBucket(requests_per_minute, tokens_per_minute)
+        completion_tokens = self._get_max_tokens(max_tokens)
+
+        async def _process(messages) -> Any:
+            normalized = self._normalize_messages(messages)
+            prompt_chars = sum(
+                len(msg["content"]) for msg in normalized if isinstance(msg.get("content"), str)
+            )
+            for attempt in range(max_attempts):
+                await bucket.acquire(prompt_chars // 4 + completion_tokens)
+                try:
+                    async with limiter:
+                        # 429s are not retried inside the call, so the first one
+                        # reaches the bucket and the limiter below
+                        response = await self._acall_chat(
+                            normalized, model, temperature, max_tokens,
+                            retrying=self._async_retrying_except_rate_limits, **kwargs
+                        )
+                    limiter.record_success()
+                    return response
+                except RateLimitError as e:
+                    limiter.record_rate_limit()
+                    if attempt == max_attempts - 1:
+                        return e
+                    delay = retry_after_seconds(e)
+                    if delay is None:
+                        delay = 2 ** attempt + random.random()
+                    bucket.pause(min(delay, max_pause))
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(_process(messages) for messages in conversations))
+
 
 class BaseEmbeddingClient(BaseClient):
-    """Abstract base class for embedding clients"""
+    """Abstract base class for embedding clients
+
+    Provides an optional cache of embedding vectors keyed by model and a hash
+    of the text. Subclasses look inputs up with ``_find_uncached_texts``, send
+    only the distinct misses (``_unique_misses``) to the API and combine both
+    with ``_merge_cached``.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[Any] = None,
+        cache_size: int = 1024
+    ):
+        """
+        Initialize base embedding client
+
+        Args:
+            api_key: API key (optional)
+            cache: Object with ``get(key)`` / ``set(key, value)`` used to cache
+                vectors, stored as ``array("f")`` (default: in-process LRUCache)
+            cache_size: Entries of the default cache; 0 disables caching (default: 1024)
+        """
+        super().__init__(api_key=api_key)
+        if cache is not None:
+            self._cache = cache
+        elif cache_size > 0:
+            self._cache = LRUCache(maxsize=cache_size)
+        else:
+            self._cache = None
+
+    # Most inputs the embeddings endpoint accepts in one request; longer lists
+    # are split into chunks that are sent concurrently
+    max_inputs_per_request = 2048
+
+    def _split_inputs(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into chunks the embeddings endpoint accepts in one request"""
+        size = self.max_inputs_per_request
+        return [texts[start:start + size] for start in range(0, len(texts), size)]
+
+    @staticmethod
+    def _concat_responses(responses: List[Any]) -> Any:
+        """Join the responses for consecutive input chunks into one, indexed in input order"""
+        data = []
+        for response in responses:
+            offset = len(data)
+            data.extend(
+                item.model_copy(update={"index": offset + i})
+                for i, item in enumerate(sorted(response.data, key=lambda item: item.index))
+            )
+        return CreateEmbeddingResponse(
+            data=data,
+            model=responses[0].model,
+            object="list",
+            usage=Usage(
+                prompt_tokens=sum(response.usage.prompt_tokens for response in responses),
+                total_tokens=sum(response.usage.total_tokens for response in responses)
+            )
+        )
+
+    @staticmethod
+    def _generate_cache_key(model: str, text: str) -> Tuple[str, str]:
+        """Cache key for one text embedded with a given model"""
+        return model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _pack_vector(vector: List[float]) -> array:
+        """Store a vector as packed float32 (4 bytes per value instead of a list of floats)"""
+        # Lossless: the API returns float32 values
+        return array("f", vector)
+
+    @staticmethod
+    def _unpack_vector(packed: Optional[array]) -> Optional[List[float]]:
+        """Convert a cached vector back to the list the SDK response types expect"""
+        return None if packed is None else packed.tolist()
+
+    def _find_uncached_texts(
+        self, model: str, input_texts: List[str]
+    ) -> Tuple[List[Tuple[str, str]], List[Optional[List[float]]], List[int]]:
+        """Split inputs into cached vectors and indices that still need the API"""
+        keys = [self._generate_cache_key(model, text) for text in input_texts]
+        vectors = [self._unpack_vector(self._cache.get(key)) for key in keys]
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        return keys, vectors, misses
+
+    @staticmethod
+    def _unique_misses(keys: List[Tuple[str, str]], misses: List[int]) -> List[int]:
+        """First index of every distinct missed text, so repeated texts are embedded once"""
+        first: Dict[Tuple[str, str], int] = {}
+        for i in misses:
+            first.setdefault(keys[i], i)
+        return list(first.values())
+
+    def _merge_cached(
+        self,
+        model: str,
+        keys: List[Tuple[str, str]],
+        vectors: List[Optional[List[float]]],
+        misses: List[int],
+        response: Optional[Any]
+    ) -> Any:
+        """
+        Store fresh vectors in the cache and rebuild a response in input order
+
+        ``response`` holds the embeddings of ``_unique_misses(keys, misses)``,
+        in that order; repeated texts take the vector of their first occurrence.
+        """
+        if response is not None:
+            fetched = {}
+            items = sorted(response.data, key=lambda item: item.index)
+            for i, item in zip(self._unique_misses(keys, misses), items):
+                fetched[keys[i]] = item.embedding
+                self._cache.set(keys[i], self._pack_vector(item.embedding))
+            for i in misses:
+                vectors[i] = fetched[keys[i]]
+
+            # Every input was a distinct miss: the API response is already complete
+            if len(items) == len(keys):
+                return response
+
+        return CreateEmbeddingResponse(
+            data=[
+                Embedding(embedding=vector, index=i, object="embedding")
+                for i, vector in enumerate(vectors)
+            ],
+            model=response.model if response is not None else model,
+            object="list",
+            # Only the uncached texts were sent (and billed)
+            usage=response.usage if response is not None else Usage(prompt_tokens=0, total_tokens=0)
+        )
 
     @abstractmethod
     def create_embeddings(
@@ -102,4 +617,41 @@ class BaseEmbeddingClient(BaseClient):
     @abstractmethod
     def _get_embedding_model(self, model: Optional[str] = None) -> str:
         """Get embedding model name, using default if not specified"""
-        pass
\ No newline at end of file
+        pass
+
+    async def batch_create_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        batch_size: int = 64,
+        max_concurrency: int = 8,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Embed a long list of texts in concurrent fixed-size requests
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model to use (optional)
+            batch_size: Texts per request (default: 64)
+            max_concurrency: Maximum requests in flight (default: 8)
+            **kwargs: Additional parameters for the embeddings API
+
+        Returns:
+            Native OpenAI Embedding objects, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(chunk: List[str]):
+            async with semaphore:
+                return await self.async_create_embeddings(chunk, model=model, **kwargs)
+
+        responses = await asyncio.gather(*(
+            _bounded(texts[start:start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ))
+        return [
+            item
+            for response in responses
+            for item in sorted(response.data, key=lambda item: item.index)
+        ]
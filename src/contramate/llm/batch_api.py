@@ -0,0 +1,128 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from openai.types.chat import ChatCompletion
+
+
+# Compact separators and raw UTF-8 keep large batch files small and cheap to encode
+_encode_line = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Batch statuses after which the output file will never appear
+_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """Handle of a submitted OpenAI / Azure OpenAI Batch API job"""
+
+    batch_id: str
+    input_file_id: str
+    request_count: int
+
+
+def build_batch_jsonl(bodies: List[Dict[str, Any]], url: str) -> bytes:
+    """
+    Encode request bodies as a Batch API input file
+
+    Each line carries ``custom_id`` set to the request's position so results can
+    be returned in input order.
+
+    Args:
+        bodies: Request bodies (e.g. chat.completions.create parameters)
+        url: Endpoint every request targets (e.g. "/v1/chat/completions")
+
+    Returns:
+        JSONL file content
+    """
+    lines = [
+        _encode_line({"custom_id": str(i), "method": "POST", "url": url, "body": body})
+        for i, body in enumerate(bodies)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def submit_batch(
+    client: Any,
+    bodies: List[Dict[str, Any]],
+    endpoint: str = "/v1/chat/completions",
+    completion_window: str = "24h"
+) -> BatchJob:
+    """
+    Upload requests and start a Batch API job
+
+    Batch jobs are billed at a discount and run within ``completion_window``,
+    which suits offline workloads such as evaluation or bulk extraction.
+
+    Args:
+        client: AsyncOpenAI or AsyncAzureOpenAI client
+        bodies: Request bodies, one per request
+        endpoint: Endpoint of the requests; Azure OpenAI uses "/chat/completions"
+        completion_window: Time window the job must complete in (default: "24h")
+
+    Returns:
+        BatchJob identifying the submitted job
+    """
+    input_file = await client.files.create(
+        file=("batch.jsonl", build_batch_jsonl(bodies, endpoint)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=endpoint,
+        completion_window=completion_window
+    )
+    logger.info("Submitted batch {} with {} requests", batch.id, len(bodies))
+    return BatchJob(batch_id=batch.id, input_file_id=input_file.id, request_count=len(bodies))
+
+
+async def wait_for_batch(
+    client: Any,
+    job: BatchJob,
+    poll_interval: float = 10.0,
+    max_poll_interval: float = 300.0
+) -> List[Optional[ChatCompletion]]:
+    """
+    Poll a Batch API job until it completes and download its results
+
+    Args:
+        client: AsyncOpenAI or AsyncAzureOpenAI client the job was submitted with
+        job: Job returned by submit_batch
+        poll_interval: Initial seconds between status checks, doubled up to
+            ``max_poll_interval`` (default: 10)
+        max_poll_interval: Maximum seconds between status checks (default: 300)
+
+    Returns:
+        One ChatCompletion per submitted request, in input order; None for
+        requests that failed inside the batch
+
+    Raises:
+        RuntimeError: If the job fails, expires or is cancelled
+    """
+    delay = poll_interval
+    while True:
+        batch = await client.batches.retrieve(job.batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in _FAILED_STATUSES:
+            raise RuntimeError(f"Batch {job.batch_id} ended with status '{batch.status}'")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_poll_interval)
+
+    results: List[Optional[ChatCompletion]] = [None] * job.request_count
+    if not batch.output_file_id:
+        return results
+
+    content = await client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        if not line:
+            continue
+        item = json.loads(line)
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            logger.warning("Batch request {} failed: {}", item.get("custom_id"), item.get("error") or response)
+            continue
+        results[int(item["custom_id"])] = ChatCompletion.model_validate(response["body"])
+    return results
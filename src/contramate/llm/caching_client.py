@@ -0,0 +1,275 @@
+import hashlib
+import json
+import math
+import operator
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from contramate.llm.base import BaseChatClient, BaseEmbeddingClient, MessageDict, MessageInput
+from contramate.utils.cache import TTLCache
+
+# Compact, key-sorted encoder for cache keys, built once instead of per json.dumps call
+_encode_key = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str).encode
+
+
+class CachingChatClient(BaseChatClient):
+    """
+    Chat client wrapper that answers repeated or paraphrased prompts from a cache.
+
+    Two lookups run before the wrapped client is called:
+
+    1. Exact match on the full request (messages, model, temperature, max_tokens)
+    2. Semantic match, when an embedding client is given: the last user message
+       is embedded and compared (cosine similarity) with earlier prompts that
+       share the same preceding conversation and request parameters
+
+    Only deterministic requests are cached: calls whose resolved temperature is
+    not 0, and calls with extra API parameters (tools, streaming, n, ...),
+    bypass the cache.
+
+    Example:
+        ```python
+        client = CachingChatClient(chat_client, embedding_client, similarity_threshold=0.92)
+        response = client.chat_completion([{"role": "user", "content": "What is the notice period?"}])
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BaseChatClient,
+        embedding_client: Optional[BaseEmbeddingClient] = None,
+        similarity_threshold: float = 0.92,
+        maxsize: int = 1024,
+        ttl: float = 3600.0
+    ):
+        """
+        Initialize the caching wrapper
+
+        Args:
+            client: Chat client that serves cache misses
+            embedding_client: Embedding client enabling semantic lookups (optional;
+                exact matches only when omitted)
+            similarity_threshold: Minimum cosine similarity for a semantic hit (default: 0.92)
+            maxsize: Maximum number of cached responses per lookup kind (default: 1024)
+            ttl: Seconds a cached response stays valid (default: 3600)
+        """
+        super().__init__()
+        self.client = client
+        self.embedding_client = embedding_client
+        self.similarity_threshold = similarity_threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._exact = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Semantic entries grouped by partition so a lookup only scans prompts
+        # it can match; every deque holds (expires_at, unit vector, response),
+        # oldest first, and _semantic_order lists (expires_at, partition) across
+        # all partitions so expiry and eviction always drop the globally oldest entry
+        self._semantic: Dict[str, Deque[Tuple[float, array, Any]]] = {}
+        self._semantic_order: Deque[Tuple[float, str]] = deque()
+        self._lock = threading.Lock()
+
+    def _get_model(self, model: Optional[str] = None) -> str:
+        """Get model name from the wrapped client"""
+        return self.client._get_model(model)
+
+    def _keys(
+        self,
+        messages: List[MessageDict],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Tuple[str, Optional[str]]:
+        """Exact-match key and semantic partition key for a request"""
+        # The conversation before the last message is encoded once and hashed
+        # for the partition; the exact key extends that hash with the last message
+        params = [self._get_model(model), temperature, max_tokens]
+        head = hashlib.sha256(_encode_key([params, messages[:-1]]).encode("utf-8"))
+        partition = head.hexdigest()
+        head.update(_encode_key(messages[-1:]).encode("utf-8"))
+        exact = head.hexdigest()
+
+        last = messages[-1] if messages else {}
+        if last.get("role") != "user" or not isinstance(last.get("content"), str):
+            return exact, None
+        return exact, partition
+
+    def _cacheable(self, temperature: Optional[float], kwargs: Dict[str, Any]) -> bool:
+        """Whether a request is deterministic enough to answer from the cache"""
+        return not kwargs and self.client._get_temperature(temperature) == 0
+
+    @staticmethod
+    def _unit_vector(response: Any) -> array:
+        """Normalized embedding from an embedding response, so dot product = cosine"""
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return array("f", (value / norm for value in vector))
+
+    def _drop_oldest(self) -> None:
+        """Remove the oldest semantic entry; caller holds the lock"""
+        _, partition = self._semantic_order.popleft()
+        entries = self._semantic[partition]
+        entries.popleft()
+        if not entries:
+            del self._semantic[partition]
+
+    def _lookup_semantic(self, partition: str, vector: array) -> Optional[Any]:
+        """Most similar cached response in the partition above the threshold"""
+        now = time.monotonic()
+        best_score, best_response = self.similarity_threshold, None
+        with self._lock:
+            # Entries share one TTL, so the expired ones are always the oldest
+            while self._semantic_order and self._semantic_order[0][0] <= now:
+                self._drop_oldest()
+            candidates = list(self._semantic.get(partition, ()))
+        for expires_at, cached_vector, response in candidates:
+            if expires_at <= now or len(cached_vector) != len(vector):
+                continue
+            score = sum(map(operator.mul, cached_vector, vector))
+            if score >= best_score:
+                best_score, best_response = score, response
+        if best_response is not None:
+            logger.debug("Semantic cache hit (similarity {:.3f})", best_score)
+        return best_response
+
+    def _store(
+        self,
+        exact: str,
+        partition: Optional[str],
+        vector: Optional[array],
+        response: Any
+    ) -> None:
+        """Remember a fresh response for both lookup kinds"""
+        self._exact.set(exact, response)
+        if partition is None or vector is None:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._semantic.setdefault(partition, deque()).append((expires_at, vector, response))
+            self._semantic_order.append((expires_at, partition))
+            while len(self._semantic_order) > self.maxsize:
+                self._drop_oldest()
+
+    def chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Synchronous chat completion served from the cache when possible
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional); only 0 is cached
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional API parameters; when given the cache is bypassed
+
+        Returns:
+            Native OpenAI ChatCompletion object (possibly a cached one)
+        """
+        if not self._cacheable(temperature, kwargs):
+            return self.client.chat_completion(messages, model, temperature, max_tokens, **kwargs)
+
+        normalized = self._normalize_messages(messages)
+        exact, partition = self._keys(normalized, model, temperature, max_tokens)
+        response = self._exact.get(exact)
+        if response is not None:
+            return response
+
+        vector = None
+        if partition is not None and self.embedding_client is not None:
+            vector = self._unit_vector(
+                self.embedding_client.create_embeddings(normalized[-1]["content"])
+            )
+            response = self._lookup_semantic(partition, vector)
+            if response is not None:
+                return response
+
+        response = self.client.chat_completion(normalized, model, temperature, max_tokens)
+        self._store(exact, partition, vector, response)
+        return response
+
+    async def async_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Asynchronous chat completion served from the cache when possible
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional); only 0 is cached
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional API parameters; when given the cache is bypassed
+
+        Returns:
+            Native OpenAI ChatCompletion object (possibly a cached one)
+        """
+        if not self._cacheable(temperature, kwargs):
+            return await self.client.async_chat_completion(
+                messages, model, temperature, max_tokens, **kwargs
+            )
+
+        normalized = self._normalize_messages(messages)
+        exact, partition = self._keys(normalized, model, temperature, max_tokens)
+        response = self._exact.get(exact)
+        if response is not None:
+            return response
+
+        vector = None
+        if partition is not None and self.embedding_client is not None:
+            vector = self._unit_vector(
+                await self.embedding_client.async_create_embeddings(normalized[-1]["content"])
+            )
+            response = self._lookup_semantic(partition, vector)
+            if response is not None:
+                return response
+
+        response = await self.client.async_chat_completion(normalized, model, temperature, max_tokens)
+        self._store(exact, partition, vector, response)
+        return response
+
+    def stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Stream from the wrapped client; streamed responses are not cached"""
+        return self.client.stream_chat_completion(messages, model, temperature, max_tokens, **kwargs)
+
+    async def async_stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream from the wrapped client; streamed responses are not cached"""
+        async for delta in self.client.async_stream_chat_completion(
+            messages, model, temperature, max_tokens, **kwargs
+        ):
+            yield delta
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._exact.clear()
+        with self._lock:
+            self._semantic.clear()
+            self._semantic_order.clear()
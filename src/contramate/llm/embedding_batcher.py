@@ -0,0 +1,132 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces single-text embedding requests into batched API calls.
+
+    Texts submitted close together are queued and sent as one
+    ``embeddings.create(input=[...])`` request once either ``max_batch`` texts
+    are pending or ``flush_ms`` milliseconds have passed since the first one
+    arrived. Each caller receives its own embedding back, so per-request
+    overhead is paid once per batch instead of once per text.
+
+    Example:
+        ```python
+        batcher = EmbeddingBatcher(client.async_create_embeddings)
+        embedding = await batcher.submit("termination clause")
+        vector = embedding.embedding
+        ```
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], Awaitable[Any]],
+        max_batch: int = 64,
+        flush_ms: float = 20.0
+    ):
+        """
+        Initialize the batcher
+
+        Args:
+            embed_fn: Async callable taking a list of texts and returning a native
+                OpenAI CreateEmbeddingResponse
+            max_batch: Maximum number of texts sent in one request (default: 64)
+            flush_ms: Maximum time in milliseconds to wait for more texts (default: 20)
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self._embed_fn = embed_fn
+        self.max_batch = max_batch
+        self.flush_interval = flush_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the background flush loop on the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._inflight = set()
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def submit(self, text: str) -> Any:
+        """
+        Queue a text for embedding and wait for its result
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Native OpenAI Embedding object for the text
+        """
+        queue = self._ensure_worker()
+        future = self._loop.create_future()
+        queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued texts into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+            # Dispatch without blocking collection of the next batch
+            task = loop.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Send one batched request and resolve each caller's future"""
+        try:
+            response = await self._embed_fn([text for text, _ in batch])
+        except Exception as e:
+            logger.error("Batched embedding request failed for {} texts: {}", len(batch), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        embeddings = sorted(response.data, key=lambda item: item.index)
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+    async def aclose(self) -> None:
+        """Stop the background loop, cancel queued texts and wait for in-flight batches"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
@@ -1,28 +1,229 @@
-from typing import Optional, Literal
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+from functools import cache, lru_cache, partial
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Literal, Tuple, Type
 from pathlib import Path
 from loguru import logger
+from openai import OpenAI, AsyncOpenAI, AzureOpenAI, AsyncAzureOpenAI
+from pydantic import BaseModel
 
 from contramate.utils.settings.factory import settings_factory
-from contramate.utils.settings.core import AppSettings, OpenAISettings
+from contramate.utils.settings.core import AOAICertSettings, AppSettings, OpenAISettings
+from contramate.utils.auth.certificate_provider import close_cert_token_providers, get_cert_token_provider
 from contramate.llm.base import BaseChatClient, BaseEmbeddingClient
+from contramate.llm.embedding_batcher import EmbeddingBatcher
 from contramate.llm.openai_client import OpenAIChatClient
 from contramate.llm.openai_embedding_client import OpenAIEmbeddingClient
 from contramate.llm.azure_openai_client import AzureOpenAIChatClient
 from contramate.llm.azure_openai_embedding_client import AzureOpenAIEmbeddingClient
-from openai import OpenAI, AsyncOpenAI, AzureOpenAI, AsyncAzureOpenAI
-from contramate.utils.auth.certificate_provider import get_cert_token_provider
+from contramate.llm.http_clients import (
+    LoopLocal,
+    aclose_shared_http_clients,
+    close_shared_http_clients,
+    shared_async_http_client,
+    shared_http_client,
+)
 
 ClientType = Literal["openai", "azure_openai"]
 
 
+# Wrapper client class per provider, for chat and embeddings
+_CHAT_REGISTRY: Dict[str, Type[BaseChatClient]] = {
+    "openai": OpenAIChatClient,
+    "azure_openai": AzureOpenAIChatClient,
+}
+_EMBED_REGISTRY: Dict[str, Type[BaseEmbeddingClient]] = {
+    "openai": OpenAIEmbeddingClient,
+    "azure_openai": AzureOpenAIEmbeddingClient,
+}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable equivalent of a value; pydantic models are keyed by their field values
+
+    Raises:
+        TypeError: If the value has no stable hashable form
+    """
+    if isinstance(value, BaseModel):
+        return (type(value), _freeze(value.model_dump()))
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def _kwargs_key(kwargs: Dict[str, Any]) -> Optional[Tuple[Tuple[str, Hashable], ...]]:
+    """Hashable cache key for client kwargs, or None when a value cannot be keyed by content"""
+    try:
+        return tuple((name, _freeze(value)) for name, value in sorted(kwargs.items()))
+    except TypeError:
+        return None
+
+
+# Settings are parsed from the environment / .env once per process and env file;
+# call e.g. _app_settings.cache_clear() to pick up changed values
+@cache
+def _app_settings(env_path: Optional[str | Path] = None) -> AppSettings:
+    """App settings from the environment or the given env file"""
+    if env_path:
+        return AppSettings.from_env_file(env_path)
+    return settings_factory.create_app_settings()
+
+
+@cache
+def _openai_settings(env_path: Optional[str | Path] = None) -> OpenAISettings:
+    """OpenAI settings from the environment or the given env file"""
+    if env_path:
+        return OpenAISettings.from_env_file(env_path)
+    return settings_factory.create_openai_settings()
+
+
+@cache
+def _azure_openai_settings(env_path: Optional[str | Path] = None) -> AOAICertSettings:
+    """Azure OpenAI settings from the environment or the given env file"""
+    if env_path:
+        return AOAICertSettings.from_env_file(env_path)
+    return settings_factory.create_azure_openai_settings()
+
+
+def _openai_defaults() -> Tuple[Optional[str], str, str]:
+    """(api_key, model, embedding_model) from OpenAI settings"""
+    settings = _openai_settings()
+    return settings.api_key, settings.model, settings.embedding_model
+
+
+def _azure_openai_defaults() -> Tuple[Optional[str], str, str]:
+    """(api_key, model, embedding_model) from Azure OpenAI settings"""
+    settings = _azure_openai_settings()
+    # Azure uses certificate-based auth
+    return None, settings.model, settings.embedding_model
+
+
+# Settings-backed defaults of factories made by LLMClientFactory.create_from_default
+_DEFAULTS: Dict[str, Callable[[], Tuple[Optional[str], str, str]]] = {
+    "openai": _openai_defaults,
+    "azure_openai": _azure_openai_defaults,
+}
+
+
+class _OpenAIConfig(NamedTuple):
+    """Hashable constructor arguments of an OpenAI / AsyncOpenAI client"""
+    api_key: str
+    base_url: Optional[str]
+
+
+class _AzureOpenAIConfig(NamedTuple):
+    """Hashable constructor arguments of an AzureOpenAI / AsyncAzureOpenAI client"""
+    azure_endpoint: str
+    api_version: str
+    # Memoized per identity by get_cert_token_provider, so equal settings hash equal
+    azure_ad_token_provider: Callable[[], str]
+
+
+def _new_openai(config: _OpenAIConfig, async_mode: bool, http_client: Any) -> AsyncOpenAI | OpenAI:
+    """OpenAI SDK client for a configuration on http_client (None: a pool of its own)"""
+    # (sync, async) pairs indexed by async_mode
+    client_cls = (OpenAI, AsyncOpenAI)[async_mode]
+
+    logger.info("Creating {}", client_cls.__name__)
+    client_config = {"api_key": config.api_key}
+    if config.base_url:
+        client_config["base_url"] = config.base_url
+    return client_cls(**client_config, http_client=http_client)
+
+
+def _new_azure_openai(config: _AzureOpenAIConfig, async_mode: bool, http_client: Any) -> AsyncAzureOpenAI | AzureOpenAI:
+    """Azure OpenAI SDK client for a configuration on http_client (None: a pool of its own)"""
+    client_cls = (AzureOpenAI, AsyncAzureOpenAI)[async_mode]
+
+    logger.info("Creating {}", client_cls.__name__)
+    return client_cls(**config._asdict(), http_client=http_client)
+
+
+@lru_cache(maxsize=32)
+def _shared_sdk_client(build: Callable[..., Any], config: Hashable, async_mode: bool) -> Any:
+    """
+    SDK client for a configuration, built once and shared by every caller
+
+    Async clients are bound to an event loop through their pool, so for them
+    the cached value is a LoopLocal building one per loop on its shared pool.
+    """
+    if async_mode:
+        return LoopLocal(lambda: build(config, True, shared_async_http_client()))
+    return build(config, False, shared_http_client())
+
+
+def _memoized_client(build: Callable[..., Any], config: Hashable, async_mode: bool) -> Any:
+    """
+    Shared SDK client for a configuration
+
+    Async clients are shared per running event loop; outside one there is no
+    loop to bind a shared pool to, so an async client with its own pool is
+    returned.
+    """
+    if not async_mode:
+        return _shared_sdk_client(build, config, False)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return build(config, True, None)
+    return _shared_sdk_client(build, config, True).get()
+
+
+def prewarm_client(client: Any) -> None:
+    """
+    Open a pooled connection for a wrapper client's sync SDK client
+
+    Issues a cheap ``models.list()`` request so DNS, TCP and TLS setup happen
+    now instead of on the first real request. Failures are logged, not raised.
+
+    Args:
+        client: Wrapper client exposing ``_sync_client``
+    """
+    try:
+        client._sync_client.models.list()
+    except Exception as e:
+        logger.warning("Pre-warming {} failed: {}", type(client).__name__, e)
+
+
+async def aprewarm_client(client: Any) -> None:
+    """
+    Open a pooled connection for a wrapper client's async SDK client
+
+    Args:
+        client: Wrapper client exposing ``_async_client``
+    """
+    try:
+        await client._async_client.models.list()
+    except Exception as e:
+        logger.warning("Pre-warming {} failed: {}", type(client).__name__, e)
+
 class LLMVanillaClientFactory:
     """
     Factory for creating vanilla OpenAI SDK clients (not wrapper classes).
 
     Returns raw OpenAI SDK clients that can handle both chat and embeddings
     with the same client instance by specifying different models.
+
+    SDK clients are memoized per configuration (credentials, endpoint and
+    mode) and shared by all factory instances, so their connection pools are
+    reused; changed settings produce a new client.
     """
 
+    __slots__ = ("env_path", "_provider")
+
+    # SDK client builder method per provider
+    _BUILDERS: Dict[str, str] = {
+        "openai": "_create_openai_client",
+        "azure_openai": "_create_azure_client",
+    }
+
     def __init__(self, env_path: Optional[str | Path] = None):
         """
         Initialize vanilla client factory.
@@ -33,6 +234,7 @@ class LLMVanillaClientFactory:
         Provider is automatically determined from APP_LLM_PROVIDER environment variable.
         """
         self.env_path = env_path
+        self._provider: Optional[str] = None
 
     @classmethod
     def from_env_file(cls, env_path: str | Path) -> "LLMVanillaClientFactory":
@@ -57,7 +259,10 @@ class LLMVanillaClientFactory:
         Get vanilla OpenAI SDK client (sync or async).
 
         Returns the raw OpenAI SDK client that can handle both chat completions
-        and embeddings by specifying different models.
+        and embeddings by specifying different models. The client is built on
+        the first call and returned from the cache afterwards; async clients
+        are cached per running event loop, and one requested outside an event
+        loop gets its own connection pool.
 
         Args:
             async_mode: If True, returns AsyncOpenAI/AsyncAzureOpenAI,
@@ -67,82 +272,85 @@ class LLMVanillaClientFactory:
             OpenAI | AzureOpenAI | AsyncOpenAI | AsyncAzureOpenAI
         """
 
-        # Determine provider from environment
+        provider = self._resolve_provider()
+        builder_name = self._BUILDERS.get(provider)
+        if builder_name is None:
+            raise ValueError(f"Unknown provider: {provider}. Use 'openai' or 'azure_openai'")
+        return getattr(self, builder_name)(async_mode)
+
+    def _resolve_provider(self) -> str:
+        """Provider from APP_LLM_PROVIDER, read once per factory instance"""
+        if self._provider is None:
+            try:
+                app_settings = _app_settings(self.env_path)
+                self._provider = app_settings.llm_provider.lower()
+            except Exception as e:
+                logger.warning("Failed to get APP_LLM_PROVIDER, defaulting to 'openai': {}", e)
+                self._provider = "openai"
+        return self._provider
+
+    def prewarm(self) -> None:
+        """
+        Open a connection in the sync client's pool
+
+        Issues a cheap ``models.list()`` request so DNS, TCP and TLS setup
+        happen at startup instead of on the first real request. Failures are
+        logged, not raised.
+        """
         try:
-            if self.env_path:
-                app_settings = AppSettings.from_env_file(self.env_path)
-            else:
-                app_settings = settings_factory.create_app_settings()
-            provider = app_settings.llm_provider.lower()
+            self.get_default_client(async_mode=False).models.list()
         except Exception as e:
-            logger.warning(f"Failed to get APP_LLM_PROVIDER, defaulting to 'openai': {e}")
-            provider = "openai"
+            logger.warning("Pre-warming vanilla sync client failed: {}", e)
 
-        logger.info(f"Creating vanilla {'async' if async_mode else 'sync'} client for provider: {provider}")
+    async def aprewarm(self, connections: int = 4) -> None:
+        """
+        Open ``connections`` connections in the async client's pool in parallel
 
-        # Create clients based on provider
-        if provider == "openai":
-            return self._create_openai_client(async_mode)
-        elif provider == "azure_openai":
-            return self._create_azure_client(async_mode)
-        else:
-            raise ValueError(f"Unknown provider: {provider}. Use 'openai' or 'azure_openai'")
+        Args:
+            connections: Concurrent warm-up requests, i.e. keep-alive connections
+                ready for the first burst of traffic (default: 4)
+        """
+        try:
+            # Load settings off the loop, then take this loop's async client
+            await asyncio.to_thread(self.get_default_client, False)
+            client = self.get_default_client(async_mode=True)
+            await asyncio.gather(*(client.models.list() for _ in range(connections)))
+        except Exception as e:
+            logger.warning("Pre-warming vanilla async client failed: {}", e)
 
     def _create_openai_client(self, async_mode: bool) -> AsyncOpenAI | OpenAI:
         """Create OpenAI vanilla client"""
-
         try:
-            if self.env_path:
-                openai_settings = OpenAISettings.from_env_file(self.env_path)
-            else:
-                openai_settings = settings_factory.create_openai_settings()
+            openai_settings = _openai_settings(self.env_path)
 
             if not openai_settings.api_key:
                 raise ValueError("OPENAI_API_KEY is required")
 
-            client_config = {"api_key": openai_settings.api_key}
-            if openai_settings.base_url:
-                client_config["base_url"] = openai_settings.base_url
-
-            if async_mode:
-                return AsyncOpenAI(**client_config)
-            else:
-                return OpenAI(**client_config)
+            config = _OpenAIConfig(openai_settings.api_key, openai_settings.base_url)
+            return _memoized_client(_new_openai, config, async_mode)
 
         except Exception as e:
-            logger.error(f"Failed to create OpenAI vanilla client: {e}")
+            logger.error("Failed to create OpenAI vanilla client: {}", e)
             raise ValueError(f"Failed to create OpenAI client: {e}")
 
     def _create_azure_client(self, async_mode: bool) -> AsyncAzureOpenAI | AzureOpenAI:
         """Create Azure OpenAI vanilla client"""
-        from openai import AzureOpenAI, AsyncAzureOpenAI
-
         try:
-            if self.env_path:
-                from contramate.utils.settings.core import AOAICertSettings
-                azure_settings = AOAICertSettings.from_env_file(self.env_path)
-            else:
-                azure_settings = settings_factory.create_azure_openai_settings()
+            azure_settings = _azure_openai_settings(self.env_path)
 
             if not azure_settings.azure_endpoint:
                 raise ValueError("AZURE_OPENAI_AZURE_ENDPOINT is required")
 
             # Get certificate-based token provider
-            
-            token_provider = get_cert_token_provider(azure_settings)
-            client_config = {
-                "azure_endpoint": azure_settings.azure_endpoint,
-                "api_version": azure_settings.api_version,
-                "azure_ad_token_provider": token_provider
-            }
-
-            if async_mode:
-                return AsyncAzureOpenAI(**client_config)
-            else:
-                return AzureOpenAI(**client_config)
+            config = _AzureOpenAIConfig(
+                azure_settings.azure_endpoint,
+                azure_settings.api_version,
+                get_cert_token_provider(azure_settings)
+            )
+            return _memoized_client(_new_azure_openai, config, async_mode)
 
         except Exception as e:
-            logger.error(f"Failed to create Azure OpenAI vanilla client: {e}")
+            logger.error("Failed to create Azure OpenAI vanilla client: {}", e)
             raise ValueError(f"Failed to create Azure OpenAI client: {e}")
 
 
@@ -153,6 +361,17 @@ class LLMClientFactory:
     Automatically initializes settings from AppSettings.
     """
 
+    __slots__ = (
+        "default_client_type",
+        "_api_key",
+        "_model",
+        "_embedding_model",
+        "_defaults_loader",
+        "_chat_cache",
+        "_embed_cache",
+        "_cache_lock",
+    )
+
     def __init__(
         self,
         default_client_type: ClientType = "openai",
@@ -168,47 +387,66 @@ class LLMClientFactory:
             api_key: Optional API key (will use settings if not provided)
             model: Optional default model name (will use settings if not provided)
             embedding_model: Optional default embedding model (will use settings if not provided)
+
+        Clients use the process-wide connection pools (see
+        contramate.llm.http_clients; size them with configure_http_pool), so
+        keep-alive connections and their TLS sessions are shared across
+        clients and factories.
         """
         self.default_client_type = default_client_type
         self._api_key = api_key
         self._model = model
         self._embedding_model = embedding_model
+        # Set by create_from_default; settings are read on first use
+        self._defaults_loader: Optional[Callable[[], Tuple[Optional[str], str, str]]] = None
 
-        logger.info(f"LLMClientFactory initialized with default client type: {default_client_type}")
+        # Clients are reused per configuration so their connection pools are shared
+        self._chat_cache: Dict[tuple, BaseChatClient] = {}
+        self._embed_cache: Dict[tuple, BaseEmbeddingClient] = {}
+        self._cache_lock = threading.Lock()
+
+        logger.info("LLMClientFactory initialized with default client type: {}", default_client_type)
 
     @classmethod
     def create_from_default(cls, client_type: ClientType = "openai") -> "LLMClientFactory":
         """
         Create factory from default AppSettings configuration
 
+        Settings are not read here but when the first client that needs them
+        is created, so overriding api_key / model per call never loads them.
+
         Args:
             client_type: Client type to use as default
 
         Returns:
             LLMClientFactory instance initialized with settings
+
+        Raises:
+            ValueError: If client_type is not supported
         """
-        logger.info(f"Creating LLMClientFactory from default settings for client type: {client_type}")
-
-        # Initialize appropriate settings based on client type
-        if client_type == "openai":
-            openai_settings = settings_factory.create_openai_settings()
-            api_key = openai_settings.api_key
-            model = openai_settings.model
-            embedding_model = openai_settings.embedding_model
-        elif client_type == "azure_openai":
-            azure_settings = settings_factory.create_azure_openai_settings()
-            api_key = None  # Azure uses certificate-based auth
-            model = azure_settings.model
-            embedding_model = azure_settings.embedding_model
-        else:
+        logger.info("Creating LLMClientFactory from default settings for client type: {}", client_type)
+
+        loader = _DEFAULTS.get(client_type)
+        if loader is None:
             raise ValueError(f"Unsupported client type: {client_type}")
 
-        return cls(
-            default_client_type=client_type,
-            api_key=api_key,
-            model=model,
-            embedding_model=embedding_model
-        )
+        factory = cls(default_client_type=client_type)
+        factory._defaults_loader = loader
+        return factory
+
+    def _apply_defaults(self) -> None:
+        """Fill unset defaults from settings, once"""
+        loader = self._defaults_loader
+        if loader is None:
+            return
+        with self._cache_lock:
+            if self._defaults_loader is None:
+                return
+            api_key, model, embedding_model = loader()
+            self._api_key = self._api_key or api_key
+            self._model = self._model or model
+            self._embedding_model = self._embedding_model or embedding_model
+            self._defaults_loader = None
 
     def create_client(
         self,
@@ -220,6 +458,11 @@ class LLMClientFactory:
         """
         Create a chat client
 
+        Clients are cached per (client type, API key, model, kwargs): repeated
+        calls with the same configuration return the same instance, so its
+        connection pool is reused. Pydantic settings in kwargs are compared by
+        value; calls with other unhashable kwargs are not cached.
+
         Args:
             client_type: Type of client to create (uses default if not specified)
             api_key: API key override
@@ -230,28 +473,57 @@ class LLMClientFactory:
             BaseChatClient instance
         """
         client_type = client_type or self.default_client_type
+        if not (api_key and model):
+            self._apply_defaults()
         api_key = api_key or self._api_key
         model = model or self._model
 
-        logger.info(f"Creating chat client of type: {client_type}")
+        kwargs_key = _kwargs_key(kwargs)
+        if kwargs_key is None:
+            # Unhashable kwargs give no stable key; build without caching
+            return self._build_client(client_type, api_key, model, **kwargs)
+
+        key = (client_type, api_key, model, kwargs_key)
+        client = self._chat_cache.get(key)
+        if client is not None:
+            return client
+
+        with self._cache_lock:
+            # Another thread may have created it while we waited for the lock
+            client = self._chat_cache.get(key)
+            if client is None:
+                client = self._build_client(client_type, api_key, model, **kwargs)
+                self._chat_cache[key] = client
+            return client
+
+    def _build_client(
+        self,
+        client_type: ClientType,
+        api_key: Optional[str],
+        model: Optional[str],
+        **kwargs
+    ) -> BaseChatClient:
+        """Construct a new chat client (uncached)"""
+        client_cls = _CHAT_REGISTRY.get(client_type)
+        if client_cls is None:
+            raise ValueError(f"Unsupported client type: {client_type}")
+
+        logger.info("Creating chat client of type: {}", client_type)
+        return client_cls(
+            **self._auth_kwargs(client_type, api_key, kwargs),
+            model=model
+        )
 
-        if client_type == "openai":
-            return OpenAIChatClient(
-                api_key=api_key,
-                model=model
-            )
-        elif client_type == "azure_openai":
+    @staticmethod
+    def _auth_kwargs(client_type: ClientType, api_key: Optional[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Provider-specific authentication arguments for a wrapper client"""
+        if client_type == "azure_openai":
+            # Create settings from factory if not provided
             azure_ad_cert_settings = kwargs.get("azure_ad_cert_settings")
-            if not azure_ad_cert_settings:
-                # Create settings from factory if not provided
-                azure_ad_cert_settings = settings_factory.create_azure_openai_settings()
-
-            return AzureOpenAIChatClient(
-                azure_ad_cert_settings=azure_ad_cert_settings,
-                model=model
-            )
-        else:
-            raise ValueError(f"Unsupported client type: {client_type}")
+            return {
+                "azure_ad_cert_settings": azure_ad_cert_settings or _azure_openai_settings()
+            }
+        return {"api_key": api_key, "openai_settings": _openai_settings()}
 
     def create_embedding_client(
         self,
@@ -263,6 +535,9 @@ class LLMClientFactory:
         """
         Create an embedding client
 
+        Clients are cached per (client type, API key, model, kwargs) like
+        create_client.
+
         Args:
             client_type: Type of client to create (uses default if not specified)
             api_key: API key override
@@ -273,57 +548,268 @@ class LLMClientFactory:
             BaseEmbeddingClient instance
         """
         client_type = client_type or self.default_client_type
+        if not (api_key and embedding_model):
+            self._apply_defaults()
         api_key = api_key or self._api_key
         embedding_model = embedding_model or self._embedding_model
 
-        logger.info(f"Creating embedding client of type: {client_type}")
+        kwargs_key = _kwargs_key(kwargs)
+        if kwargs_key is None:
+            # Unhashable kwargs give no stable key; build without caching
+            return self._build_embedding_client(client_type, api_key, embedding_model, **kwargs)
 
-        if client_type == "openai":
-            return OpenAIEmbeddingClient(
-                api_key=api_key,
-                embedding_model=embedding_model
-            )
-        elif client_type == "azure_openai":
-            azure_ad_cert_settings = kwargs.get("azure_ad_cert_settings")
-            if not azure_ad_cert_settings:
-                # Create settings from factory if not provided
-                azure_ad_cert_settings = settings_factory.create_azure_openai_settings()
+        key = (client_type, api_key, embedding_model, kwargs_key)
+        client = self._embed_cache.get(key)
+        if client is not None:
+            return client
 
-            return AzureOpenAIEmbeddingClient(
-                azure_ad_cert_settings=azure_ad_cert_settings,
-                embedding_model=embedding_model
-            )
-        else:
+        with self._cache_lock:
+            client = self._embed_cache.get(key)
+            if client is None:
+                client = self._build_embedding_client(client_type, api_key, embedding_model, **kwargs)
+                self._embed_cache[key] = client
+            return client
+
+    def _build_embedding_client(
+        self,
+        client_type: ClientType,
+        api_key: Optional[str],
+        embedding_model: Optional[str],
+        **kwargs
+    ) -> BaseEmbeddingClient:
+        """Construct a new embedding client (uncached)"""
+        client_cls = _EMBED_REGISTRY.get(client_type)
+        if client_cls is None:
             raise ValueError(f"Unsupported client type: {client_type}")
 
+        logger.info("Creating embedding client of type: {}", client_type)
+        return client_cls(
+            **self._auth_kwargs(client_type, api_key, kwargs),
+            embedding_model=embedding_model
+        )
+
+    def prewarm(self) -> None:
+        """
+        Create and cache the default chat and embedding clients and open a
+        connection in the shared sync pool
+
+        Call at startup so the first request does not pay for settings loading,
+        client construction and the TLS handshake.
+        """
+        chat_client = self.create_client()
+        self.create_embedding_client()
+        prewarm_client(chat_client)
+
+    async def aprewarm(self) -> None:
+        """Async variant of prewarm, opening a connection in the shared async pool"""
+        # Settings loading and certificate token setup are blocking
+        chat_client = await asyncio.to_thread(self.create_client)
+        await asyncio.to_thread(self.create_embedding_client)
+        await aprewarm_client(chat_client)
+
+    def close(self) -> None:
+        """
+        Forget cached clients
+
+        The connection pools are process-wide and released by
+        shutdown_llm_factory / ashutdown_llm_factory (automatically at exit).
+        """
+        with self._cache_lock:
+            self._chat_cache.clear()
+            self._embed_cache.clear()
+
+    async def aclose(self) -> None:
+        """Async variant of close"""
+        self.close()
+
+    def __enter__(self) -> LLMClientFactory:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> LLMClientFactory:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+# Process-wide factories behind the convenience functions, one per client type
+_default_factories: Dict[str, "LLMClientFactory"] = {}
+_default_factories_lock = threading.Lock()
+
+
+def _prewarm_enabled() -> bool:
+    """Whether APP_LLM_PREWARM asks for connections to be opened up front"""
+    try:
+        return _app_settings().llm_prewarm
+    except Exception:
+        return False
+
+
+def _get_default_factory(client_type: ClientType) -> "LLMClientFactory":
+    """
+    Factory built from default settings, created once per process and client type
+
+    With APP_LLM_PREWARM=1 the new factory's default clients are created and a
+    connection is opened before it is returned.
+    """
+    factory = _default_factories.get(client_type)
+    if factory is None:
+        created = False
+        with _default_factories_lock:
+            factory = _default_factories.get(client_type)
+            if factory is None:
+                factory = LLMClientFactory.create_from_default(client_type)
+                _default_factories[client_type] = factory
+                created = True
+        if created and _prewarm_enabled():
+            factory.prewarm()
+    return factory
+
+
+def _reset_after_fork() -> None:
+    """Drop factories inherited from the parent; their pooled sockets are shared with it"""
+    global _default_factories_lock
+    _default_factories.clear()
+    _default_factories_lock = threading.Lock()
+    _shared_sdk_client.cache_clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _forget_cached_clients() -> List[LLMClientFactory]:
+    """Drop every module-level client and settings cache; return the dropped factories"""
+    with _default_factories_lock:
+        factories = list(_default_factories.values())
+        _default_factories.clear()
+    _shared_sdk_client.cache_clear()
+    _app_settings.cache_clear()
+    _openai_settings.cache_clear()
+    _azure_openai_settings.cache_clear()
+    return factories
+
+
+def shutdown_llm_factory() -> None:
+    """
+    Release the clients and connection pools cached by this module
+
+    Drops the default factories and the memoized vanilla SDK clients, closes
+    the shared sync pool behind all of them, stops the certificate token
+    refresh threads and clears the settings caches.
+    Clients handed out before the call must not be used afterwards. Runs
+    automatically at exit; async applications should prefer
+    ashutdown_llm_factory on shutdown, which also closes the running event
+    loop's async pool.
+    """
+    for factory in _forget_cached_clients():
+        factory.close()
+    close_shared_http_clients()
+    close_cert_token_providers()
+
+
+async def ashutdown_llm_factory() -> None:
+    """Async variant of shutdown_llm_factory, closing the running event loop's async pool as well"""
+    for factory in _forget_cached_clients():
+        await factory.aclose()
+    await aclose_shared_http_clients()
+    close_cert_token_providers()
+
+
+atexit.register(shutdown_llm_factory)
+
 
 # Convenience functions for quick client creation
 def create_default_chat_client(client_type: ClientType = "openai") -> BaseChatClient:
     """
     Convenience function to create a chat client with default settings
 
+    Settings are loaded once per process; repeated calls return the same
+    client, sharing its connection pool.
+
     Args:
         client_type: Type of client to create (default: "openai")
 
     Returns:
         BaseChatClient instance
     """
-    factory = LLMClientFactory.create_from_default(client_type)
-    return factory.create_client()
+    return _get_default_factory(client_type).create_client()
 
 
 def create_default_embedding_client(client_type: ClientType = "openai") -> BaseEmbeddingClient:
     """
     Convenience function to create an embedding client with default settings
 
+    Settings are loaded once per process; repeated calls return the same
+    client, sharing its connection pool.
+
     Args:
         client_type: Type of client to create (default: "openai")
 
     Returns:
         BaseEmbeddingClient instance
     """
-    factory = LLMClientFactory.create_from_default(client_type)
-    return factory.create_embedding_client()
+    return _get_default_factory(client_type).create_embedding_client()
+
+
+def _provider_available(provider: str) -> bool:
+    """Whether the provider's required settings are present, without building a client"""
+    try:
+        if provider == "openai":
+            return bool(_openai_settings().api_key)
+        if provider == "azure_openai":
+            settings = _azure_openai_settings()
+            return bool(settings.azure_endpoint and settings.private_cert_key and settings.public_cert_key)
+    except Exception as e:
+        logger.debug("Settings for provider {} are not usable: {}", provider, e)
+    return False
+
+
+def _provider_order() -> List[str]:
+    """
+    Providers to try: the configured APP_LLM_PROVIDER first, then the others
+
+    Providers whose required settings are missing are left out, so a
+    misconfigured provider fails fast instead of attempting a client build.
+    """
+    providers = ["openai", "azure_openai"]
+    try:
+        provider = _app_settings().llm_provider.lower()
+    except Exception as e:
+        logger.warning("Failed to get app settings, trying OpenAI first: {}", e)
+        provider = "openai"
+    if provider not in providers:
+        logger.warning("Unknown LLM provider '{}', trying OpenAI first", provider)
+        provider = "openai"
+
+    ordered = [provider] + [p for p in providers if p != provider]
+    available = [p for p in ordered if _provider_available(p)]
+    for skipped in set(ordered) - set(available):
+        logger.warning("Skipping LLM provider {}: required settings are missing", skipped)
+    return available
+
+
+def _first_successful(builders: List[Tuple[str, Callable[[], Any]]], what: str, error: str) -> Any:
+    """
+    Return the result of the first builder that succeeds
+
+    Args:
+        builders: (provider, builder) pairs in the order to try
+        what: Description of what is built, for log messages
+        error: Message of the ValueError raised when every builder fails
+
+    Raises:
+        ValueError: If no builder succeeds
+    """
+    for provider, build in builders:
+        try:
+            logger.info("Creating {} with provider: {}", what, provider)
+            return build()
+        except Exception as e:
+            logger.warning("Failed to create {} with provider {}: {}", what, provider, e)
+    raise ValueError(error)
 
 
 def create_vanilla_chat_client() -> BaseChatClient:
@@ -344,36 +830,9 @@ def create_vanilla_chat_client() -> BaseChatClient:
         >>> client = create_vanilla_chat_client()
         >>> response = client.chat_completion([{"role": "user", "content": "Hello"}])
     """
-    try:
-        app_settings = settings_factory.create_app_settings()
-        provider = app_settings.llm_provider.lower()
-
-        logger.info(f"Creating vanilla chat client with provider: {provider}")
-
-        if provider == "openai":
-            return create_default_chat_client(client_type="openai")
-        elif provider == "azure_openai":
-            return create_default_chat_client(client_type="azure_openai")
-        else:
-            logger.warning(f"Unknown LLM provider '{provider}', trying OpenAI first")
-
-    except Exception as e:
-        logger.warning(f"Failed to get app settings or create client with configured provider: {e}")
-
-    # Fallback: Try OpenAI first, then Azure OpenAI
-    try:
-        logger.info("Attempting to create OpenAI chat client as fallback")
-        return create_default_chat_client(client_type="openai")
-    except Exception as e:
-        logger.warning(f"Failed to create OpenAI client: {e}")
-
-    try:
-        logger.info("Attempting to create Azure OpenAI chat client as fallback")
-        return create_default_chat_client(client_type="azure_openai")
-    except Exception as e:
-        logger.warning(f"Failed to create Azure OpenAI client: {e}")
-
-    raise ValueError(
+    return _first_successful(
+        [(p, partial(create_default_chat_client, client_type=p)) for p in _provider_order()],
+        "vanilla chat client",
         "No valid LLM provider could be initialized. "
         "Please configure OPENAI_API_KEY or Azure OpenAI settings. "
         "You can also set APP_LLM_PROVIDER to 'openai' or 'azure_openai'."
@@ -410,27 +869,21 @@ def get_vanilla_openai_client():
         ...         messages=[{"role": "user", "content": "Hello"}]
         ...     )
     """
-    from openai import OpenAI, AsyncOpenAI
-
     try:
-        openai_settings = settings_factory.create_openai_settings()
+        openai_settings = _openai_settings()
 
         if not openai_settings.api_key:
             raise ValueError("OPENAI_API_KEY is required")
 
-        client_config = {"api_key": openai_settings.api_key}
-
-        if openai_settings.base_url:
-            client_config["base_url"] = openai_settings.base_url
-
-        sync_client = OpenAI(**client_config)
-        async_client = AsyncOpenAI(**client_config)
+        config = _OpenAIConfig(openai_settings.api_key, openai_settings.base_url)
+        sync_client = _memoized_client(_new_openai, config, False)
+        async_client = _memoized_client(_new_openai, config, True)
 
         logger.info("Created native OpenAI SDK clients (sync + async)")
         return sync_client, async_client
 
     except Exception as e:
-        logger.error(f"Failed to create native OpenAI clients: {e}")
+        logger.error("Failed to create native OpenAI clients: {}", e)
         raise ValueError(
             f"Failed to create native OpenAI clients: {e}. "
             "Please ensure OPENAI_API_KEY is set."
@@ -460,33 +913,27 @@ def get_vanilla_azure_openai_client():
         ...     messages=[{"role": "user", "content": "Hello"}]
         ... )
     """
-    from openai import AzureOpenAI, AsyncAzureOpenAI
-
     try:
-        azure_settings = settings_factory.create_azure_openai_settings()
+        azure_settings = _azure_openai_settings()
 
         if not azure_settings.azure_endpoint:
             raise ValueError("AZURE_OPENAI_AZURE_ENDPOINT is required")
 
         # Get certificate-based token provider
         try:
-            from contramate.utils.auth.certificate_provider import get_cert_token_provider
-            token_provider = get_cert_token_provider(azure_settings)
-
-            client_config = {
-                "azure_endpoint": azure_settings.azure_endpoint,
-                "api_version": azure_settings.api_version,
-                "azure_ad_token_provider": token_provider
-            }
-
-            sync_client = AzureOpenAI(**client_config)
-            async_client = AsyncAzureOpenAI(**client_config)
+            config = _AzureOpenAIConfig(
+                azure_settings.azure_endpoint,
+                azure_settings.api_version,
+                get_cert_token_provider(azure_settings)
+            )
+            sync_client = _memoized_client(_new_azure_openai, config, False)
+            async_client = _memoized_client(_new_azure_openai, config, True)
 
             logger.info("Created native Azure OpenAI SDK clients (sync + async) with certificate auth")
             return sync_client, async_client
 
         except Exception as cert_error:
-            logger.warning(f"Certificate auth failed: {cert_error}, trying API key if available")
+            logger.warning("Certificate auth failed: {}, trying API key if available", cert_error)
 
             # Fallback to API key if available (though not in settings, might be set manually)
             raise ValueError(
@@ -495,7 +942,7 @@ def get_vanilla_azure_openai_client():
             )
 
     except Exception as e:
-        logger.error(f"Failed to create native Azure OpenAI clients: {e}")
+        logger.error("Failed to create native Azure OpenAI clients: {}", e)
         raise ValueError(
             f"Failed to create native Azure OpenAI clients: {e}. "
             "Please ensure Azure OpenAI settings are properly configured."
@@ -532,40 +979,36 @@ def get_vanilla_native_clients():
         ...         messages=[{"role": "user", "content": "Hello"}]
         ...     )
     """
-    try:
-        app_settings = settings_factory.create_app_settings()
-        provider = app_settings.llm_provider.lower()
+    native_builders = {
+        "openai": get_vanilla_openai_client,
+        "azure_openai": get_vanilla_azure_openai_client,
+    }
+    return _first_successful(
+        [(p, native_builders[p]) for p in _provider_order()],
+        "native SDK clients",
+        "No valid LLM provider could be initialized. "
+        "Please configure OPENAI_API_KEY or Azure OpenAI settings. "
+        "You can also set APP_LLM_PROVIDER to 'openai' or 'azure_openai'."
+    )
 
-        logger.info(f"Getting native SDK clients for provider: {provider}")
 
-        if provider == "openai":
-            return get_vanilla_openai_client()
-        elif provider == "azure_openai":
-            return get_vanilla_azure_openai_client()
-        else:
-            logger.warning(f"Unknown LLM provider '{provider}', trying OpenAI first")
+async def get_vanilla_native_clients_async():
+    """
+    Async variant of get_vanilla_native_clients
 
-    except Exception as e:
-        logger.warning(f"Failed to get app settings or create clients with configured provider: {e}")
+    Settings parsing and certificate loading are blocking, so the provider
+    fallback runs in a worker thread first; the clients are then taken from
+    the warmed caches on the event loop, so the async client uses this
+    loop's shared pool.
 
-    # Fallback: Try OpenAI first, then Azure OpenAI
-    try:
-        logger.info("Attempting to create native OpenAI clients as fallback")
-        return get_vanilla_openai_client()
-    except Exception as e:
-        logger.warning(f"Failed to create native OpenAI clients: {e}")
-
-    try:
-        logger.info("Attempting to create native Azure OpenAI clients as fallback")
-        return get_vanilla_azure_openai_client()
-    except Exception as e:
-        logger.warning(f"Failed to create native Azure OpenAI clients: {e}")
+    Returns:
+        tuple: (sync_client, async_client) - Native OpenAI or Azure OpenAI SDK clients
 
-    raise ValueError(
-        "No valid LLM provider could be initialized. "
-        "Please configure OPENAI_API_KEY or Azure OpenAI settings. "
-        "You can also set APP_LLM_PROVIDER to 'openai' or 'azure_openai'."
-    )
+    Raises:
+        ValueError: If no valid LLM provider can be initialized
+    """
+    await asyncio.to_thread(get_vanilla_native_clients)
+    return get_vanilla_native_clients()
 
 
 def create_vanilla_embedding_client() -> BaseEmbeddingClient:
@@ -586,52 +1029,49 @@ def create_vanilla_embedding_client() -> BaseEmbeddingClient:
         >>> client = create_vanilla_embedding_client()
         >>> response = client.create_embeddings("Hello world")
     """
-    try:
-        app_settings = settings_factory.create_app_settings()
-        provider = app_settings.llm_provider.lower()
+    return _first_successful(
+        [(p, partial(create_default_embedding_client, client_type=p)) for p in _provider_order()],
+        "vanilla embedding client",
+        "No valid LLM embedding provider could be initialized. "
+        "Please configure OPENAI_API_KEY and OPENAI_EMBEDDING_MODEL or Azure OpenAI settings. "
+        "You can also set APP_LLM_PROVIDER to 'openai' or 'azure_openai'."
+    )
 
-        logger.info(f"Creating vanilla embedding client with provider: {provider}")
 
-        if provider == "openai":
-            return create_default_embedding_client(client_type="openai")
-        elif provider == "azure_openai":
-            return create_default_embedding_client(client_type="azure_openai")
-        else:
-            logger.warning(f"Unknown LLM provider '{provider}', trying OpenAI first")
 
-    except Exception as e:
-        logger.warning(f"Failed to get app settings or create client with configured provider: {e}")
+def create_batched_embedding_client(batch_size: int = 256, flush_interval_ms: float = 20.0) -> EmbeddingBatcher:
+    """
+    Create an EmbeddingBatcher around the vanilla embedding client
 
-    # Fallback: Try OpenAI first, then Azure OpenAI
-    try:
-        logger.info("Attempting to create OpenAI embedding client as fallback")
-        return create_default_embedding_client(client_type="openai")
-    except Exception as e:
-        logger.warning(f"Failed to create OpenAI embedding client: {e}")
+    Concurrent ``await batcher.submit(text)`` calls are coalesced into one
+    embeddings request of up to ``batch_size`` texts, so callers embedding
+    texts one at a time share HTTP round trips.
 
-    try:
-        logger.info("Attempting to create Azure OpenAI embedding client as fallback")
-        return create_default_embedding_client(client_type="azure_openai")
-    except Exception as e:
-        logger.warning(f"Failed to create Azure OpenAI embedding client: {e}")
+    Args:
+        batch_size: Maximum number of texts per request (default: 256)
+        flush_interval_ms: Maximum time to wait for more texts (default: 20)
 
-    raise ValueError(
-        "No valid LLM embedding provider could be initialized. "
-        "Please configure OPENAI_API_KEY and OPENAI_EMBEDDING_MODEL or Azure OpenAI settings. "
-        "You can also set APP_LLM_PROVIDER to 'openai' or 'azure_openai'."
-    )
+    Returns:
+        EmbeddingBatcher whose ``submit`` returns one native OpenAI Embedding per text
 
+    Raises:
+        ValueError: If no valid LLM embedding provider can be initialized
+
+    Example:
+        >>> batcher = create_batched_embedding_client()
+        >>> embeddings = await asyncio.gather(*(batcher.submit(text) for text in texts))
+    """
+    client = create_vanilla_embedding_client()
+    return EmbeddingBatcher(client.async_create_embeddings, max_batch=batch_size, flush_ms=flush_interval_ms)
 
 if __name__ == "__main__":
     # Example usage
-    import asyncio
-
-    async def test_factory():
-        """Test LLM client factory with various creation methods"""
-        test_messages = [
-            {"role": "user", "content": "Hello, this is a test message."}
-        ]
+    test_messages = [
+        {"role": "user", "content": "Hello, this is a test message."}
+    ]
 
+    def test_factory_sync():
+        """Test LLM client factory with various creation methods (sync calls)"""
         print("=" * 60)
         print("Testing LLM Client Factory")
         print("=" * 60)
@@ -659,15 +1099,8 @@ if __name__ == "__main__":
         print("\n3. Testing vanilla client (auto provider selection)...")
         print("   Set APP_LLM_PROVIDER=openai or APP_LLM_PROVIDER=azure_openai")
         try:
-            vanilla_client = create_vanilla_chat_client()
-
-            # Test sync
-            vanilla_response = vanilla_client.chat(test_messages)
+            vanilla_response = create_vanilla_chat_client().chat(test_messages)
             print(f"✓ Vanilla client (sync): {vanilla_response[:100]}...")
-
-            # Test async on same client
-            async_vanilla_response = await vanilla_client.async_chat_completion(test_messages)
-            print(f"✓ Vanilla client (async): {async_vanilla_response.choices[0].message.content[:100]}...")
         except Exception as e:
             print(f"✗ Vanilla client failed: {e}")
 
@@ -680,23 +1113,32 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"✗ Embedding client failed: {e}")
 
-        # Test vanilla embedding client (sync + async)
-        print("\n5. Testing vanilla embedding client (sync + async)...")
+        # Test vanilla embedding client
+        print("\n5. Testing vanilla embedding client...")
         try:
-            vanilla_embed_client = create_vanilla_embedding_client()
-
-            # Sync
-            vanilla_embed_response = vanilla_embed_client.create_embeddings("Test text")
+            vanilla_embed_response = create_vanilla_embedding_client().create_embeddings("Test text")
             print(f"✓ Vanilla embeddings (sync): {len(vanilla_embed_response.data)} embeddings")
+        except Exception as e:
+            print(f"✗ Vanilla embedding client failed: {e}")
 
-            # Async on same client
-            async_embed_response = await vanilla_embed_client.async_create_embeddings("Test text async")
+    async def test_factory_async():
+        """Test the async methods of the same (cached) vanilla clients"""
+        print("\n6. Testing vanilla clients (async)...")
+        try:
+            async_vanilla_response = await create_vanilla_chat_client().async_chat_completion(test_messages)
+            print(f"✓ Vanilla client (async): {async_vanilla_response.choices[0].message.content[:100]}...")
+        except Exception as e:
+            print(f"✗ Vanilla client (async) failed: {e}")
+
+        try:
+            async_embed_response = await create_vanilla_embedding_client().async_create_embeddings("Test text async")
             print(f"✓ Vanilla embeddings (async): {len(async_embed_response.data)} embeddings")
         except Exception as e:
-            print(f"✗ Vanilla embedding client failed: {e}")
+            print(f"✗ Vanilla embedding client (async) failed: {e}")
 
-        print("\n" + "=" * 60)
-        print("Testing complete!")
-        print("=" * 60)
+    test_factory_sync()
+    asyncio.run(test_factory_async())
 
-    asyncio.run(test_factory())
+    print("\n" + "=" * 60)
+    print("Testing complete!")
+    print("=" * 60)
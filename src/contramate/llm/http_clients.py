@@ -0,0 +1,264 @@
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, TypeVar
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+
+DEFAULT_POOL_SIZE = 100
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """
+    Request timeouts that grow with input size
+
+    Small requests keep a short read timeout so a stalled backend fails fast
+    (and is retried), while large prompts or embedding batches get extra read
+    time proportional to their size, capped at ``max_read``.
+    """
+
+    connect: float = 5.0
+    read: float = 60.0
+    max_read: float = 300.0
+    per_1k_chars: float = 1.0
+
+    @property
+    def default(self) -> httpx.Timeout:
+        """Timeout used for requests that need no extra read time"""
+        return httpx.Timeout(self.read, connect=self.connect)
+
+    def for_input(self, input_chars: int) -> Optional[httpx.Timeout]:
+        """
+        Timeout for a request carrying input_chars characters
+
+        Returns:
+            A larger httpx.Timeout, or None when the default timeout suffices
+        """
+        read = min(self.max_read, self.read + self.per_1k_chars * input_chars / 1000)
+        if read <= self.read:
+            return None
+        return httpx.Timeout(read, connect=self.connect)
+
+
+def _pool_limits(pool_size: int) -> httpx.Limits:
+    """Connection limits keeping up to pool_size connections alive for reuse"""
+    if pool_size < 1:
+        raise ValueError("pool_size must be at least 1")
+    return httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+
+
+def build_http_client(pool_size: int = DEFAULT_POOL_SIZE) -> httpx.Client:
+    """
+    Build a pooled sync httpx client for the OpenAI SDK
+
+    Uses the SDK's default timeout and redirect settings, with a connection
+    pool large enough that concurrent requests reuse keep-alive connections
+    instead of opening (and TLS-handshaking) new ones.
+
+    Args:
+        pool_size: Maximum number of (keep-alive) connections (default: 100)
+
+    Returns:
+        httpx.Client suitable for the ``http_client`` argument of OpenAI/AzureOpenAI
+    """
+    return DefaultHttpxClient(limits=_pool_limits(pool_size))
+
+
+def build_async_http_client(pool_size: int = DEFAULT_POOL_SIZE) -> httpx.AsyncClient:
+    """
+    Build a pooled async httpx client for the OpenAI SDK
+
+    Args:
+        pool_size: Maximum number of (keep-alive) connections (default: 100)
+
+    Returns:
+        httpx.AsyncClient suitable for the ``http_client`` argument of
+        AsyncOpenAI/AsyncAzureOpenAI
+    """
+    return DefaultAsyncHttpxClient(limits=_pool_limits(pool_size))
+
+
+class LoopLocal(Generic[T]):
+    """
+    Value built lazily once per running event loop
+
+    httpx async pools keep their connections bound to the loop that opened
+    them, so an async pool (or an SDK client holding one) must not outlive
+    its loop: each ``asyncio.run`` call gets its own. Values of loops that
+    have been closed are dropped when another loop asks for a value.
+    """
+
+    __slots__ = ("_build", "_values", "_lock")
+
+    def __init__(self, build: Callable[[], T]):
+        self._build = build
+        self._values: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """
+        Value for the running event loop, built on first use
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        value = self._values.get(loop)
+        if value is None:
+            with self._lock:
+                value = self._values.get(loop)
+                if value is None:
+                    for closed in [other for other in self._values if other.is_closed()]:
+                        del self._values[closed]
+                    value = self._values[loop] = self._build()
+        return value
+
+    def pop(self) -> Optional[T]:
+        """Forget the running event loop's value and return it, if any"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._values.pop(loop, None)
+
+    def clear(self) -> None:
+        """Forget the values of every event loop"""
+        with self._lock:
+            self._values.clear()
+
+
+def loop_local_client(
+    build: Callable[[httpx.AsyncClient], T],
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Callable[[], T]:
+    """
+    Getter for an async SDK client built with ``build(http_client)``
+
+    A given http_client belongs to the caller (and its event loop), so one
+    SDK client is built on it. Without one, an SDK client is built per running
+    event loop on that loop's shared pool. Either way clients are built on
+    first use.
+
+    Args:
+        build: Builds an SDK client on an httpx async pool
+        http_client: Caller-owned httpx async pool (optional)
+
+    Returns:
+        Callable returning the SDK client for the current event loop
+    """
+    if http_client is not None:
+        built: List[T] = []
+        lock = threading.Lock()
+
+        def get() -> T:
+            if not built:
+                with lock:
+                    if not built:
+                        built.append(build(http_client))
+            return built[0]
+
+        return get
+    return LoopLocal(lambda: build(shared_async_http_client())).get
+
+
+def _build_shared_async_http_client() -> httpx.AsyncClient:
+    """Shared async pool for one event loop, sized by configure_http_pool"""
+    return build_async_http_client(_shared_pool_size)
+
+
+# Process-wide pools shared by SDK clients that are not given their own;
+# the async pool is per event loop, see LoopLocal
+_shared_pool_size = DEFAULT_POOL_SIZE
+_shared_http_client: Optional[httpx.Client] = None
+_shared_async_http_clients: LoopLocal[httpx.AsyncClient] = LoopLocal(_build_shared_async_http_client)
+_shared_async_in_use = False
+_shared_lock = threading.Lock()
+
+
+def configure_http_pool(pool_size: int = DEFAULT_POOL_SIZE) -> None:
+    """
+    Set the size of the shared connection pools
+
+    Must be called before the first shared pool is used; pools already handed
+    out to SDK clients cannot be resized.
+
+    Args:
+        pool_size: Maximum number of (keep-alive) connections per pool (default: 100)
+
+    Raises:
+        RuntimeError: If a shared pool has already been created
+    """
+    global _shared_pool_size
+    _pool_limits(pool_size)
+    with _shared_lock:
+        if _shared_http_client is not None or _shared_async_in_use:
+            raise RuntimeError("Shared HTTP pools are already in use; configure them at startup")
+        _shared_pool_size = pool_size
+
+
+def shared_http_client() -> httpx.Client:
+    """Process-wide pooled sync httpx client, created on first use and closed at exit"""
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_lock:
+            if _shared_http_client is None:
+                _shared_http_client = build_http_client(_shared_pool_size)
+                atexit.register(_shared_http_client.close)
+    return _shared_http_client
+
+
+def shared_async_http_client() -> httpx.AsyncClient:
+    """
+    Pooled async httpx client of the running event loop, created on first use
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    global _shared_async_in_use
+    _shared_async_in_use = True
+    return _shared_async_http_clients.get()
+
+
+def close_shared_http_clients() -> None:
+    """
+    Close the shared sync pool and forget the shared async pools
+
+    Async pools can only be closed from a coroutine on their own loop; use
+    aclose_shared_http_clients there.
+    """
+    global _shared_http_client
+    with _shared_lock:
+        http_client, _shared_http_client = _shared_http_client, None
+    _shared_async_http_clients.clear()
+    if http_client is not None:
+        http_client.close()
+
+
+async def aclose_shared_http_clients() -> None:
+    """Close the shared sync pool and the running event loop's async pool"""
+    global _shared_http_client
+    with _shared_lock:
+        http_client, _shared_http_client = _shared_http_client, None
+    async_http_client = _shared_async_http_clients.pop()
+    if http_client is not None:
+        http_client.close()
+    if async_http_client is not None:
+        await async_http_client.aclose()
+
+
+def _reset_after_fork() -> None:
+    """Forget pools inherited from the parent; their sockets are shared with it"""
+    global _shared_http_client, _shared_async_http_clients, _shared_lock
+    _shared_http_client = None
+    _shared_async_http_clients = LoopLocal(_build_shared_async_http_client)
+    _shared_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
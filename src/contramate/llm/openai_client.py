@@ -1,11 +1,15 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional
+import httpx
 from loguru import logger
+from tenacity import AsyncRetrying
 from openai import OpenAI, AsyncOpenAI
-from openai import OpenAIError
 
+from contramate.utils.cache import TTLCache
 from contramate.utils.settings.core import OpenAISettings
 from contramate.utils.settings.factory import settings_factory
-from contramate.llm.base import BaseChatClient, ChatMessage
+from contramate.llm.base import BaseChatClient, MessageInput
+from contramate.llm.http_clients import loop_local_client, shared_http_client
+from contramate.llm.retry import log_api_errors
 
 
 class OpenAIChatClient(BaseChatClient):
@@ -15,7 +19,11 @@ class OpenAIChatClient(BaseChatClient):
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        openai_settings: Optional[OpenAISettings] = None
+        openai_settings: Optional[OpenAISettings] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 3,
+        max_retry_delay: float = 30.0
     ):
         """
         Initialize OpenAI client
@@ -24,6 +32,14 @@ class OpenAIChatClient(BaseChatClient):
             api_key: OpenAI API key (uses settings if not provided)
             model: Default model to use (uses settings if not provided)
             openai_settings: OpenAI settings object (creates from factory if not provided)
+            http_client: Shared httpx client for sync calls (uses the process-wide
+                pool if not provided)
+            async_http_client: Shared httpx async client for async calls (uses the
+                running event loop's shared pool if not provided, so connections are
+                reused across client instances)
+            max_retries: Retries for rate limits, connection errors and 5xx responses (default: 3)
+            max_retry_delay: Maximum seconds to wait between retries, also capping
+                server-provided Retry-After values (default: 30)
         """
         # Get settings from factory if not provided
         settings = openai_settings or settings_factory.create_openai_settings()
@@ -40,20 +56,46 @@ class OpenAIChatClient(BaseChatClient):
         if not self.default_model:
             raise ValueError("OpenAI model is required. Set OPENAI_MODEL in environment or pass model parameter.")
 
+        # The model list rarely changes; avoid a models.list() round trip per call
+        self._models_cache = TTLCache(maxsize=1, ttl=3600.0)
+
+        # Request parameters used when a call does not override them
+        self._default_kwargs = {
+            "model": self.default_model,
+            "temperature": self.default_temperature,
+            "max_completion_tokens": self.default_max_tokens,
+        }
+
         # Initialize sync and async clients
-        client_config = {"api_key": self.api_key}
+        # Retries are handled by _call_with_retry so Retry-After can be capped
+        client_config = {"api_key": self.api_key, "max_retries": 0}
+        self._configure_retries(max_retries, max_retry_delay)
 
         try:
-            self._sync_client = OpenAI(**client_config)
-            self._async_client = AsyncOpenAI(**client_config)
+            self._sync_client = OpenAI(
+                **client_config, http_client=http_client or shared_http_client()
+            )
+            # Async pools are bound to an event loop; see loop_local_client
+            self._async_clients = loop_local_client(
+                lambda pool: AsyncOpenAI(**client_config, http_client=pool), async_http_client
+            )
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI clients: {e}")
+            logger.error("Failed to initialize OpenAI clients: {}", e)
             raise
 
+    @property
+    def _async_client(self) -> AsyncOpenAI:
+        """Async SDK client for the running event loop"""
+        return self._async_clients()
+
     def _get_model(self, model: Optional[str] = None) -> str:
         """Get model name, using default if not specified"""
         return model or self.default_model
 
+    def _batch_client(self) -> AsyncOpenAI:
+        """Async SDK client used for Batch API jobs"""
+        return self._async_client
+
     def _get_temperature(self, temperature: Optional[float] = None) -> float:
         """Get temperature, using default if not specified"""
         return temperature if temperature is not None else self.default_temperature
@@ -62,9 +104,63 @@ class OpenAIChatClient(BaseChatClient):
         """Get max tokens, using default if not specified"""
         return max_tokens if max_tokens is not None else self.default_max_tokens
 
+    def _request_kwargs(
+        self,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Merge per-call overrides into the precomputed default request parameters"""
+        params = self._default_kwargs.copy()
+        if model:
+            params["model"] = model
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_completion_tokens"] = max_tokens
+        return params
+
+    def _call_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        operation: str = "OpenAI chat completion",
+        **create_kwargs
+    ):
+        """Send one chat.completions.create request with the sync client"""
+        with log_api_errors(operation):
+            return self._call_with_retry(
+                self._sync_client.chat.completions.create,
+                messages=self._normalize_messages(messages),
+                **self._request_kwargs(model, temperature, max_tokens),
+                **create_kwargs
+            )
+
+    async def _acall_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        operation: str = "OpenAI async chat completion",
+        retrying: Optional[AsyncRetrying] = None,
+        **create_kwargs
+    ):
+        """Send one chat.completions.create request with the async client (under ``retrying`` if given)"""
+        with log_api_errors(operation):
+            return await self._acall_with_retry(
+                self._async_client.chat.completions.create,
+                retrying=retrying,
+                messages=self._normalize_messages(messages),
+                **self._request_kwargs(model, temperature, max_tokens),
+                **create_kwargs
+            )
+
     def chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -83,29 +179,11 @@ class OpenAIChatClient(BaseChatClient):
         Returns:
             Native OpenAI ChatCompletion object
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = self._sync_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_completion_tokens=self._get_max_tokens(max_tokens),
-                **kwargs
-            )
-
-            return response
-
-        except OpenAIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in OpenAI chat completion: {e}")
-            raise
+        return self._call_chat(messages, model, temperature, max_tokens, **kwargs)
 
     async def async_chat_completion(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -124,47 +202,111 @@ class OpenAIChatClient(BaseChatClient):
         Returns:
             Native OpenAI ChatCompletion object
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = await self._async_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_completion_tokens=self._get_max_tokens(max_tokens),
-                **kwargs
-            )
+        return await self._acall_chat(messages, model, temperature, max_tokens, **kwargs)
 
-            return response
+    def stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion as text deltas using the sync client
 
-        except OpenAIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in OpenAI async chat completion: {e}")
-            raise
+        Closing the generator early closes the HTTP response.
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for OpenAI API
+
+        Yields:
+            str: Content deltas in generation order
+        """
+        stream = self._call_chat(
+            messages, model, temperature, max_tokens,
+            operation="OpenAI streaming chat", stream=True, **kwargs
+        )
+
+        with stream, log_api_errors("OpenAI streaming chat"):
+            for chunk in stream:
+                choices = chunk.choices
+                if choices:
+                    delta = choices[0].delta.content
+                    if delta:
+                        yield delta
+
+    async def async_stream_chat_completion(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as it is generated
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters for OpenAI API
+
+        Yields:
+            str: Content deltas in generation order
+        """
+        stream = await self._acall_chat(
+            messages, model, temperature, max_tokens,
+            operation="OpenAI streaming chat", stream=True, **kwargs
+        )
+
+        # Closing the stream releases the connection if the consumer stops early
+        async with stream:
+            with log_api_errors("OpenAI streaming chat"):
+                async for chunk in stream:
+                    choices = chunk.choices
+                    if choices:
+                        delta = choices[0].delta.content
+                        if delta:
+                            yield delta
 
     def get_available_models(self) -> List[str]:
-        """Get list of available models"""
+        """Get list of available models (cached for an hour; failures are not cached)"""
+        cached = self._models_cache.get("models")
+        if cached is not None:
+            return list(cached)
         try:
             models = self._sync_client.models.list()
-            return [model.id for model in models.data]
         except Exception as e:
-            logger.error(f"Error fetching available models: {e}")
+            logger.error("Error fetching available models: {}", e)
             return []
+        model_ids = tuple(model.id for model in models.data)
+        self._models_cache.set("models", model_ids)
+        return list(model_ids)
 
     async def async_get_available_models(self) -> List[str]:
-        """Get list of available models (async)"""
+        """Get list of available models (async, sharing the cache of get_available_models)"""
+        cached = self._models_cache.get("models")
+        if cached is not None:
+            return list(cached)
         try:
             models = await self._async_client.models.list()
-            return [model.id for model in models.data]
         except Exception as e:
-            logger.error(f"Error fetching available models: {e}")
+            logger.error("Error fetching available models: {}", e)
             return []
+        model_ids = tuple(model.id for model in models.data)
+        self._models_cache.set("models", model_ids)
+        return list(model_ids)
 
     def chat(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -198,9 +340,45 @@ class OpenAIChatClient(BaseChatClient):
         )
         return response.choices[0].message.content
 
+    async def async_chat(
+        self,
+        messages: List[MessageInput],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> str:
+        """
+        Async counterpart of chat() for callers running on an event loop,
+        where the blocking chat() would stall every other task
+
+        Args:
+            messages: List of chat messages
+            model: Model to use (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            config: Additional configuration (e.g., response_format)
+            **kwargs: Additional parameters for OpenAI API
+
+        Returns:
+            str: Response content
+        """
+        if config:
+            kwargs.update(config)
+
+        response = await self.async_chat_completion(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        return response.choices[0].message.content
+
     def select_tool(
         self,
-        messages: List[Union[ChatMessage, Dict[str, str]]],
+        messages: List[MessageInput],
         tools: List[Dict[str, Any]],
         model: Optional[str] = None,
         temperature: Optional[float] = None,
@@ -219,65 +397,15 @@ class OpenAIChatClient(BaseChatClient):
             **kwargs: Additional parameters for OpenAI API
 
         Returns:
-            List[Any]: Tool calls from the response
+            List[Any]: Tool calls from all returned choices, in choice order
         """
-        try:
-            normalized_messages = self._normalize_messages(messages)
-
-            response = self._sync_client.chat.completions.create(
-                model=self._get_model(model),
-                messages=normalized_messages,
-                temperature=self._get_temperature(temperature),
-                max_completion_tokens=self._get_max_tokens(max_tokens),
-                tools=tools,
-                tool_choice="auto",
-                **kwargs
-            )
-
-            return response.choices[0].message.tool_calls or []
-
-        except OpenAIError as e:
-            logger.error(f"OpenAI API error in tool selection: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in OpenAI tool selection: {e}")
-            raise
-
-
-if __name__ == "__main__":
-    import asyncio
-
-    async def test_client():
-        """Test OpenAI chat client with native response objects"""
-        client = OpenAIChatClient()
+        response = self._call_chat(
+            messages, model, temperature, max_tokens,
+            operation="OpenAI tool selection", tools=tools, tool_choice="auto", **kwargs
+        )
 
-        test_messages = [
-            {"role": "user", "content": "Hello, this is a test message."}
+        return [
+            tool_call
+            for choice in response.choices
+            for tool_call in (choice.message.tool_calls or [])
         ]
-
-        print("=" * 60)
-        print("Testing OpenAI Chat Client")
-        print("=" * 60)
-
-        # Test sync
-        print("\n1. Testing sync completion...")
-        response = client.chat_completion(test_messages)
-        print(f"✓ Sync response: {response.choices[0].message.content[:100]}...")
-        print(f"  Model: {response.model}")
-        print(f"  Usage: {response.usage.total_tokens} tokens")
-
-        # Test async
-        print("\n2. Testing async completion...")
-        async_response = await client.async_chat_completion(test_messages)
-        print(f"✓ Async response: {async_response.choices[0].message.content[:100]}...")
-
-        # Test backward compatible chat method
-        print("\n3. Testing backward compatible chat() method...")
-        chat_response = client.chat(test_messages)
-        print(f"✓ Chat response: {chat_response[:100]}...")
-
-        print("\n" + "=" * 60)
-        print("Testing complete!")
-        print("=" * 60)
-
-    asyncio.run(test_client())
\ No newline at end of file
@@ -1,4 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
+import httpx
 from loguru import logger
 from openai import OpenAI, AsyncOpenAI
 from openai import OpenAIError
@@ -6,6 +9,8 @@ from openai import OpenAIError
 from contramate.utils.settings.core import OpenAISettings
 from contramate.utils.settings.factory import settings_factory
 from contramate.llm.base import BaseEmbeddingClient
+from contramate.llm.embedding_batcher import EmbeddingBatcher
+from contramate.llm.http_clients import loop_local_client, shared_http_client
 
 
 class OpenAIEmbeddingClient(BaseEmbeddingClient):
@@ -15,7 +20,15 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
         self,
         api_key: Optional[str] = None,
         embedding_model: Optional[str] = None,
-        openai_settings: Optional[OpenAISettings] = None
+        openai_settings: Optional[OpenAISettings] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[Any] = None,
+        cache_size: int = 1024,
+        max_retries: int = 3,
+        max_retry_delay: float = 30.0,
+        batch_max_size: int = 64,
+        batch_flush_ms: float = 20.0
     ):
         """
         Initialize OpenAI embedding client
@@ -24,9 +37,23 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
             api_key: OpenAI API key (uses settings if not provided)
             embedding_model: Default embedding model to use (uses settings if not provided)
             openai_settings: OpenAI settings object (creates from factory if not provided)
+            http_client: Shared httpx client for sync calls (uses the process-wide
+                pool if not provided)
+            async_http_client: Shared httpx async client for async calls (uses the
+                running event loop's shared pool if not provided, so connections are
+                reused across client instances)
+            cache: Object with ``get(key)`` / ``set(key, value)`` used to cache
+                vectors (default: in-process LRUCache)
+            cache_size: Entries of the default cache; 0 disables caching (default: 1024)
+            max_retries: Retries for rate limits, connection errors and 5xx responses (default: 3)
+            max_retry_delay: Maximum seconds to wait between retries, also capping
+                server-provided Retry-After values (default: 30)
+            batch_max_size: Maximum texts coalesced into one request by
+                async_create_embedding (default: 64)
+            batch_flush_ms: Maximum wait in milliseconds for more texts to coalesce (default: 20)
         """
         settings = openai_settings or settings_factory.create_openai_settings()
-        super().__init__(api_key=api_key or settings.api_key)
+        super().__init__(api_key=api_key or settings.api_key, cache=cache, cache_size=cache_size)
         self.default_embedding_model = embedding_model or settings.embedding_model
 
         # Validate required configuration
@@ -37,19 +64,68 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
             raise ValueError("OpenAI embedding model is required. Set OPENAI_EMBEDDING_MODEL in environment or pass embedding_model parameter.")
 
         # Initialize sync and async clients
-        client_config = {"api_key": self.api_key}
+        # Retries are handled by _call_with_retry so Retry-After can be capped
+        client_config = {"api_key": self.api_key, "max_retries": 0}
+        self._configure_retries(max_retries, max_retry_delay)
 
         try:
-            self._sync_client = OpenAI(**client_config)
-            self._async_client = AsyncOpenAI(**client_config)
+            self._sync_client = OpenAI(
+                **client_config, http_client=http_client or shared_http_client()
+            )
+            # Async pools are bound to an event loop; see loop_local_client
+            self._async_clients = loop_local_client(
+                lambda pool: AsyncOpenAI(**client_config, http_client=pool), async_http_client
+            )
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI embedding clients: {e}")
+            logger.error("Failed to initialize OpenAI embedding clients: {}", e)
             raise
 
+        self._batcher = EmbeddingBatcher(
+            self.async_create_embeddings,
+            max_batch=batch_max_size,
+            flush_ms=batch_flush_ms
+        )
+
+    @property
+    def _async_client(self) -> AsyncOpenAI:
+        """Async SDK client for the running event loop"""
+        return self._async_clients()
+
     def _get_embedding_model(self, model: Optional[str] = None) -> str:
         """Get embedding model name, using default if not specified"""
         return model or self.default_embedding_model
 
+    def _embed(self, model_name: str, texts: List[str], **kwargs):
+        """Send the embeddings.create request(s) for texts with the sync client"""
+        chunks = self._split_inputs(texts)
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+                return self._concat_responses(list(executor.map(
+                    lambda chunk: self._embed(model_name, chunk, **kwargs), chunks
+                )))
+
+        return self._call_with_retry(
+            self._sync_client.embeddings.create,
+            model=model_name,
+            input=texts,
+            **kwargs
+        )
+
+    async def _aembed(self, model_name: str, texts: List[str], **kwargs):
+        """Send the embeddings.create request(s) for texts with the async client"""
+        chunks = self._split_inputs(texts)
+        if len(chunks) > 1:
+            return self._concat_responses(await asyncio.gather(
+                *(self._aembed(model_name, chunk, **kwargs) for chunk in chunks)
+            ))
+
+        return await self._acall_with_retry(
+            self._async_client.embeddings.create,
+            model=model_name,
+            input=texts,
+            **kwargs
+        )
+
     def create_embeddings(
         self,
         texts: Union[str, List[str]],
@@ -59,6 +135,9 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
         """
         Create embeddings for text input(s)
 
+        Texts already embedded with the same model are served from the cache;
+        only the remaining texts are sent to the API.
+
         Args:
             texts: Text string or list of text strings to embed
             model: Embedding model to use (optional)
@@ -70,20 +149,26 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
         try:
             # Ensure texts is a list
             input_texts = [texts] if isinstance(texts, str) else texts
+            model_name = self._get_embedding_model(model)
 
-            response = self._sync_client.embeddings.create(
-                model=self._get_embedding_model(model),
-                input=input_texts,
-                **kwargs
-            )
+            # Extra parameters (e.g. dimensions) change the vectors, so skip the cache
+            if self._cache is None or kwargs:
+                return self._embed(model_name, input_texts, **kwargs)
+
+            keys, vectors, misses = self._find_uncached_texts(model_name, input_texts)
+            response = None
+            if misses:
+                response = self._embed(
+                    model_name, [input_texts[i] for i in self._unique_misses(keys, misses)]
+                )
 
-            return response
+            return self._merge_cached(model_name, keys, vectors, misses, response)
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API error in embedding creation: {e}")
+            logger.error("OpenAI API error in embedding creation: {}", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in OpenAI embedding creation: {e}")
+            logger.error("Unexpected error in OpenAI embedding creation: {}", e)
             raise
 
     async def async_create_embeddings(
@@ -95,6 +180,9 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
         """
         Create embeddings for text input(s) asynchronously
 
+        Texts already embedded with the same model are served from the cache;
+        only the remaining texts are sent to the API.
+
         Args:
             texts: Text string or list of text strings to embed
             model: Embedding model to use (optional)
@@ -106,61 +194,44 @@ class OpenAIEmbeddingClient(BaseEmbeddingClient):
         try:
             # Ensure texts is a list
             input_texts = [texts] if isinstance(texts, str) else texts
+            model_name = self._get_embedding_model(model)
 
-            response = await self._async_client.embeddings.create(
-                model=self._get_embedding_model(model),
-                input=input_texts,
-                **kwargs
-            )
+            # Extra parameters (e.g. dimensions) change the vectors, so skip the cache
+            if self._cache is None or kwargs:
+                return await self._aembed(model_name, input_texts, **kwargs)
+
+            keys, vectors, misses = self._find_uncached_texts(model_name, input_texts)
+            response = None
+            if misses:
+                response = await self._aembed(
+                    model_name, [input_texts[i] for i in self._unique_misses(keys, misses)]
+                )
 
-            return response
+            return self._merge_cached(model_name, keys, vectors, misses, response)
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API error in async embedding creation: {e}")
+            logger.error("OpenAI API error in async embedding creation: {}", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in OpenAI async embedding creation: {e}")
+            logger.error("Unexpected error in OpenAI async embedding creation: {}", e)
             raise
 
+    async def async_create_embedding(self, text: str, model: Optional[str] = None):
+        """
+        Create an embedding for a single text asynchronously
 
-if __name__ == "__main__":
-    import asyncio
-
-    async def test_embedding_client():
-        """Test OpenAI embedding client with native response objects"""
-        client = OpenAIEmbeddingClient()
-
-        test_texts = [
-            "This is a test sentence for embedding.",
-            "Another test sentence to embed."
-        ]
-
-        print("=" * 60)
-        print("Testing OpenAI Embedding Client")
-        print("=" * 60)
-
-        # Test sync
-        print("\n1. Testing sync embedding creation...")
-        response = client.create_embeddings(test_texts)
-        print(f"✓ Sync embeddings: {len(response.data)} embeddings created")
-        print(f"  Model: {response.model}")
-        print(f"  Dimensions: {len(response.data[0].embedding)}")
-        print(f"  Usage: {response.usage.total_tokens} tokens")
-
-        # Test async
-        print("\n2. Testing async embedding creation...")
-        async_response = await client.async_create_embeddings(test_texts)
-        print(f"✓ Async embeddings: {len(async_response.data)} embeddings created")
-        print(f"  Dimensions: {len(async_response.data[0].embedding)}")
-
-        # Test single string
-        print("\n3. Testing single string embedding...")
-        single_response = client.create_embeddings("Single test sentence.")
-        print(f"✓ Single embedding: {len(single_response.data)} embedding created")
-        print(f"  Dimensions: {len(single_response.data[0].embedding)}")
+        Calls made close together with the default model are coalesced into one
+        batched request (see EmbeddingBatcher).
 
-        print("\n" + "=" * 60)
-        print("Testing complete!")
-        print("=" * 60)
+        Args:
+            text: Text string to embed
+            model: Embedding model to use (optional, bypasses batching when it
+                differs from the default model)
 
-    asyncio.run(test_embedding_client())
\ No newline at end of file
+        Returns:
+            Native OpenAI Embedding object
+        """
+        if model and model != self.default_embedding_model:
+            response = await self.async_create_embeddings([text], model)
+            return response.data[0]
+        return await self._batcher.submit(text)
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async limiter for requests per minute and tokens per minute.
+
+    Both capacities refill continuously at their per-minute rate, up to one
+    minute's worth. ``acquire`` waits until one request and the given number
+    of tokens are available and then consumes them, so bursts are smoothed to
+    the deployment's rate limits instead of being answered with 429s.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """
+        Args:
+            requests_per_minute: Request rate limit
+            tokens_per_minute: Token rate limit
+        """
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError("requests_per_minute and tokens_per_minute must be positive")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = requests_per_minute
+        self._available_tokens = tokens_per_minute
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self._available_requests = min(
+            self.requests_per_minute,
+            self._available_requests + self.requests_per_minute * elapsed / 60
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute,
+            self._available_tokens + self.tokens_per_minute * elapsed / 60
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait for capacity for one request consuming ``tokens`` tokens
+
+        Requests larger than the per-minute token limit are admitted once the
+        bucket is full, so they cannot block forever.
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+                missing_requests = max(0.0, 1 - self._available_requests)
+                missing_tokens = max(0.0, tokens - self._available_tokens)
+                await asyncio.sleep(max(
+                    missing_requests * 60 / self.requests_per_minute,
+                    missing_tokens * 60 / self.tokens_per_minute,
+                ))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Admit nothing for the next ``seconds`` seconds
+
+        Used when the server answers with a 429 so every waiting caller backs
+        off together instead of each discovering the limit on its own. Pauses
+        do not stack; the longest one wins.
+        """
+        self._refill()
+        self._available_requests = min(
+            self._available_requests,
+            -seconds * self.requests_per_minute / 60
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit that adapts to the deployment (AIMD).
+
+    Used as ``async with limiter:`` around a request. Every success raises
+    the limit by ``1 / limit`` (about one slot per round of requests) up to
+    ``max_limit``; a rate-limited request halves it, at most once per
+    ``decrease_interval`` seconds so one burst of 429s counts as one signal.
+    Requests in flight above a lowered limit finish normally; new ones wait
+    until the count drops below it.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_interval: float = 1.0
+    ):
+        """
+        Args:
+            max_limit: Highest number of requests allowed in flight
+            min_limit: Lowest limit a decrease can reach (default: 1)
+            initial_limit: Starting limit (default: max_limit)
+            decrease_interval: Minimum seconds between two decreases (default: 1)
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_interval = decrease_interval
+        self.limit = float(initial_limit if initial_limit is not None else max_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase after a request went through"""
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def record_rate_limit(self) -> None:
+        """Multiplicative decrease after a 429"""
+        now = time.monotonic()
+        if now - self._last_decrease >= self.decrease_interval:
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit / 2)
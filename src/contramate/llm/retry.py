@@ -0,0 +1,144 @@
+import email.utils
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple, Type, Union
+
+from loguru import logger
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAIError,
+    RateLimitError,
+)
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from tenacity.wait import wait_base
+
+
+# Network errors and 5xx responses
+TRANSIENT_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError)
+# Transient failures worth retrying: throttling plus TRANSIENT_ERRORS
+RETRYABLE_ERRORS = (RateLimitError, *TRANSIENT_ERRORS)
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the server-requested retry delay from an API error, if any
+
+    Checks ``retry-after-ms`` first (Azure OpenAI), then ``retry-after`` as
+    either a number of seconds or an HTTP date.
+
+    Args:
+        error: Exception raised by the OpenAI SDK
+
+    Returns:
+        Delay in seconds, or None when the response carries no usable header
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        try:
+            return email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+class wait_retry_after(wait_base):
+    """Tenacity wait honoring Retry-After headers, with a fallback strategy and a cap"""
+
+    def __init__(self, fallback: wait_base, max_delay: float):
+        self.fallback = fallback
+        self.max_delay = max_delay
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        delay = retry_after_seconds(error) if error is not None else None
+        if delay is None:
+            delay = self.fallback(retry_state)
+        # Never trust an unbounded server value (Azure has sent day-long Retry-After)
+        return max(0.0, min(delay, self.max_delay))
+
+
+def _log_before_sleep(retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception()
+    logger.warning(
+        "Retrying API call in {:.1f}s (attempt {}) after {}: {}",
+        retry_state.next_action.sleep,
+        retry_state.attempt_number,
+        type(error).__name__,
+        error,
+    )
+
+
+def build_retrying(
+    max_retries: int = 3,
+    max_retry_delay: float = 30.0,
+    async_mode: bool = False,
+    retry_on: Tuple[Type[BaseException], ...] = RETRYABLE_ERRORS
+) -> Union[Retrying, AsyncRetrying]:
+    """
+    Build the retry controller used around OpenAI / Azure OpenAI API calls
+
+    Retries ``retry_on`` errors with jittered exponential backoff, waiting for
+    the server-provided Retry-After delay when present, never longer than
+    ``max_retry_delay`` between attempts.
+
+    Args:
+        max_retries: Retries after the first attempt (default: 3)
+        max_retry_delay: Maximum seconds to wait between attempts (default: 30)
+        async_mode: Return an AsyncRetrying for coroutine functions
+        retry_on: Exception types to retry (default: RETRYABLE_ERRORS); callers
+            that handle rate limits themselves pass TRANSIENT_ERRORS
+
+    Returns:
+        Retrying / AsyncRetrying instance; call ``.copy()(fn, *args, **kwargs)``
+    """
+    retrying_cls = AsyncRetrying if async_mode else Retrying
+    return retrying_cls(
+        stop=stop_after_attempt(max_retries + 1),
+        wait=wait_retry_after(wait_exponential_jitter(initial=1, max=max_retry_delay), max_retry_delay),
+        retry=retry_if_exception_type(retry_on),
+        before_sleep=_log_before_sleep,
+        reraise=True,
+    )
+
+
+@contextmanager
+def log_api_errors(operation: str) -> Iterator[None]:
+    """
+    Log OpenAI SDK errors raised inside the block and re-raise them unchanged
+
+    Other exceptions propagate without logging so programming errors surface
+    with their original traceback instead of being reported as API failures.
+
+    Args:
+        operation: Short description used in the log line (e.g. "Azure OpenAI chat completion")
+    """
+    try:
+        yield
+    except OpenAIError as e:
+        logger.error("{} failed: {}", operation, e)
+        raise
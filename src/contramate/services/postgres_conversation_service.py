@@ -6,10 +6,21 @@ from loguru import logger
 from neopipe import Ok, Err, Result
 
 from contramate.dbs.adapters.postgres_conversation_adapter import PostgreSQLConversationAdapter
+from contramate.dbs.models import FeedbackType
 from contramate.dbs.postgres_db import init_db
+from contramate.utils.cache import TTLCache
 from contramate.utils.settings.core import PostgresSettings
 
 
+# Shared across service instances (one is built per request). Chat UIs poll the
+# same conversation repeatedly, so a short TTL absorbs most reads while writes
+# below invalidate the affected conversation explicitly.
+_conversation_cache = TTLCache(maxsize=1024, ttl=2.0)
+
+# Plain dict lookup instead of FeedbackType(value), which raises on invalid input
+_FEEDBACK_TYPES = {member.value: member for member in FeedbackType}
+
+
 class PostgresConversationService:
     """High-level service for conversation management using PostgreSQL with Result-based error handling"""
 
@@ -24,6 +35,11 @@ class PostgresConversationService:
         adapter = PostgreSQLConversationAdapter(db.session_factory)
         return PostgresConversationService(adapter)
 
+    @staticmethod
+    def _invalidate_conversation(user_id: str, conversation_id: str) -> None:
+        """Drop cached reads for a conversation after it has been modified"""
+        _conversation_cache.invalidate(lambda key: key[1:3] == (user_id, conversation_id))
+
     def _normalize_conversation(self, conversation: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize PostgreSQL conversation to API response format"""
         return {
@@ -118,7 +134,12 @@ class PostgresConversationService:
         """Get a specific conversation by ID"""
         try:
             logger.info(f"Fetching conversation: {conversation_id}")
-            
+
+            cache_key = ("conversation", user_id, conversation_id)
+            cached = _conversation_cache.get(cache_key)
+            if cached is not None:
+                return Ok(dict(cached))
+
             conversation = self.adapter.get_conversation_by_id(user_id, conversation_id)
             
             if not conversation:
@@ -130,6 +151,7 @@ class PostgresConversationService:
                 })
             
             normalized = self._normalize_conversation(conversation)
+            _conversation_cache.set(cache_key, normalized)
             logger.debug(f"Retrieved conversation: {conversation_id}")
             return Ok(normalized)
             
@@ -156,6 +178,7 @@ class PostgresConversationService:
                 conversation_id=conversation_id,
                 filter_values=filter_values
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             if not success:
                 error_msg = f"Failed to update filters for conversation {conversation_id}"
@@ -180,15 +203,24 @@ class PostgresConversationService:
         self,
         user_id: str,
         conversation_id: str,
-        limit: int = 50
+        limit: int = 50,
+        newest_first: bool = False
     ) -> Result[List[Dict[str, Any]], Dict[str, Any]]:
         """Get messages for a conversation"""
         try:
             logger.info(f"Fetching messages for conversation: {conversation_id}")
-            
-            messages = self.adapter.get_messages(user_id, conversation_id, limit=limit)
+
+            cache_key = ("messages", user_id, conversation_id, limit, newest_first)
+            cached = _conversation_cache.get(cache_key)
+            if cached is not None:
+                return Ok(list(cached))
+
+            messages = self.adapter.get_messages(
+                user_id, conversation_id, limit=limit, newest_first=newest_first
+            )
             normalized = [self._normalize_message(msg) for msg in messages]
-            
+            _conversation_cache.set(cache_key, normalized)
+
             logger.debug(f"Retrieved {len(normalized)} messages for conversation {conversation_id}")
             return Ok(normalized)
             
@@ -220,6 +252,7 @@ class PostgresConversationService:
                 filter_value=context_filters,
                 metadata=metadata
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             normalized = self._normalize_message(message)
             logger.debug(f"Successfully added user message: {normalized['message_id']}")
@@ -253,6 +286,7 @@ class PostgresConversationService:
                 filter_value=context_used,
                 metadata=metadata
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             normalized = self._normalize_message(message)
             logger.debug(f"Successfully added assistant message: {normalized['message_id']}")
@@ -276,6 +310,7 @@ class PostgresConversationService:
             logger.info(f"Deleting conversation: {conversation_id}")
             
             self.adapter.delete_conversation(user_id, conversation_id)
+            self._invalidate_conversation(user_id, conversation_id)
             
             logger.debug(f"Successfully deleted conversation {conversation_id}")
             return Ok(True)
@@ -298,17 +333,23 @@ class PostgresConversationService:
         """Update message feedback"""
         try:
             logger.info(f"Updating feedback for message: {message_id}")
-            
-            from contramate.dbs.models import FeedbackType
-            
-            feedback_enum = FeedbackType(feedback) if feedback else FeedbackType.NEUTRAL
-            
+
+            feedback_enum = _FEEDBACK_TYPES.get(feedback)
+            if feedback_enum is None:
+                error_msg = f"Invalid feedback value: {feedback!r}. Must be one of {list(_FEEDBACK_TYPES)}"
+                logger.warning(error_msg)
+                return Err({
+                    "error": "invalid_feedback",
+                    "message": error_msg
+                })
+
             message = self.adapter.update_message_feedback(
                 message_id=message_id,
                 conversation_id=conversation_id,
                 user_id=user_id,
                 feedback=feedback_enum
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             if not message:
                 error_msg = f"Message {message_id} not found"
@@ -345,6 +386,7 @@ class PostgresConversationService:
                 conversation_id=conversation_id,
                 title=title
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             if not success:
                 error_msg = f"Failed to rename conversation {conversation_id}"
@@ -379,6 +421,7 @@ class PostgresConversationService:
                 conversation_id=conversation_id,
                 is_active=False
             )
+            self._invalidate_conversation(user_id, conversation_id)
             
             logger.debug(f"Successfully archived conversation {conversation_id}")
             return Ok(None)
@@ -1,9 +1,12 @@
 """Utils package for utility functions"""
 
+from contramate.utils.cache import LRUCache, TTLCache
 from contramate.utils.file_utils import read_markdown, read_markdown_safe
 from contramate.utils.message_converter import convert_openai_to_pydantic_messages
 
 __all__ = [
+    "LRUCache",
+    "TTLCache",
     "read_markdown",
     "read_markdown_safe",
     "convert_openai_to_pydantic_messages",
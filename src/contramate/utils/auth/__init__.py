@@ -1,7 +1,17 @@
 """Authentication utilities for Azure services"""
 
-from .certificate_provider import get_cert_token_provider
+from .certificate_provider import (
+    CachedCallableTokenProvider,
+    CachedTokenProvider,
+    cache_token_provider,
+    close_cert_token_providers,
+    get_cert_token_provider,
+)
 
 __all__ = [
+    "CachedCallableTokenProvider",
+    "CachedTokenProvider",
+    "cache_token_provider",
+    "close_cert_token_providers",
     "get_cert_token_provider",
 ]
\ No newline at end of file
@@ -1,20 +1,168 @@
-from typing import Callable
+import base64
+import binascii
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from azure.core.credentials import AccessToken, TokenCredential
 from azure.identity import CertificateCredential
+from loguru import logger
 from contramate.utils.settings.core import AOAICertSettings
 
 
+class CachedTokenProvider:
+    """Bearer token provider that reuses a token until shortly before it expires.
+
+    The OpenAI SDK invokes ``azure_ad_token_provider`` on every request; without
+    caching each call signs a new client assertion and round-trips to Azure AD.
+    This wrapper returns the cached token while it is valid for more than
+    ``refresh_margin`` seconds and refreshes it under a lock otherwise.
+
+    ``start_refresh_ahead`` additionally renews the token from a background
+    thread before callers would have to, so requests never wait on Azure AD.
+    """
+
+    def __init__(
+        self,
+        credential: Optional[TokenCredential],
+        scope: Optional[str],
+        refresh_margin: int = 300
+    ):
+        """
+        Args:
+            credential: Azure credential used to acquire tokens
+            scope: Token scope / resource requested from the credential
+            refresh_margin: Seconds before expiry at which the token is refreshed
+        """
+        self.credential = credential
+        self.scope = scope
+        self.refresh_margin = refresh_margin
+        self._token: Optional[AccessToken] = None
+        self._lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _is_fresh(self) -> bool:
+        return self._token is not None and time.time() < self._token.expires_on - self.refresh_margin
+
+    def _acquire(self) -> AccessToken:
+        return self.credential.get_token(self.scope)
+
+    def __call__(self) -> str:
+        if self._is_fresh():
+            return self._token.token
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not self._is_fresh():
+                self._token = self._acquire()
+            return self._token.token
+
+    def start_refresh_ahead(self, lead_time: int = 60, retry_interval: int = 30) -> None:
+        """Renew the token in a daemon thread ``lead_time`` seconds before callers would.
+
+        Calling it again while the refresher is running has no effect.
+
+        Args:
+            lead_time: Seconds before the ``refresh_margin`` deadline at which to renew
+            retry_interval: Seconds to wait before retrying a failed renewal
+        """
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop = threading.Event()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop,
+                args=(self._stop, lead_time, retry_interval),
+                name="token-refresh-ahead",
+                daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self, stop: threading.Event, lead_time: int, retry_interval: int) -> None:
+        delay = 0.0
+        while not stop.wait(delay):
+            try:
+                token = self._acquire()
+            except Exception as e:
+                logger.warning("Background token refresh failed, retrying in {}s: {}", retry_interval, e)
+                delay = retry_interval
+                continue
+            # Readers see either the old or the new token, both still valid
+            self._token = token
+            delay = max(token.expires_on - self.refresh_margin - lead_time - time.time(), retry_interval)
+
+    def close(self) -> None:
+        """Stop the background refresher, if one was started"""
+        if self._refresher is not None:
+            self._stop.set()
+            self._refresher = None
+
+
+class CachedCallableTokenProvider(CachedTokenProvider):
+    """Caching wrapper for a plain ``() -> str`` bearer token provider.
+
+    The expiry is read from the token's JWT ``exp`` claim. Tokens without a
+    readable ``exp`` are never cached, so opaque tokens are fetched per call
+    exactly as before.
+    """
+
+    def __init__(self, provider: Callable[[], str], refresh_margin: int = 300):
+        """
+        Args:
+            provider: Callable returning a bearer token
+            refresh_margin: Seconds before expiry at which the token is refreshed
+        """
+        super().__init__(None, None, refresh_margin)
+        self.provider = provider
+
+    def _acquire(self) -> AccessToken:
+        token = self.provider()
+        return AccessToken(token, _jwt_expiry(token))
+
+
+def _jwt_expiry(token: str) -> int:
+    """``exp`` claim of a JWT as epoch seconds, 0 when it cannot be read"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return int(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return 0
+
+
+def cache_token_provider(provider: Callable[[], str], refresh_margin: int = 300) -> Callable[[], str]:
+    """Wrap a bearer token provider so it is only invoked when its token nears expiry.
+
+    Providers that already cache (``CachedTokenProvider`` instances) are
+    returned unchanged.
+
+    Args:
+        provider: Callable returning a bearer token
+        refresh_margin: Seconds before expiry at which the token is refreshed
+
+    Returns:
+        A callable that returns a bearer token when invoked
+    """
+    if isinstance(provider, CachedTokenProvider):
+        return provider
+    return CachedCallableTokenProvider(provider, refresh_margin)
+
+
 def get_cert_token_provider(settings: AOAICertSettings) -> Callable[[], str]:
     """Returns a callable that provides a bearer token using certificate-based authentication.
 
     This function creates a token provider that can be used directly with AzureOpenAI client.
-    
+    Tokens are cached and only refreshed when they are about to expire.
+
     Example:
         ```python
         from azure.identity import CertificateCredential
         from contramate.utils.auth.certificate_provider import get_cert_token_provider
-        
+
         token_provider = get_cert_token_provider(settings)
-        
+
         # Then use with AzureOpenAI client
         client = AzureOpenAI(
             azure_endpoint="https://your-endpoint.openai.azure.com",
@@ -23,23 +171,76 @@ def get_cert_token_provider(settings: AOAICertSettings) -> Callable[[], str]:
         )
         ```
 
+    Providers are memoized per tenant, client, certificate and resource, so
+    every client built from the same settings shares one credential (the
+    certificate is parsed once) and one cached token. The token is renewed in
+    the background ahead of expiry, so requests do not block on Azure AD; the
+    refresh threads stop when a provider is evicted from the memo or when
+    ``close_cert_token_providers`` runs (called by the LLM factory shutdown).
+
     Args:
         settings: An instance of AOAICertSettings containing the necessary certificate details.
 
     Returns:
         A callable that returns a bearer token when invoked
     """
-    # Create the certificate credential
-    credential = CertificateCredential(
-        tenant_id=settings.tenant_id,
-        client_id=settings.client_id,
-        certificate_data=settings.certificate_string
+    return _cert_token_provider(
+        settings.tenant_id,
+        settings.client_id,
+        settings.certificate_string,
+        settings.resource
     )
-    
-    # Define the token provider function
-    def token_provider() -> str:
-        # Get a fresh token when called
-        token = credential.get_token(settings.resource)
-        return token.token
-    
-    return token_provider
\ No newline at end of file
+
+
+_CERT_PROVIDERS_MAXSIZE = 8
+_cert_providers: "OrderedDict[Tuple[str, str, bytes, str], CachedTokenProvider]" = OrderedDict()
+_cert_providers_lock = threading.Lock()
+
+
+def _cert_token_provider(
+    tenant_id: str,
+    client_id: str,
+    certificate_data: bytes,
+    resource: str
+) -> CachedTokenProvider:
+    """Return the memoized token provider for one identity, building it on first use"""
+    key = (tenant_id, client_id, certificate_data, resource)
+    with _cert_providers_lock:
+        provider = _cert_providers.get(key)
+        if provider is not None:
+            _cert_providers.move_to_end(key)
+            return provider
+
+        credential = CertificateCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            certificate_data=certificate_data
+        )
+        provider = CachedTokenProvider(credential, resource)
+        provider.start_refresh_ahead()
+        _cert_providers[key] = provider
+
+        if len(_cert_providers) > _CERT_PROVIDERS_MAXSIZE:
+            _, evicted = _cert_providers.popitem(last=False)
+            evicted.close()
+        return provider
+
+
+def close_cert_token_providers() -> None:
+    """Stop the refresh threads of all memoized certificate token providers and forget them"""
+    with _cert_providers_lock:
+        providers = list(_cert_providers.values())
+        _cert_providers.clear()
+    for provider in providers:
+        provider.close()
+
+
+def _reset_after_fork() -> None:
+    """Forget providers inherited from the parent; their refresh threads did not survive the fork"""
+    global _cert_providers_lock
+    _cert_providers.clear()
+    _cert_providers_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,129 @@
+"""Small in-process caches for hot read paths."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Intended for short-lived, per-process caching of read-heavy lookups
+    (e.g. conversations polled by the chat UI). Entries are evicted in
+    least-recently-used order once ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 2.0):
+        """
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache and return its value (ignoring expiry)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches predicate.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            stale = [key for key in self._data if predicate(key)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed number of entries.
+
+    Exposes the same ``get`` / ``set`` interface as TTLCache so callers can
+    swap in any object providing those two methods (e.g. a Redis wrapper).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache and return its value."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
@@ -0,0 +1,102 @@
+"""Unit tests for the in-process TTL and LRU caches."""
+
+from types import SimpleNamespace
+
+from contramate.utils import cache
+from contramate.utils.cache import LRUCache, TTLCache
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_entry_expires_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=clock.monotonic))
+    ttl_cache = TTLCache(maxsize=10, ttl=2.0)
+
+    ttl_cache.set("key", "value")
+    clock.now += 1.9
+    assert ttl_cache.get("key") == "value"
+
+    clock.now += 0.1
+    assert ttl_cache.get("key") is None
+    assert "key" not in ttl_cache
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_set_renews_expiry(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=clock.monotonic))
+    ttl_cache = TTLCache(maxsize=10, ttl=2.0)
+
+    ttl_cache.set("key", "old")
+    clock.now += 1.5
+    ttl_cache.set("key", "new")
+    clock.now += 1.5
+    assert ttl_cache.get("key") == "new"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl_cache = TTLCache(maxsize=2, ttl=60.0)
+
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    assert ttl_cache.get("a") == 1  # "b" is now the least recently used
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate_removes_matching_keys():
+    ttl_cache = TTLCache(maxsize=10, ttl=60.0)
+    ttl_cache.set(("messages", "user", "conv-1"), [])
+    ttl_cache.set(("conversation", "user", "conv-1"), {})
+    ttl_cache.set(("conversation", "user", "conv-2"), {})
+
+    removed = ttl_cache.invalidate(lambda key: key[2] == "conv-1")
+
+    assert removed == 2
+    assert len(ttl_cache) == 1
+    assert ("conversation", "user", "conv-2") in ttl_cache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru_cache = LRUCache(maxsize=2)
+
+    lru_cache.set("a", 1)
+    lru_cache.set("b", 2)
+    assert lru_cache.get("a") == 1  # "b" is now the least recently used
+    lru_cache.set("c", 3)
+
+    assert "b" not in lru_cache
+    assert lru_cache.get("a") == 1
+    assert lru_cache.get("c") == 3
+    assert len(lru_cache) == 2
+
+
+def test_lru_cache_overwrite_does_not_evict():
+    lru_cache = LRUCache(maxsize=2)
+
+    lru_cache.set("a", 1)
+    lru_cache.set("b", 2)
+    lru_cache.set("a", 10)
+
+    assert lru_cache.get("a") == 10
+    assert lru_cache.get("b") == 2
+
+
+def test_lru_cache_get_returns_default_for_missing_key():
+    lru_cache = LRUCache(maxsize=2)
+    sentinel = object()
+
+    assert lru_cache.get("missing", sentinel) is sentinel
+    assert lru_cache.pop("missing", sentinel) is sentinel
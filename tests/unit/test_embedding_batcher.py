@@ -0,0 +1,81 @@
+"""Unit tests for coalescing embedding requests into batches."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from contramate.llm.embedding_batcher import EmbeddingBatcher
+
+
+class FakeEmbeddings:
+    """Embedding endpoint stand-in that answers with its data in reverse order"""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    async def __call__(self, texts: List[str]):
+        self.calls.append(list(texts))
+        data = [
+            SimpleNamespace(index=index, embedding=[float(len(text))], text=text)
+            for index, text in enumerate(texts)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def test_results_follow_submission_order():
+    texts = ["a", "bb", "ccc", "dddd"]
+    embed_fn = FakeEmbeddings()
+
+    async def run():
+        batcher = EmbeddingBatcher(embed_fn, max_batch=10, flush_ms=5)
+        try:
+            return await asyncio.gather(*(batcher.submit(text) for text in texts))
+        finally:
+            await batcher.aclose()
+
+    results = asyncio.run(run())
+
+    assert embed_fn.calls == [texts]
+    assert [result.text for result in results] == texts
+
+
+def test_batches_are_split_at_max_batch():
+    texts = [f"text {i}" for i in range(5)]
+    embed_fn = FakeEmbeddings()
+
+    async def run():
+        batcher = EmbeddingBatcher(embed_fn, max_batch=2, flush_ms=5)
+        try:
+            return await asyncio.gather(*(batcher.submit(text) for text in texts))
+        finally:
+            await batcher.aclose()
+
+    results = asyncio.run(run())
+
+    assert [len(call) for call in embed_fn.calls] == [2, 2, 1]
+    assert [result.text for result in results] == texts
+
+
+def test_failed_batch_propagates_to_every_caller():
+    async def failing(texts):
+        raise RuntimeError("endpoint down")
+
+    async def run():
+        batcher = EmbeddingBatcher(failing, max_batch=10, flush_ms=5)
+        try:
+            return await asyncio.gather(
+                batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+            )
+        finally:
+            await batcher.aclose()
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_max_batch_must_be_positive():
+    with pytest.raises(ValueError):
+        EmbeddingBatcher(FakeEmbeddings(), max_batch=0)
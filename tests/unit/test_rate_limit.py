@@ -0,0 +1,154 @@
+"""Unit tests for the token bucket and the adaptive concurrency limiter."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from contramate.llm import rate_limit
+from contramate.llm.rate_limit import AdaptiveConcurrencyLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic and asyncio.sleep"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_admits_up_to_capacity_without_waiting(clock):
+    async def run():
+        bucket = TokenBucket(requests_per_minute=2, tokens_per_minute=1000)
+        await bucket.acquire(100)
+        await bucket.acquire(100)
+
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+def test_token_bucket_waits_for_request_capacity(clock):
+    async def run():
+        bucket = TokenBucket(requests_per_minute=2, tokens_per_minute=1000)
+        for _ in range(3):
+            await bucket.acquire(1)
+
+    asyncio.run(run())
+    # One request refills every 30 seconds at 2 requests per minute
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+
+
+def test_token_bucket_waits_for_token_capacity(clock):
+    async def run():
+        bucket = TokenBucket(requests_per_minute=100, tokens_per_minute=600)
+        await bucket.acquire(600)
+        await bucket.acquire(60)
+
+    asyncio.run(run())
+    # 60 tokens refill in 6 seconds at 600 tokens per minute
+    assert sum(clock.sleeps) == pytest.approx(6.0)
+
+
+def test_token_bucket_admits_oversized_request_when_full(clock):
+    async def run():
+        bucket = TokenBucket(requests_per_minute=10, tokens_per_minute=100)
+        await bucket.acquire(500)
+
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+def test_token_bucket_pause_blocks_until_it_elapses(clock):
+    async def run():
+        bucket = TokenBucket(requests_per_minute=60, tokens_per_minute=1000)
+        bucket.pause(10)
+        await bucket.acquire(1)
+
+    asyncio.run(run())
+    # Ten seconds of pause plus one second to refill a request at 1 per second
+    assert sum(clock.sleeps) == pytest.approx(11.0)
+
+
+def test_token_bucket_rejects_non_positive_limits():
+    with pytest.raises(ValueError):
+        TokenBucket(requests_per_minute=0, tokens_per_minute=100)
+
+
+def test_limiter_halves_on_rate_limit(clock):
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+    limiter.record_rate_limit()
+
+    assert limiter.limit == 4
+
+
+def test_limiter_decreases_at_most_once_per_interval(clock):
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, decrease_interval=1.0)
+
+    limiter.record_rate_limit()
+    limiter.record_rate_limit()
+    assert limiter.limit == 4
+
+    clock.now += 1.0
+    limiter.record_rate_limit()
+    assert limiter.limit == 2
+
+
+def test_limiter_does_not_drop_below_min_limit(clock):
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=3)
+
+    limiter.record_rate_limit()
+
+    assert limiter.limit == 3
+
+
+def test_limiter_increases_additively_up_to_max_limit():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=2)
+
+    limiter.record_success()
+    assert limiter.limit == pytest.approx(2.5)
+
+    for _ in range(10):
+        limiter.record_success()
+    assert limiter.limit == 3
+
+
+def test_limiter_caps_requests_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def request(limiter):
+        nonlocal in_flight, peak
+        async with limiter:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        await asyncio.gather(*(request(limiter) for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_limiter_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(max_limit=2, min_limit=3)
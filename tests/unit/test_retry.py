@@ -0,0 +1,53 @@
+"""Unit tests for Retry-After header parsing."""
+
+import email.utils
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from contramate.llm.retry import retry_after_seconds
+
+
+def api_error(headers):
+    """Stand-in for an OpenAI SDK error carrying an HTTP response"""
+    return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+
+def test_retry_after_ms_is_converted_to_seconds():
+    assert retry_after_seconds(api_error({"retry-after-ms": "1500"})) == pytest.approx(1.5)
+
+
+def test_retry_after_ms_takes_precedence_over_retry_after():
+    error = api_error({"retry-after-ms": "250", "retry-after": "10"})
+    assert retry_after_seconds(error) == pytest.approx(0.25)
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(api_error({"retry-after": "7"})) == pytest.approx(7.0)
+
+
+def test_invalid_retry_after_ms_falls_back_to_retry_after():
+    error = api_error({"retry-after-ms": "soon", "retry-after": "3"})
+    assert retry_after_seconds(error) == pytest.approx(3.0)
+
+
+def test_retry_after_http_date():
+    header = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+    delay = retry_after_seconds(api_error({"retry-after": header}))
+
+    # HTTP dates have one-second resolution
+    assert 28.0 < delay <= 30.0
+
+
+def test_unparseable_retry_after_returns_none():
+    assert retry_after_seconds(api_error({"retry-after": "not a date"})) is None
+
+
+def test_missing_headers_return_none():
+    assert retry_after_seconds(api_error({})) is None
+
+
+def test_error_without_response_returns_none():
+    assert retry_after_seconds(ValueError("boom")) is None